@@ -2197,5 +2197,299 @@ cdef inline float64_t _median_linear(float64_t* a, int n):
 
     return result
 
+#----------------------------------------------------------------------
+# sort-based aggregations
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_quantile(ndarray[float64_t] out,
+                   ndarray[float64_t] values,
+                   ndarray[int64_t] labels,
+                   double q):
+    '''
+    Compute the quantile q of the non-null values of each group, as
+    Series.quantile does, interpolating linearly between the two nearest
+    values
+    '''
+    cdef:
+        Py_ssize_t i, n, lab, ngroups, lo
+        ndarray[int64_t] order, starts, nobs
+        ndarray[float64_t] sorted_data
+        float64_t val, idx, frac
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+
+    n = len(values)
+    ngroups = len(out)
+    starts = np.zeros(ngroups, dtype=np.int64)
+    nobs = np.zeros(ngroups, dtype=np.int64)
+
+    # sort by group then value, the nulls last within each group
+    order = np.lexsort((values, labels)).astype(np.int64)
+    sorted_data = values.take(order)
+
+    for i in range(n):
+        lab = labels[order[i]]
+        if lab < 0 or sorted_data[i] != sorted_data[i]:
+            continue
+        if nobs[lab] == 0:
+            starts[lab] = i
+        nobs[lab] += 1
+
+    for i in range(ngroups):
+        if nobs[i] == 0:
+            out[i] = nan
+            continue
+
+        idx = q * (nobs[i] - 1)
+        lo = <Py_ssize_t> idx
+        frac = idx - lo
+        val = sorted_data[starts[i] + lo]
+        if frac > 0:
+            val += (sorted_data[starts[i] + lo + 1] - val) * frac
+        out[i] = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nunique(ndarray[int64_t] out,
+                  ndarray[int64_t] values,
+                  ndarray[int64_t] labels):
+    '''
+    Count the distinct non-null values of each group, the values being
+    factorized codes (-1 for null)
+    '''
+    cdef:
+        Py_ssize_t i, k, n, lab, prev_lab = -1
+        int64_t val, prev_val = -1
+        ndarray[int64_t] order
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    n = len(values)
+    order = np.lexsort((values, labels)).astype(np.int64)
+
+    for i in range(n):
+        k = order[i]
+        lab = labels[k]
+        val = values[k]
+        if lab < 0 or val < 0:
+            continue
+
+        if lab != prev_lab or val != prev_val:
+            out[lab] += 1
+            prev_lab = lab
+            prev_val = val
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_mode(ndarray[int64_t] out,
+               ndarray[int64_t] values,
+               ndarray[int64_t] labels):
+    '''
+    Find the most frequent non-null value of each group, the smallest one
+    among ties, the values being factorized codes (-1 for null) ordered like
+    the values; out is -1 for the groups without non-null values
+    '''
+    cdef:
+        Py_ssize_t i, k, n, lab, prev_lab = -1, run = 0
+        int64_t val, prev_val = -1
+        ndarray[int64_t] order, best
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    n = len(values)
+    out.fill(-1)
+    best = np.zeros(len(out), dtype=np.int64)
+
+    # runs of equal values, in increasing order within each group
+    order = np.lexsort((values, labels)).astype(np.int64)
+
+    for i in range(n):
+        k = order[i]
+        lab = labels[k]
+        val = values[k]
+        if lab < 0 or val < 0:
+            continue
+
+        if lab == prev_lab and val == prev_val:
+            run += 1
+        else:
+            run = 1
+            prev_lab = lab
+            prev_val = val
+
+        if run > best[lab]:
+            best[lab] = run
+            out[lab] = val
+
+
+#----------------------------------------------------------------------
+# transforms
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_rank_float64(ndarray[float64_t] out,
+                       ndarray[float64_t] values,
+                       ndarray[int64_t] labels,
+                       Py_ssize_t ngroups,
+                       ties_method='average', ascending=True, pct=False):
+    '''
+    Rank the values within each group, as rank_1d_float64 does with
+    na_option='keep': null values, and the rows outside of any group, get
+    a null rank
+    '''
+    cdef:
+        Py_ssize_t i, j, n, k, lab, prev = -1, dups = 0
+        ndarray[int64_t] order
+        ndarray[float64_t] sorted_data, nobs
+        float64_t val, count = 0, sum_ranks = 0, total_tie_count = 0
+        int tiebreak = tiebreakers[ties_method]
+
+    if not len(values) == len(labels):
+        raise AssertionError("len(index) != len(labels)")
+
+    n = len(values)
+    nobs = np.zeros(ngroups, dtype=np.float64)
+
+    # sort by group then value, nulls last within each group; the sort is
+    # stable so that tied values keep the order of the rows
+    if ascending:
+        sorted_data = values.copy()
+    else:
+        sorted_data = -values
+    order = np.lexsort((sorted_data, labels)).astype(np.int64)
+    sorted_data = sorted_data.take(order)
+
+    for i in range(n):
+        k = order[i]
+        lab = labels[k]
+        val = sorted_data[i]
+        if lab < 0 or val != val:
+            out[k] = nan
+            continue
+
+        if lab != prev:
+            prev = lab
+            count = total_tie_count = 0
+
+        count += 1
+        dups += 1
+        sum_ranks += count
+
+        # the run of tied values ends with the group, or at a null or
+        # different value
+        if (i == n - 1 or labels[order[i + 1]] != lab or
+                not fabs(sorted_data[i + 1] - val) <= FP_ERR):
+            if tiebreak == TIEBREAK_AVERAGE:
+                for j in range(i - dups + 1, i + 1):
+                    out[order[j]] = sum_ranks / dups
+            elif tiebreak == TIEBREAK_MIN:
+                for j in range(i - dups + 1, i + 1):
+                    out[order[j]] = count - dups + 1
+            elif tiebreak == TIEBREAK_MAX:
+                for j in range(i - dups + 1, i + 1):
+                    out[order[j]] = count
+            elif tiebreak == TIEBREAK_FIRST:
+                for j in range(i - dups + 1, i + 1):
+                    out[order[j]] = count - i + j
+            elif tiebreak == TIEBREAK_DENSE:
+                total_tie_count += 1
+                for j in range(i - dups + 1, i + 1):
+                    out[order[j]] = total_tie_count
+            nobs[lab] = count
+            sum_ranks = dups = 0
+
+    if pct:
+        for i in range(n):
+            lab = labels[i]
+            if lab >= 0:
+                out[i] /= nobs[lab]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_shift_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                        int periods):
+    '''
+    Indexer taking, for each row, the row periods rows before it in its
+    group (after it if periods is negative), or -1 where there is none
+    '''
+    cdef:
+        Py_ssize_t i, ii, n, lab, offset, nperiods
+        ndarray[int64_t] result, seen
+        ndarray[int64_t, ndim=2] last
+
+    n = len(labels)
+    result = np.empty(n, dtype=np.int64)
+    nperiods = abs(periods)
+
+    if nperiods == 0:
+        for i in range(n):
+            result[i] = i if labels[i] >= 0 else -1
+        return result
+
+    # the rows last seen in each group, as a ring buffer of nperiods rows
+    last = np.empty((ngroups, nperiods), dtype=np.int64)
+    seen = np.zeros(ngroups, dtype=np.int64)
+
+    for ii in range(n):
+        i = ii if periods > 0 else n - 1 - ii
+        lab = labels[i]
+        if lab < 0:
+            result[i] = -1
+            continue
+
+        offset = seen[lab] % nperiods
+        if seen[lab] >= nperiods:
+            result[i] = last[lab, offset]
+        else:
+            result[i] = -1
+        last[lab, offset] = i
+        seen[lab] += 1
+
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_fillna_indexer(ndarray[int64_t] labels, Py_ssize_t ngroups,
+                         ndarray[uint8_t, cast=True] mask, bint forward=True):
+    '''
+    Indexer taking, for each row, the row itself if it is not masked (null),
+    and otherwise the last (next, if not forward) unmasked row of its
+    group, or -1 where there is none
+    '''
+    cdef:
+        Py_ssize_t i, ii, n, lab
+        ndarray[int64_t] result, last
+
+    if not len(mask) == len(labels):
+        raise AssertionError("len(mask) != len(labels)")
+
+    n = len(labels)
+    result = np.empty(n, dtype=np.int64)
+    last = np.empty(ngroups, dtype=np.int64)
+    last.fill(-1)
+
+    for ii in range(n):
+        i = ii if forward else n - 1 - ii
+        lab = labels[i]
+        if lab < 0:
+            result[i] = -1
+        elif mask[i]:
+            result[i] = last[lab]
+        else:
+            result[i] = last[lab] = i
+
+    return result
+
 include "join.pyx"
 include "generated.pyx"
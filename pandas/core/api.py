@@ -11,7 +11,7 @@ from pandas.core.format import set_eng_float_format
 from pandas.core.index import Index, Int64Index, Float64Index, MultiIndex
 
 from pandas.core.series import Series, TimeSeries
-from pandas.core.frame import DataFrame
+from pandas.core.frame import DataFrame, DataFrameBuilder
 from pandas.core.panel import Panel
 from pandas.core.panel4d import Panel4D
 from pandas.core.groupby import groupby
@@ -1602,6 +1602,26 @@ def _possibly_convert_objects(values, convert_dates=True,
     if not hasattr(values, 'dtype'):
         values = np.array([values], dtype=np.object_)
 
+    # soft conversion of the dates, timedeltas and numbers in one pass
+    if (values.dtype == np.object_ and convert_dates != 'coerce' and
+            convert_timedeltas != 'coerce'):
+        if convert_dates or convert_timedeltas or not convert_numeric:
+            values = lib.maybe_convert_objects(
+                values, convert_datetime=convert_dates,
+                convert_timedelta=convert_timedeltas)
+        if convert_numeric and values.dtype == np.object_:
+            try:
+                new_values = lib.maybe_convert_numeric(
+                    values, set(), coerce_numeric=True)
+
+                # if we are all nans then leave me alone
+                if not isnull(new_values).all():
+                    values = new_values
+
+            except:
+                pass
+        return values
+
     # convert dates
     if convert_dates and values.dtype == np.object_:
 
@@ -1624,7 +1644,7 @@ def _possibly_convert_objects(values, convert_dates=True,
         if convert_timedeltas == 'coerce':
             from pandas.tseries.timedeltas import \
                  _possibly_cast_to_timedelta
-            values = _possibly_cast_to_timedelta(values, coerce=True)
+            new_values = _possibly_cast_to_timedelta(values, coerce=True)
 
             # if we are all nans then leave me alone
             if not isnull(new_values).all():
@@ -296,6 +296,78 @@ with cf.config_prefix('mode'):
                        cb=use_inf_as_null_cb)
 
 
+copy_on_write_doc = """
+: boolean
+    True means that deep copies of DataFrame and Series objects (copy,
+    rename, reindexing to the same axis, ...) share their data with the
+    original, which is only copied once either of them is modified in place.
+    A Series selected from a DataFrame sharing its data this way does not
+    write back to the DataFrame when modified.
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import _use_copy_on_write
+    _use_copy_on_write(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+
+
+consolidation_threshold_doc = """
+: int
+    Number of blocks above which inserting columns into a DataFrame
+    considers consolidating the blocks of the same dtype into one.
+"""
+
+consolidation_growth_doc = """
+: float
+    Once there are more than mode.consolidation_threshold blocks, inserting
+    a column consolidates the blocks when the columns outside of the largest
+    block of each dtype amount to at least this fraction of the columns in
+    those blocks. Larger values consolidate less often, keeping the cost of
+    adding columns one by one linear, at the price of more blocks in between.
+"""
+
+
+def consolidation_cb(key):
+    from pandas.core.internals import _use_consolidation_options
+    _use_consolidation_options(key)
+
+with cf.config_prefix('mode'):
+    cf.register_option('consolidation_threshold', 100,
+                       consolidation_threshold_doc, validator=is_int,
+                       cb=consolidation_cb)
+    cf.register_option('consolidation_growth', 0.1, consolidation_growth_doc,
+                       validator=is_float, cb=consolidation_cb)
+
+groupby_threads_doc = """
+: int
+    Default number of threads running the cython groupby aggregations (sum,
+    mean, var, std, min and max). The blocks of columns are aggregated in
+    parallel, or the rows of a single block split in partitions of at least
+    10000 rows.
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('groupby_threads', 1, groupby_threads_doc,
+                       validator=is_int)
+
+groupby_cache_doc = """
+: boolean
+    Keep the grouper of a DataFrame groupby over columns on the frame, so
+    that grouping again by the same columns reuses the factorized keys, the
+    number of groups and the sort indexers. The groupers (at most 8 per
+    frame) are dropped once the frame is written to or its index changes;
+    writing to the arrays returned by ``values`` is not noticed.
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('groupby_cache', False, groupby_cache_doc,
+                       validator=is_bool)
+
+
 # user warnings
 chained_assignment = """
 : string
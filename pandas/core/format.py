@@ -1361,6 +1361,8 @@ class ExcelFormatter(object):
         representation for np.inf values (which aren't representable in Excel)
         A `'-'` sign will be added in front of -inf.
     """
+    # number of rows of the body that are boxed at a time
+    chunksize = 10000
 
     def __init__(self, df, na_rep='', float_format=None, cols=None,
                  header=True, index=True, index_label=None, merge_cells=False,
@@ -1406,14 +1408,13 @@ class ExcelFormatter(object):
 
         if self.merge_cells:
             # Format multi-index as a merged cells.
-            for lnum in range(len(level_lengths)):
-                name = columns.names[lnum]
-                yield ExcelCell(lnum, coloffset, name, header_style)
-
             for lnum, (spans, levels, labels) in enumerate(zip(level_lengths,
                                                                columns.levels,
                                                                columns.labels)
                                                            ):
+                name = columns.names[lnum]
+                yield ExcelCell(lnum, coloffset, name, header_style)
+
                 values = levels.take(labels)
                 for i in spans:
                     if spans[i] > 1:
@@ -1513,23 +1514,20 @@ class ExcelFormatter(object):
                                     index_label,
                                     header_style)
 
-            # write index_values
-            index_values = self.df.index
-            if isinstance(self.df.index, PeriodIndex):
-                index_values = self.df.index.to_timestamp()
-
             coloffset = 1
-            for idx, idxval in enumerate(index_values):
-                yield ExcelCell(self.rowcounter + idx, 0, idxval, header_style)
 
-        # Get a frame that will account for any duplicates in the column names.
-        col_mapped_frame = self.df.loc[:, self.columns]
+        index_values = self.df.index
+        if isinstance(self.df.index, PeriodIndex):
+            index_values = self.df.index.to_timestamp()
 
-        # Write the body of the frame data series by series.
-        for colidx in range(len(self.columns)):
-            series = col_mapped_frame.iloc[:, colidx]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, colidx + coloffset, val)
+        for start, values in self._iter_body_chunks():
+            for i in range(len(values[0]) if values else 0):
+                rownum = self.rowcounter + start + i
+                if self.index:
+                    yield ExcelCell(rownum, 0, index_values[start + i],
+                                    header_style)
+                for colidx, column in enumerate(values[1:]):
+                    yield ExcelCell(rownum, colidx + coloffset, column[i])
 
     def _format_hierarchical_rows(self):
         has_aliases = isinstance(self.header, (tuple, list, np.ndarray))
@@ -1537,6 +1535,7 @@ class ExcelFormatter(object):
             self.rowcounter += 1
 
         gcolidx = 0
+        level_spans = None
 
         if self.index:
             index_labels = self.df.index.names
@@ -1563,45 +1562,52 @@ class ExcelFormatter(object):
                 # Format hierarchical rows as merged cells.
                 level_strs = self.df.index.format(sparsify=True, adjoin=False,
                                                   names=False)
-                level_lengths = _get_level_lengths(level_strs)
-
-                for spans, levels, labels in zip(level_lengths,
-                                                 self.df.index.levels,
-                                                 self.df.index.labels):
-                    values = levels.take(labels)
-                    for i in spans:
-                        if spans[i] > 1:
-                            yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
+                level_spans = _get_level_lengths(level_strs)
+            gcolidx = self.df.index.nlevels
+
+        for start, values in self._iter_body_chunks():
+            for i in range(len(values[0]) if values else 0):
+                rownum = self.rowcounter + start + i
+                if self.index:
+                    for lnum, indexval in enumerate(values[0][i]):
+                        if level_spans is None:
+                            # Format hierarchical rows with non-merged values.
+                            yield ExcelCell(rownum, lnum, indexval,
+                                            header_style)
+                            continue
+
+                        # Format hierarchical rows as merged cells.
+                        spans = level_spans[lnum]
+                        if start + i not in spans:
+                            continue
+                        elif spans[start + i] > 1:
+                            yield ExcelCell(rownum, lnum, indexval,
                                             header_style,
-                                            self.rowcounter + i + spans[i] - 1,
-                                            gcolidx)
+                                            rownum + spans[start + i] - 1,
+                                            lnum)
                         else:
-                            yield ExcelCell(self.rowcounter + i,
-                                            gcolidx,
-                                            values[i],
+                            yield ExcelCell(rownum, lnum, indexval,
                                             header_style)
-                    gcolidx += 1
-
-            else:
-                # Format hierarchical rows with non-merged values.
-                for indexcolvals in zip(*self.df.index):
-                    for idx, indexcolval in enumerate(indexcolvals):
-                        yield ExcelCell(self.rowcounter + idx,
-                                        gcolidx,
-                                        indexcolval,
-                                        header_style)
-                    gcolidx += 1
+                for colidx, column in enumerate(values[1:]):
+                    yield ExcelCell(rownum, gcolidx + colidx, column[i])
 
+    def _iter_body_chunks(self):
+        """
+        Yield (start, values) for consecutive chunks of rows of the body,
+        where values is a list holding the index values followed by the
+        values of each column, so that cells can be produced row by row
+        without boxing the whole frame at once.
+        """
         # Get a frame that will account for any duplicates in the column names.
         col_mapped_frame = self.df.loc[:, self.columns]
-
-        # Write the body of the frame data series by series.
-        for colidx in range(len(self.columns)):
-            series = col_mapped_frame.iloc[:, colidx]
-            for i, val in enumerate(series):
-                yield ExcelCell(self.rowcounter + i, gcolidx + colidx, val)
+        ncols = len(self.columns)
+
+        for start in range(0, len(self.df), self.chunksize):
+            chunk = col_mapped_frame.iloc[start:start + self.chunksize]
+            values = [list(chunk.index)]
+            values.extend(list(chunk.iloc[:, colidx])
+                          for colidx in range(ncols))
+            yield start, values
 
     def get_formatted_cells(self):
         for cell in itertools.chain(self._format_header(),
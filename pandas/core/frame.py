@@ -14,6 +14,9 @@ from __future__ import division
 
 import collections
 import itertools
+import keyword
+import operator
+import re
 import sys
 import types
 import warnings
@@ -31,7 +34,7 @@ from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import (_maybe_droplevels,
                                   _convert_to_index_sliceable,
                                   _check_bool_indexer, _maybe_convert_indices)
-from pandas.core.internals import (BlockManager,
+from pandas.core.internals import (BlockManager, make_block,
                                    create_block_manager_from_arrays,
                                    create_block_manager_from_blocks)
 from pandas.core.series import Series
@@ -546,6 +549,63 @@ class DataFrame(NDFrame):
         arrays.extend(self.iloc[:, k] for k in range(len(self.columns)))
         return zip(*arrays)
 
+    def iterrecords(self, index=True, columns=None, chunksize=1000):
+        """
+        Iterate over rows of DataFrame as lightweight records, much cheaper
+        to create than the Series yielded by iterrows
+
+        Records are tuples holding the index value (if index=True) and the
+        row values, as python scalars (Timestamps for datetimes). Values can
+        also be read as attributes named after their columns, for the
+        column names that are valid identifiers, the index value as
+        ``Index``.
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the index value as first element of the records
+        columns : sequence, optional
+            Only include these columns, in this order
+        chunksize : int, default 1000
+            Number of rows unboxed from the column arrays at a time
+
+        Returns
+        -------
+        it : generator
+
+        Examples
+        --------
+        >>> df = DataFrame({'x': [1, 2], 'y': [0.5, 1.5]}, index=['a', 'b'])
+        >>> row = next(df.iterrecords())
+        >>> row
+        Record(Index='a', x=1, y=0.5)
+        >>> row.x + row.y
+        1.5
+        """
+        frame = self if columns is None else self.loc[:, list(columns)]
+        chunksize = max(int(chunksize), 1)
+
+        fields = list(frame.columns)
+        if index:
+            fields.insert(0, 'Index')
+        klass = _record_type(fields)
+
+        data = frame._data
+        arrays = [data.iget(i) for i in range(len(frame.columns))]
+        unbox_index = isinstance(frame.index, (MultiIndex, DatetimeIndex,
+                                               PeriodIndex))
+        for start in range(0, len(frame.index), chunksize):
+            stop = start + chunksize
+            chunk = [_unbox_values(values[start:stop]) for values in arrays]
+            if index:
+                if unbox_index:
+                    labels = list(frame.index[start:stop])
+                else:
+                    labels = _unbox_values(frame.index.values[start:stop])
+                chunk.insert(0, labels)
+            for values in zip(*chunk):
+                yield klass(values)
+
     if compat.PY3:  # pragma: no cover
         items = iteritems
 
@@ -1179,7 +1239,8 @@ class DataFrame(NDFrame):
             ``io.excel.xlsx.writer``, ``io.excel.xls.writer``, and
             ``io.excel.xlsm.writer``.
         merge_cells : boolean, default True
-            Write MultiIndex and Hierarchical Rows as merged cells.
+            Write MultiIndex and Hierarchical Rows as merged cells. A
+            streaming ExcelWriter writes them unmerged, with a warning.
         encoding: string, default None
             encoding of the resulting excel file. Only necessary for xlwt,
             other writers support unicode natively.
@@ -1209,6 +1270,15 @@ class DataFrame(NDFrame):
             excel_writer = ExcelWriter(excel_writer, engine=engine)
             need_save = True
 
+        if getattr(excel_writer, 'streaming', False) and merge_cells:
+            # merged ranges span rows that a streaming writer has not reached
+            if ((index and isinstance(self.index, MultiIndex)) or
+                    isinstance(self.columns, MultiIndex)):
+                warnings.warn('a streaming ExcelWriter cannot merge cells, '
+                              'writing the MultiIndex unmerged; pass '
+                              'merge_cells=False to silence this warning')
+            merge_cells = False
+
         formatter = fmt.ExcelFormatter(self,
                                        na_rep=na_rep,
                                        cols=columns,
@@ -1381,7 +1451,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=True, buf=None, max_cols=None):
+    def info(self, verbose=True, buf=None, max_cols=None, memory_usage=True):
         """
         Concise summary of a DataFrame.
 
@@ -1392,6 +1462,10 @@ class DataFrame(NDFrame):
         buf : writable buffer, defaults to sys.stdout
         max_cols : int, default None
             Determines whether full summary or short summary is printed
+        memory_usage : boolean, default True
+            Print the memory used by the columns and the index; a trailing
+            '+' means that the objects referenced by object columns are not
+            counted
         """
         from pandas.core.format import _put_lines
 
@@ -1450,8 +1524,62 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(compat.iteritems(counts))]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+        if memory_usage:
+            plus = '+' if 'object' in counts else ''
+            lines.append('memory usage: %s%s' %
+                         (_sizeof_fmt(self.memory_usage().sum()), plus))
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of each column, in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory usage of the index, as the first entry of the
+            result, labeled 'Index'
+        deep : boolean, default False
+            Also count the memory used by the Python objects referenced by
+            object columns and index levels, e.g. strings
+
+        Returns
+        -------
+        sizes : Series
+            Bytes used by each column (and the index)
+        """
+        result = Series([_values_nbytes(self._data.iget(i), deep)
+                         for i in range(len(self.columns))],
+                        index=self.columns)
+        if index:
+            index_nbytes = _index_nbytes(self.index, deep)
+            result = Series([index_nbytes], index=['Index']).append(result)
+        return result
+
+    def compact(self, integers=False):
+        """
+        Return a copy of the DataFrame whose numeric columns are stored in the
+        smallest dtypes that hold their values exactly: float64 columns in
+        float32 when it represents all of their values, and if integers,
+        integer columns in the smallest (signed if possible) integer dtype
+        spanning their range. Compare ``memory_usage()`` before and after for
+        the bytes saved.
+
+        Parameters
+        ----------
+        integers : boolean, default False
+            Also downcast the integer columns. Arithmetic on them then happens
+            in the smaller dtype and wraps around silently on overflow, e.g.
+            ``DataFrame({'a': [100, 120]}).compact(integers=True)['a'] * 2``
+            is ``[-56, -16]`` in int8
+
+        Returns
+        -------
+        compacted : DataFrame
+        """
+        mgr = self._data.compact(integers=integers)
+        return self._constructor(mgr).__finalize__(self)
+
     def transpose(self):
         """Transpose index and columns"""
         return super(DataFrame, self).transpose(1, 0)
@@ -1538,6 +1666,12 @@ class DataFrame(NDFrame):
             otherwise a new object
         """
         try:
+            # make the column's values private before writing to a cached
+            # view of them (copy-on-write)
+            label = self.columns[col] if takeable is True else col
+            if self._data.unshare(label):
+                self._clear_item_cache()
+
             if takeable is True:
                 series = self._iget_item_cache(col)
                 return series.set_value(index, value, takeable=True)
@@ -1545,6 +1679,7 @@ class DataFrame(NDFrame):
             series = self._get_item_cache(col)
             engine = self.index._engine
             engine.set_value(series.values, index, value)
+            self._clear_grouper_cache()
             return self
         except KeyError:
 
@@ -4402,6 +4537,166 @@ DataFrame._add_numeric_operations()
 _EMPTY_SERIES = Series([])
 
 
+class DataFrameBuilder(object):
+    """
+    Build a DataFrame column by column, writing the columns directly into
+    preallocated storage for each dtype. The storage becomes the blocks of
+    the resulting frame without being copied.
+
+    Parameters
+    ----------
+    index : Index or array-like
+        Index of the frame to build
+    capacity : dict, optional
+        Number of columns to reserve room for, by dtype
+
+    Notes
+    -----
+    Storage that fills up is reallocated with twice the room, so the views
+    returned by ``add_column`` only stay valid while the reserved capacity
+    for their dtype is not exceeded. Unused reserved capacity remains
+    allocated as part of the blocks of the frame.
+
+    Examples
+    --------
+    >>> builder = DataFrameBuilder(index, capacity={'float64': 1000})
+    >>> for i in range(1000):
+    ...     np.cumsum(data[i], out=builder.add_column('c%d' % i))
+    >>> df = builder.finalize()
+    """
+
+    def __init__(self, index, capacity=None):
+        self.index = _ensure_index(index)
+        self.columns = []
+        self._locs = {}
+        self._storage = {}
+        self._counts = {}
+        self._finalized = False
+
+        if capacity is not None:
+            for dtype, ncols in compat.iteritems(capacity):
+                self.reserve(dtype, ncols)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __contains__(self, name):
+        return name in self._locs
+
+    def __getitem__(self, name):
+        dtype, loc = self._locs[name]
+        return self._storage[dtype][loc]
+
+    def __setitem__(self, name, values):
+        self.add_column(name, values)
+
+    def reserve(self, dtype, ncols):
+        """
+        Make sure there is room for ncols more columns of dtype
+
+        Parameters
+        ----------
+        dtype : numpy dtype or string
+        ncols : int
+        """
+        dtype = _builder_dtype(dtype)
+        used = self._counts.get(dtype, 0)
+        storage = self._storage.get(dtype)
+        if storage is not None and len(storage) >= used + ncols:
+            return
+
+        new_storage = np.empty((used + ncols, len(self.index)), dtype=dtype)
+        if storage is not None:
+            new_storage[:used] = storage[:used]
+        self._storage[dtype] = new_storage
+        self._counts[dtype] = used
+
+    def add_column(self, name, values=None, dtype=None):
+        """
+        Add a column to the frame being built
+
+        Parameters
+        ----------
+        name : object
+            Column label, must not be in the builder already
+        values : array-like, optional
+            Values of the column; if not passed the column is left
+            uninitialized, to be filled through the returned view
+        dtype : numpy dtype or string, optional
+            Defaults to the dtype of values, or float64
+
+        Returns
+        -------
+        column : ndarray
+            Writable view of the storage of the column
+        """
+        if self._finalized:
+            raise ValueError('cannot add columns to a finalized builder')
+        if name in self._locs:
+            raise ValueError('cannot insert %s, already exists' % name)
+
+        if values is not None:
+            values = np.asarray(values)
+            if len(values) != len(self.index):
+                raise ValueError('Length of values does not match length of '
+                                 'index')
+            if dtype is None:
+                dtype = values.dtype
+        if dtype is None:
+            dtype = np.float64
+
+        dtype = _builder_dtype(dtype)
+        used = self._counts.get(dtype, 0)
+        storage = self._storage.get(dtype)
+        if storage is None or used == len(storage):
+            self.reserve(dtype, max(used, 1))
+
+        column = self._storage[dtype][used]
+        if values is not None:
+            column[:] = values
+
+        self._counts[dtype] = used + 1
+        self._locs[name] = (dtype, used)
+        self.columns.append(name)
+        return column
+
+    def finalize(self):
+        """
+        Return the built DataFrame, with one block per dtype holding the
+        storage of the builder; no more columns can be added afterwards
+
+        Returns
+        -------
+        frame : DataFrame
+        """
+        self._finalized = True
+        columns = _ensure_index(self.columns)
+
+        blocks = []
+        for dtype, storage in compat.iteritems(self._storage):
+            used = self._counts[dtype]
+            if not used:
+                continue
+            items = [name for name in self.columns
+                     if self._locs[name][0] == dtype]
+            blocks.append(make_block(storage[:used], items, columns))
+
+        mgr = BlockManager(blocks, [columns, self.index])
+        return DataFrame(mgr)
+
+
+def _builder_dtype(dtype):
+    """ the dtype of the block storing columns of dtype """
+    dtype = np.dtype(dtype)
+    if dtype.kind in ('S', 'U'):
+        return np.dtype(np.object_)
+    elif dtype.kind == 'M':
+        return com._NS_DTYPE
+    elif dtype.kind == 'm':
+        return com._TD_DTYPE
+    return dtype
+
+
 def group_agg(values, bounds, f):
     """
     R-style aggregator
@@ -4811,6 +5106,65 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _sizeof_fmt(num):
+    for unit in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return '%3.1f %s' % (num, unit)
+        num /= 1024.0
+    return '%3.1f %s' % (num, 'PB')
+
+
+def _values_nbytes(values, deep=False):
+    """ bytes used by values and, if deep, by the objects they reference """
+    nbytes = values.nbytes
+    if deep and values.dtype == np.object_:
+        nbytes += sum(sys.getsizeof(v) for v in values.ravel())
+    return nbytes
+
+
+def _index_nbytes(index, deep=False):
+    """ bytes used by an index, counting a MultiIndex by levels and labels """
+    if isinstance(index, MultiIndex):
+        return (sum(_values_nbytes(lev.values, deep) for lev in index.levels) +
+                sum(lab.nbytes for lab in index.labels))
+    return _values_nbytes(index.values, deep)
+
+
+def _record_type(fields):
+    """
+    return a tuple subclass, without per instance dict, whose values can also
+    be read as attributes named after the fields that are identifiers
+    """
+    fields = tuple(fields)
+
+    def __repr__(self):
+        return 'Record(%s)' % ', '.join('%s=%r' % (k, v)
+                                        for k, v in zip(self._fields, self))
+
+    def _asdict(self):
+        return OrderedDict(zip(self._fields, self))
+
+    attrs = dict(__slots__=(), _fields=fields, __repr__=__repr__,
+                 _asdict=_asdict)
+    for i, field in enumerate(fields):
+        if (isinstance(field, compat.string_types) and
+                re.match('^[a-zA-Z][a-zA-Z0-9_]*$', field) and
+                not keyword.iskeyword(field) and field not in attrs and
+                not hasattr(tuple, field)):
+            attrs[field] = property(operator.itemgetter(i))
+
+    return type('Record', (tuple,), attrs)
+
+
+def _unbox_values(values):
+    """ values as a list of python scalars, boxing datetimes as Timestamps """
+    if values.dtype == com._NS_DTYPE:
+        return lib.map_infer(values.view('i8'), lib.Timestamp).tolist()
+    elif values.dtype == com._TD_DTYPE:
+        return list(values)
+    return values.tolist()
+
+
 #----------------------------------------------------------------------
 # Add plotting methods to DataFrame
 
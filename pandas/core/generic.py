@@ -79,6 +79,7 @@ class NDFrame(PandasObject):
     copy : boolean, default False
     """
     _internal_names = ['_data', '_cacher', '_item_cache', '_cache',
+                       '_grouper_cache',
                        'is_copy', 'str', '_subtyp', '_index', '_default_kind',
                        '_default_fill_value','__array_struct__','__array_interface__']
     _internal_names_set = set(_internal_names)
@@ -953,6 +954,19 @@ class NDFrame(PandasObject):
         from pandas.io.pickle import to_pickle
         return to_pickle(self, path)
 
+    def to_mmap(self, path):
+        """
+        Write the object to a file whose data can be memory mapped back with
+        read_mmap, e.g. to share it between processes
+
+        Parameters
+        ----------
+        path : string
+            File path
+        """
+        from pandas.io.memmap import to_mmap
+        return to_mmap(self, path)
+
     def save(self, path):  # TODO remove in 0.14
         "Deprecated. Use to_pickle instead"
         import warnings
@@ -1076,6 +1090,7 @@ class NDFrame(PandasObject):
         GH6026
         """
         self._data.set(item, value, check=pd._np_version_under1p8)
+        self._clear_grouper_cache()
 
     @property
     def _is_cached(self):
@@ -1111,6 +1126,21 @@ class NDFrame(PandasObject):
             self._item_cache.pop(i, None)
         else:
             self._item_cache.clear()
+        self._clear_grouper_cache()
+
+    def _clear_grouper_cache(self):
+        """ drop the groupers cached on the frame (mode.groupby_cache), which
+            might no longer be valid once its data was written to """
+        self.__dict__.pop('_grouper_cache', None)
+
+    def _clear_cacher_grouper_cache(self):
+        """ drop the groupers cached on the frame that I am a cached item
+            of, before writing to my values in place """
+        cacher = getattr(self, '_cacher', None)
+        if cacher is not None:
+            ref = cacher[1]()
+            if ref is not None:
+                ref._clear_grouper_cache()
 
     def _slice(self, slobj, axis=0, typ=None):
         """
@@ -2050,7 +2080,9 @@ class NDFrame(PandasObject):
 
         Parameters
         ----------
-        dtype : numpy.dtype or Python type
+        dtype : numpy.dtype or Python type, or dict of them
+            A dict casts only the columns (items for a Panel) that are its
+            keys, all at once; for a Series its only key must be the name
         raise_on_error : raise on invalid input
 
         Returns
@@ -2058,6 +2090,12 @@ class NDFrame(PandasObject):
         casted : type of caller
         """
 
+        if isinstance(dtype, dict) and self.ndim == 1:
+            if len(dtype) != 1 or list(dtype)[0] != self.name:
+                raise KeyError('only the Series name can be used as the key '
+                               'of a dtype mapping')
+            dtype = list(dtype.values())[0]
+
         mgr = self._data.astype(
             dtype=dtype, copy=copy, raise_on_error=raise_on_error)
         return self._constructor(mgr).__finalize__(self)
@@ -2686,7 +2724,7 @@ class NDFrame(PandasObject):
         return self.where((self >= threshold) | isnull(self), threshold)
 
     def groupby(self, by=None, axis=0, level=None, as_index=True, sort=True,
-                group_keys=True, squeeze=False):
+                group_keys=True, squeeze=False, num_threads=None):
         """
         Group series using mapper (dict or key function, apply given function
         to group, return result as series) or by a series of columns
@@ -2713,6 +2751,10 @@ class NDFrame(PandasObject):
         squeeze : boolean, default False
             reduce the dimensionaility of the return type if possible,
             otherwise return a consistent type
+        num_threads : int, optional
+            Number of threads running the sum, mean, var, std, min and max
+            aggregations, over the blocks of columns or over partitions of
+            the rows; defaults to the mode.groupby_threads option
 
         Examples
         --------
@@ -2734,7 +2776,8 @@ class NDFrame(PandasObject):
         from pandas.core.groupby import groupby
         axis = self._get_axis_number(axis)
         return groupby(self, by, axis=axis, level=level, as_index=as_index,
-                       sort=sort, group_keys=group_keys, squeeze=squeeze)
+                       sort=sort, group_keys=group_keys, squeeze=squeeze,
+                       num_threads=num_threads)
 
     def asfreq(self, freq, method=None, how=None, normalize=False):
         """
@@ -1,16 +1,18 @@
 import types
+import threading
 from functools import wraps
 import numpy as np
 import datetime
 
 from pandas.compat import(
-    zip, builtins, range, long, lrange, lzip,
+    zip, builtins, range, long, lrange, lzip, lmap, reduce,
     OrderedDict, callable
 )
 from pandas import compat
 
 from pandas.core.base import PandasObject
 from pandas.core.categorical import Categorical
+from pandas.core.config import get_option
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
@@ -114,6 +116,22 @@ def _groupby_function(name, alias, npfunc, numeric_only=True,
     return f
 
 
+def _groupby_cumulative(name):
+    def f(self, *args, **kwargs):
+        if not args and not kwargs:
+            try:
+                return self._transform_values(
+                    lambda values: self.grouper.transform(values, name))
+            except NotImplementedError:
+                pass
+        return self._make_wrapper(name)(*args, **kwargs)
+
+    f.__doc__ = "Compute %s of group values, in the order of the rows" % name
+    f.__name__ = name
+
+    return f
+
+
 def _first_compat(x, axis=0):
     def _first(x):
         x = np.asarray(x)
@@ -353,7 +371,7 @@ class GroupBy(PandasObject):
 
     def __init__(self, obj, keys=None, axis=0, level=None,
                  grouper=None, exclusions=None, selection=None, as_index=True,
-                 sort=True, group_keys=True, squeeze=False):
+                 sort=True, group_keys=True, squeeze=False, num_threads=None):
         self._selection = selection
 
         if isinstance(obj, NDFrame):
@@ -373,7 +391,10 @@ class GroupBy(PandasObject):
         self.group_keys = group_keys
         self.squeeze = squeeze
 
-        if grouper is None:
+        if grouper is None and get_option('mode.groupby_cache'):
+            grouper, exclusions, obj = _get_cached_grouper(
+                obj, keys, axis=axis, level=level, sort=sort)
+        elif grouper is None:
             grouper, exclusions, obj = _get_grouper(obj, keys, axis=axis,
                                                     level=level, sort=sort)
 
@@ -381,6 +402,7 @@ class GroupBy(PandasObject):
         self.axis = obj._get_axis_number(axis)
         self.grouper = grouper
         self.exclusions = set(exclusions) if exclusions else set()
+        self.num_threads = num_threads
 
     def __len__(self):
         return len(self.indices)
@@ -569,11 +591,12 @@ class GroupBy(PandasObject):
         -----
         See online documentation for full exposition on how to use apply.
 
-        In the current implementation apply calls func twice on the
-        first group to decide whether it can take a fast or slow code
-        path. This can lead to unexpected behavior if func has
-        side-effects, as they will take effect twice for the first
-        group.
+        In the current implementation apply passes the groups of a
+        DataFrame to func as views of a single frame, and takes a slow
+        path, calling func again on every group, if func returns or
+        modifies that frame. This can lead to unexpected behavior if func
+        has side-effects, as they will take effect twice for the groups
+        already applied.
 
 
         See also
@@ -650,12 +673,10 @@ class GroupBy(PandasObject):
 
         For multiple groupings, the result index will be a MultiIndex
         """
-        # todo, implement at cython level?
+        # only the default ddof is aggregated over row partitions in parallel
         if ddof == 1:
             return self._cython_agg_general('std')
-        else:
-            f = lambda x: x.std(ddof=ddof)
-            return self._python_agg_general(f)
+        return self._cython_agg_general('std', ddof=ddof)
 
     def var(self, ddof=1):
         """
@@ -663,11 +684,10 @@ class GroupBy(PandasObject):
 
         For multiple groupings, the result index will be a MultiIndex
         """
+        # only the default ddof is aggregated over row partitions in parallel
         if ddof == 1:
             return self._cython_agg_general('var')
-        else:
-            f = lambda x: x.var(ddof=ddof)
-            return self._python_agg_general(f)
+        return self._cython_agg_general('var', ddof=ddof)
 
     def size(self):
         """
@@ -675,6 +695,80 @@ class GroupBy(PandasObject):
         """
         return self.grouper.size()
 
+    def count(self):
+        """
+        Compute count of group values, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        if isinstance(self.grouper, BinGrouper):
+            # the values of each bin are contiguous
+            try:
+                result = self._cython_agg_general('count', numeric_only=False)
+            except GroupByError:
+                raise
+            except Exception:
+                pass
+            else:
+                result = result.astype(np.int64)
+                if isinstance(result, DataFrame):
+                    # a Series indexed by the bins and the columns, as
+                    # counting each bin through apply gives
+                    result = result.stack()
+                return result
+        return self._make_wrapper('count')()
+
+    def quantile(self, q=0.5):
+        """
+        Compute quantile q of groups, excluding missing values, interpolating
+        linearly between the two nearest values (see Series.quantile)
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            if isinstance(self.grouper, BinGrouper):
+                # the values of each bin are contiguous
+                return self._cython_agg_general('quantile', q=q)
+            return self._sorted_agg_general('quantile', q=q)
+        except NotImplementedError:
+            return self._make_wrapper('quantile')(q)
+
+    def nunique(self):
+        """
+        Compute number of distinct values of groups, excluding missing values
+
+        For multiple groupings, the result index will be a MultiIndex
+        """
+        try:
+            return self._sorted_agg_general('nunique', numeric_only=False)
+        except NotImplementedError:
+            return self.aggregate(lambda x: x.nunique())
+
+    def mode(self):
+        """
+        Compute most frequent value of groups, excluding missing values; the
+        smallest value when several are equally frequent
+
+        For multiple groupings, the result index will be a MultiIndex
+
+        Notes
+        -----
+        Unlike ``Series.mode``, which returns all the most frequent values
+        (and nothing if no value occurs at least twice), this returns exactly
+        one value per group: the smallest of its most frequent values, or NaN
+        for a group of missing values only. Use
+        ``grouped.apply(lambda x: x.mode())`` for all the modes of each group.
+        """
+        try:
+            return self._sorted_agg_general('mode', numeric_only=False)
+        except NotImplementedError:
+            def f(x):
+                counts = x.value_counts()
+                if len(counts) == 0:
+                    return np.nan
+                return counts.index[counts == counts.max()].min()
+            return self.aggregate(f)
+
     sum = _groupby_function('sum', 'add', np.sum)
     prod = _groupby_function('prod', 'prod', np.prod)
     min = _groupby_function('min', 'min', np.min, numeric_only=False)
@@ -867,25 +961,148 @@ class GroupBy(PandasObject):
         tail = obj[in_tail]
         return tail
 
+    cumsum = _groupby_cumulative('cumsum')
+    cumprod = _groupby_cumulative('cumprod')
+    cummin = _groupby_cumulative('cummin')
+    cummax = _groupby_cumulative('cummax')
+
+    def shift(self, periods=1, freq=None, axis=0, **kwds):
+        """
+        Shift the rows of each group by periods rows, filling the first
+        (last, if periods is negative) rows of each group with NaN
+
+        With freq, shift the index of each group instead (see Series.shift)
+        """
+        if freq is None and axis == 0 and not kwds:
+            try:
+                self._check_transform_values()
+                indexer = self.grouper.shift_indexer(periods)
+                return self._transform_values(
+                    lambda values: com.take_nd(values, indexer))
+            except NotImplementedError:
+                pass
+        return self._make_wrapper('shift')(periods, freq=freq, axis=axis,
+                                           **kwds)
+
+    def diff(self, periods=1, axis=0):
+        """
+        First discrete difference of the rows of each group, periods rows
+        apart
+        """
+        def f(values):
+            if not is_numeric_dtype(values.dtype) or values.dtype == np.bool_:
+                raise NotImplementedError('cannot diff dtype [%s] in '
+                                          'cython' % values.dtype)
+            if com.is_integer_dtype(values):
+                values = values.astype(np.float64)
+            return values - com.take_nd(values, indexer)
+
+        if axis == 0:
+            try:
+                self._check_transform_values()
+                indexer = self.grouper.shift_indexer(periods)
+                return self._transform_values(f)
+            except NotImplementedError:
+                pass
+        return self._make_wrapper('diff')(periods, axis=axis)
+
+    def fillna(self, value=None, method=None, axis=0, inplace=False,
+               limit=None, downcast=None):
+        """
+        Fill the NA values of each group, with value or, with method 'pad'
+        / 'ffill' or 'backfill' / 'bfill', with the previous or next valid
+        value of the group (see Series.fillna)
+        """
+        fill_method = com._clean_fill_method(method)
+        if (value is None and fill_method in ('pad', 'backfill') and
+                axis == 0 and not inplace and limit is None and
+                downcast is None):
+
+            def f(values):
+                indexer = self.grouper.fill_indexer(isnull(values),
+                                                    fill_method)
+                return com.take_nd(values, indexer)
+
+            try:
+                return self._transform_values(f)
+            except NotImplementedError:
+                pass
+        return self._make_wrapper('fillna')(value=value, method=method,
+                                            axis=axis, inplace=inplace,
+                                            limit=limit, downcast=downcast)
+
+    def ffill(self, limit=None):
+        """
+        Fill the NA values of each group with the previous valid value of
+        the group
+        """
+        return self.fillna(method='ffill', limit=limit)
+
+    def bfill(self, limit=None):
+        """
+        Fill the NA values of each group with the next valid value of the
+        group
+        """
+        return self.fillna(method='bfill', limit=limit)
+
+    def rank(self, method='average', na_option='keep', ascending=True,
+             pct=False, **kwargs):
+        """
+        Compute the numerical rank of the values within each group (see
+        Series.rank)
+        """
+        if na_option == 'keep' and method in _algos.tiebreakers and not kwargs:
+            try:
+                return self._transform_values(
+                    lambda values: self.grouper.transform(
+                        values, 'rank', ties_method=method,
+                        ascending=ascending, pct=pct))
+            except NotImplementedError:
+                pass
+        return self._make_wrapper('rank')(method=method, na_option=na_option,
+                                          ascending=ascending, pct=pct,
+                                          **kwargs)
+
+    def _transform_values(self, func):
+        """
+        apply func, mapping the values of a column to values aligned with
+        them, to each column of the selected object, and return a like-indexed
+        object of the results; raise NotImplementedError (as func may) where
+        the transform must instead be applied to each group
+        """
+        self._check_transform_values()
+
+        obj = self._selected_obj
+        if obj.ndim == 1:
+            return obj._constructor(func(obj.values), index=obj.index,
+                                    name=obj.name)
+
+        result = DataFrame(dict((i, func(obj.iloc[:, i].values))
+                                for i in range(len(obj.columns))),
+                           index=obj.index)
+        result.columns = obj.columns
+        return result
+
+    def _check_transform_values(self):
+        if (self.axis != 0 or self._selected_obj.ndim > 2 or
+                isinstance(self.grouper, BinGrouper)):
+            raise NotImplementedError('cannot transform the values of this '
+                                      'groupby in cython')
+
     def _cumcount_array(self, arr=None, **kwargs):
         """
         arr is where cumcount gets it's values from
         """
         ascending = kwargs.pop('ascending', True)
 
+        cumcounts = self.grouper.cumcount(ascending=ascending)
         if arr is None:
-            arr = np.arange(self.grouper._max_groupsize, dtype='int64')
-
-        len_index = len(self._selected_obj.index)
-        cumcounts = np.empty(len_index, dtype=arr.dtype)
+            return cumcounts
 
-        if ascending:
-            for v in self.indices.values():
-                cumcounts[v] = arr[:len(v)]
-        else:
-            for v in self.indices.values():
-                cumcounts[v] = arr[len(v)-1::-1]
-        return cumcounts
+        result = np.empty(len(cumcounts), dtype=arr.dtype)
+        mask = self.grouper.group_info[0] >= 0
+        result[mask] = arr.take(cumcounts[mask])
+        return result
 
     @cache_readonly
     def _selected_obj(self):
@@ -927,7 +1144,12 @@ class GroupBy(PandasObject):
 
         return result
 
-    def _cython_agg_general(self, how, numeric_only=True):
+    def _get_num_threads(self):
+        if self.num_threads is not None:
+            return self.num_threads
+        return get_option('mode.groupby_threads')
+
+    def _cython_agg_general(self, how, numeric_only=True, **kwargs):
         output = {}
         for name, obj in self._iterate_slices():
             is_numeric = is_numeric_dtype(obj.dtype)
@@ -935,7 +1157,9 @@ class GroupBy(PandasObject):
                 continue
 
             try:
-                result, names = self.grouper.aggregate(obj.values, how)
+                result, names = self.grouper.aggregate(
+                    obj.values, how, num_threads=self._get_num_threads(),
+                    **kwargs)
             except AssertionError as e:
                 raise GroupByError(str(e))
             output[name] = self._try_cast(result, obj)
@@ -945,6 +1169,24 @@ class GroupBy(PandasObject):
 
         return self._wrap_aggregated_output(output, names)
 
+    def _sorted_agg_general(self, how, numeric_only=True, **kwargs):
+        if (isinstance(self.grouper, BinGrouper) or
+                self._selected_obj.ndim > 2):
+            raise NotImplementedError('no sorted aggregation for this '
+                                      'groupby')
+
+        output = {}
+        for name, obj in self._iterate_slices():
+            if numeric_only and not is_numeric_dtype(obj.dtype):
+                continue
+            output[name] = self.grouper.aggregate_sorted(obj.values, how,
+                                                         **kwargs)
+
+        if len(output) == 0:
+            raise DataError('No numeric types to aggregate')
+
+        return self._wrap_aggregated_output(output)
+
     def _python_agg_general(self, func, *args, **kwargs):
         func = _intercept_function(func)
         f = lambda x: func(x, *args, **kwargs)
@@ -1000,17 +1242,35 @@ class GroupBy(PandasObject):
 
         return result
 
-    def _apply_filter(self, indices, dropna):
-        if len(indices) == 0:
-            indices = []
-        else:
-            indices = np.sort(np.concatenate(indices))
+    def _group_mask(self, keep):
+        """
+        the boolean array, with a value for each group, of a filter given as
+        a boolean Series indexed by the group keys (the groups missing from
+        it, or null in it, are not kept) or as a boolean array
+        """
+        if isinstance(keep, Series):
+            keep = keep.reindex(self.grouper.result_index).values
+        keep = np.asarray(keep)
+        if keep.ndim != 1 or len(keep) != self.ngroups:
+            raise ValueError('the filter must have a value for each group')
+
+        mask = notnull(keep)
+        if mask.any() and not lib.is_bool_array(keep[mask]):
+            raise TypeError("the filter must be boolean")
+
+        result = np.zeros(len(keep), dtype=bool)
+        result[mask] = keep[mask]
+        return result
+
+    def _apply_filter(self, keep, dropna):
+        # mask the rows through their group, the rows outside of any group
+        # taking the last, False, value
+        comp_ids, _, _ = self.grouper.group_info
+        mask = np.append(keep, False).take(comp_ids)
+
         if dropna:
-            filtered = self._selected_obj.take(indices)
+            filtered = self._selected_obj.take(mask.nonzero()[0])
         else:
-            mask = np.empty(len(self._selected_obj.index), dtype=bool)
-            mask.fill(False)
-            mask[indices.astype(int)] = True
             # mask fails to broadcast when passed to where; broadcast manually.
             mask = np.tile(mask, list(self._selected_obj.shape[1:]) + [1]).T
             filtered = self._selected_obj.where(mask)  # Fill with NaNs.
@@ -1029,6 +1289,39 @@ def groupby(obj, by, **kwds):
     return klass(obj, by, **kwds)
 
 
+# the threads running the cython aggregations, created on first use and
+# grown when more threads are asked for; see _get_thread_pool
+_thread_pool = None
+_thread_pool_size = 0
+_thread_pool_lock = threading.Lock()
+
+
+def _get_thread_pool(num_threads):
+    """
+    return the module pool of threads, with at least num_threads and
+    mode.groupby_threads threads
+    """
+    global _thread_pool, _thread_pool_size
+    size = max(num_threads, get_option('mode.groupby_threads'))
+    with _thread_pool_lock:
+        if _thread_pool is None or _thread_pool_size < size:
+            from multiprocessing.pool import ThreadPool
+            if _thread_pool is not None:
+                # its workers exit once the tasks already queued are done
+                _thread_pool.close()
+            _thread_pool = ThreadPool(size)
+            _thread_pool_size = size
+        return _thread_pool
+
+
+def _thread_map(func, args, num_threads):
+    """ map func over args with at most num_threads threads at a time """
+    args = list(args)
+    pool = _get_thread_pool(num_threads)
+    chunksize = -(-len(args) // num_threads) or 1
+    return pool.map(func, args, chunksize)
+
+
 def _get_axes(group):
     if isinstance(group, Series):
         return [group.index]
@@ -1196,7 +1489,10 @@ class BaseGrouper(object):
 
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
-        if self._overflow_possible:
+        if self._hash_groups:
+            comp_ids, recons_labels = self._hashed_labels
+            return comp_ids, np.arange(len(recons_labels[0]))
+        elif self._overflow_possible:
             tups = lib.fast_zip(all_labels)
             labs, uniques = algos.factorize(tups)
 
@@ -1221,6 +1517,41 @@ class BaseGrouper(object):
     def _overflow_possible(self):
         return _int64_overflow_possible(self.shape)
 
+    @property
+    def _hash_groups(self):
+        return not self.sort and len(self.groupings) > 1
+
+    @cache_readonly
+    def _hashed_labels(self):
+        """
+        number the groups of several keys in order of appearance, hashing
+        the labels of the keys combined pairwise rather than computing and
+        compressing (or, on overflow, zipping) offsets into their cartesian
+        product; return the group ids of the rows, and the labels of each
+        key for the groups
+        """
+        all_labels = [com._ensure_int64(ping.labels)
+                      for ping in self.groupings]
+        mask = np.zeros(len(all_labels[0]), dtype=bool)
+        for labels in all_labels:
+            mask |= labels < 0
+
+        comp_ids = all_labels[0]
+        for labels, size in zip(all_labels[1:], self.shape[1:]):
+            combined = comp_ids * size + labels
+            np.putmask(combined, mask, -1)
+            table = _hash.Int64HashTable(min(1000000, len(combined)))
+            comp_ids, _ = table.get_labels_groupby(combined)
+
+        # the labels of each group are those of its first row, the rows
+        # where the group ids (numbered by appearance) reach a new maximum
+        observed = (comp_ids >= 0).nonzero()[0]
+        ids = comp_ids.take(observed)
+        is_first = np.ones(len(ids), dtype=bool)
+        is_first[1:] = ids[1:] > np.maximum.accumulate(ids)[:-1]
+        first = observed[is_first]
+        return comp_ids, [labels.take(first) for labels in all_labels]
+
     @cache_readonly
     def ngroups(self):
         return len(self.result_index)
@@ -1236,7 +1567,9 @@ class BaseGrouper(object):
         if not self.compressed and len(self.groupings) == 1:
             return [self.groupings[0].group_index]
 
-        if self._overflow_possible:
+        if self._hash_groups:
+            recons_labels = self._hashed_labels[1]
+        elif self._overflow_possible:
             recons_labels = [np.array(x) for x in zip(*obs_ids)]
         else:
             recons_labels = decons_group_index(obs_ids, self.shape)
@@ -1318,7 +1651,17 @@ class BaseGrouper(object):
                                       (how, dtype_str))
         return func, dtype_str
 
-    def aggregate(self, values, how, axis=0):
+    # the aggregations that can run over row partitions in parallel
+    _partitioned_functions = ['add', 'mean', 'var', 'std', 'min', 'max']
+
+    # the smallest number of rows aggregated by each thread
+    _partition_rows = 10000
+
+    def aggregate(self, values, how, axis=0, num_threads=None, **kwargs):
+        """
+        aggregate the values with the cython function how, passing it the
+        keyword arguments (such as the ddof of var)
+        """
 
         arity = self._cython_arity.get(how, 1)
 
@@ -1335,6 +1678,10 @@ class BaseGrouper(object):
                 raise NotImplementedError
             out_shape = (self.ngroups,) + values.shape[1:]
 
+        if how == 'count' and not is_numeric_dtype(values.dtype):
+            # only the nulls matter to the count
+            values = np.where(com.isnull(values), np.nan, 0.)
+
         if is_numeric_dtype(values.dtype):
             values = com.ensure_float(values)
             is_numeric = True
@@ -1345,12 +1692,22 @@ class BaseGrouper(object):
             values = values.astype(object)
             is_numeric = False
 
-        # will be filled in Cython function
-        result = np.empty(out_shape, dtype=values.dtype)
-        result.fill(np.nan)
-        counts = np.zeros(self.ngroups, dtype=np.int64)
+        if num_threads is None:
+            num_threads = get_option('mode.groupby_threads')
+        nparts = min(num_threads, len(values) // self._partition_rows)
+
+        if (nparts > 1 and is_numeric and values.ndim == 2 and
+                how in self._partitioned_functions and not kwargs):
+            result, counts = self._aggregate_partitioned(values, how, nparts)
+
+        else:
+            # will be filled in Cython function
+            result = np.empty(out_shape, dtype=values.dtype)
+            result.fill(np.nan)
+            counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how, is_numeric)
+            result = self._aggregate(result, counts, values, how, is_numeric,
+                                     **kwargs)
 
         if self._filter_empty_groups:
             if result.ndim == 2:
@@ -1377,7 +1734,119 @@ class BaseGrouper(object):
 
         return result, names
 
-    def _aggregate(self, result, counts, values, how, is_numeric):
+    # the statistics computed together by the group_stats kernels, by kernel
+    # code, and the statistics each aggregation is derived from
+    _stats_codes = {
+        'count': 0, 'add': 1, 'sumsq': 2, 'min': 3, 'max': 4, 'first': 5,
+        'last': 6
+    }
+
+    _stats_requires = {
+        'count': ['count'],
+        'add': ['add'],
+        'sumsq': ['sumsq'],
+        'min': ['min'],
+        'max': ['max'],
+        'first': ['first'],
+        'last': ['last'],
+        'mean': ['count', 'add'],
+        'var': ['count', 'add', 'sumsq'],
+        'std': ['count', 'add', 'sumsq'],
+    }
+
+    def aggregate_stats(self, values, hows):
+        """
+        compute several aggregations (see _stats_requires) of 1-d numeric
+        values in a single pass over them; return a dict of how -> result
+        """
+        needed = []
+        for how in hows:
+            for stat in self._stats_requires[how]:
+                if stat not in needed:
+                    needed.append(stat)
+
+        values = com.ensure_float(values)[:, None]
+        comp_ids, _, _ = self.group_info
+        stats, counts = self._compute_stats(values, comp_ids, needed)
+
+        result = {}
+        for how in hows:
+            values = self._derive_stats(stats, how)[:, 0]
+            if self._filter_empty_groups:
+                values = values[counts > 0]
+            result[how] = values
+
+        return result
+
+    def _compute_stats(self, values, comp_ids, needed):
+        """
+        run the group_stats kernel on the 2-d float values; return a dict of
+        statistic -> (ngroups, K) array, and the group sizes
+        """
+        func = getattr(_algos, 'group_stats_%s' % values.dtype.name, None)
+        if func is None:
+            raise NotImplementedError('no group_stats function for dtype '
+                                      '[%s]' % values.dtype)
+
+        codes = np.array([self._stats_codes[stat] for stat in needed],
+                         dtype=np.int64)
+        out = np.empty((len(needed), self.ngroups) + values.shape[1:],
+                       dtype=values.dtype)
+        counts = np.zeros(self.ngroups, dtype=np.int64)
+        func(out, counts, values, comp_ids, codes)
+        return dict(zip(needed, out)), counts
+
+    @staticmethod
+    def _derive_stats(stats, how):
+        """ the result of the aggregation how from the statistics """
+        if how == 'mean':
+            return stats['add'] / stats['count']
+        elif how in ('var', 'std'):
+            ct, sumx = stats['count'], stats['add']
+            result = (ct * stats['sumsq'] - sumx * sumx) / (ct * ct - ct)
+            result[ct < 2] = np.nan
+            if how == 'std':
+                result = np.sqrt(result)
+            return result
+        return stats[how]
+
+    def _aggregate_partitioned(self, values, how, nparts):
+        """
+        aggregate the 2-d float values by splitting the rows in nparts
+        partitions, computing the statistics of each in its own thread (the
+        kernel releases the GIL) and merging them
+        """
+        needed = ['count'] + [stat for stat in self._stats_requires[how]
+                              if stat != 'count']
+        comp_ids, _, _ = self.group_info
+        bounds = np.linspace(0, len(values), nparts + 1).astype(np.int64)
+
+        def compute(k):
+            lo, hi = bounds[k], bounds[k + 1]
+            return self._compute_stats(values[lo:hi], comp_ids[lo:hi],
+                                       needed)
+
+        partials = _thread_map(compute, range(nparts), nparts)
+
+        counts = sum(part_counts for _, part_counts in partials)
+        stats = {}
+        for stat in needed:
+            parts = [part_stats[stat] for part_stats, _ in partials]
+            if stat == 'min':
+                stats[stat] = reduce(np.fmin, parts)
+            elif stat == 'max':
+                stats[stat] = reduce(np.fmax, parts)
+            else:
+                stats[stat] = sum(np.where(np.isnan(part), 0, part)
+                                  for part in parts)
+
+        empty = stats['count'] == 0
+        for stat in needed[1:]:
+            stats[stat][empty] = np.nan
+
+        return self._derive_stats(stats, how), counts
+
+    def _aggregate(self, result, counts, values, how, is_numeric, **kwargs):
         agg_func, dtype = self._get_aggregate_function(how, values)
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
@@ -1389,12 +1858,129 @@ class BaseGrouper(object):
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
 
                 chunk = chunk.squeeze()
-                agg_func(result[:, :, i], counts, chunk, comp_ids)
+                agg_func(result[:, :, i], counts, chunk, comp_ids, **kwargs)
         else:
-            agg_func(result, counts, values, comp_ids)
+            agg_func(result, counts, values, comp_ids, **kwargs)
 
         return trans_func(result)
 
+    #------------------------------------------------------------
+    # Sort-based aggregations
+
+    def aggregate_sorted(self, values, how, **kwargs):
+        """
+        aggregate the 1-d values with the kernels sorting the values of each
+        group once: the quantile q ('quantile', of numeric values), the
+        number of distinct values ('nunique') or the most frequent value,
+        the smallest among ties ('mode'), of each group, nulls excluded
+        """
+        comp_ids, _, ngroups = self.group_info
+
+        if how == 'quantile':
+            result = np.empty(ngroups, dtype=np.float64)
+            _algos.group_quantile(result, com._ensure_float64(values),
+                                  comp_ids, kwargs['q'])
+            return result
+
+        # the other aggregations compare the values through their codes
+        codes, uniques = algos.factorize(values, sort=True)
+        codes = com._ensure_int64(codes)
+
+        if how == 'nunique':
+            result = np.zeros(ngroups, dtype=np.int64)
+            _algos.group_nunique(result, codes, comp_ids)
+            return result
+        elif how == 'mode':
+            result = np.empty(ngroups, dtype=np.int64)
+            _algos.group_mode(result, codes, comp_ids)
+            return com.take_nd(uniques, result)
+
+        raise ValueError('unknown sorted aggregation %r' % how)
+
+    #------------------------------------------------------------
+    # Transform functions
+
+    # the cumulative functions of the group_cumulative kernels, by kernel code
+    _cumulative_codes = {
+        'cumsum': 0, 'cumprod': 1, 'cummin': 2, 'cummax': 3
+    }
+
+    def transform(self, values, how, **kwargs):
+        """
+        compute the transform how of the 1-d values within each group: one
+        of the cumulative functions (see _cumulative_codes), or 'rank' (with
+        the keywords of group_rank_float64); return an array aligned with
+        the values, null for the rows outside of any group
+        """
+        comp_ids, _, ngroups = self.group_info
+
+        if how == 'rank':
+            if (not is_numeric_dtype(values.dtype) or
+                    values.dtype == np.bool_):
+                raise NotImplementedError('cannot rank dtype [%s] in '
+                                          'cython' % values.dtype)
+            result = np.empty(len(values), dtype=np.float64)
+            _algos.group_rank_float64(result, com._ensure_float64(values),
+                                      comp_ids, ngroups, **kwargs)
+            return result
+
+        func = getattr(_algos, 'group_cumulative_%s' % values.dtype.name,
+                       None)
+        if func is None:
+            raise NotImplementedError("function is not implemented for this "
+                                      "dtype: [how->%s,dtype->%s]" %
+                                      (how, values.dtype.name))
+
+        # integers cannot hold the nulls of the rows outside of any group
+        if com.is_integer_dtype(values) and (comp_ids < 0).any():
+            values = values.astype(np.float64)
+            func = _algos.group_cumulative_float64
+
+        result = np.empty((len(values), 1), dtype=values.dtype)
+        if com.is_float_dtype(values):
+            result.fill(np.nan)
+        func(result, values[:, None], comp_ids, ngroups,
+             self._cumulative_codes[how])
+        return result[:, 0]
+
+    def shift_indexer(self, periods):
+        """
+        indexer taking, for each row, the row periods rows before it in its
+        group, or -1 where there is none
+        """
+        comp_ids, _, ngroups = self.group_info
+        return _algos.group_shift_indexer(comp_ids, ngroups, periods)
+
+    def fill_indexer(self, mask, method):
+        """
+        indexer taking, for each row, the row itself if it is not masked,
+        and otherwise the previous ('pad') or next ('backfill') unmasked row
+        of its group, or -1 where there is none
+        """
+        comp_ids, _, ngroups = self.group_info
+        return _algos.group_fillna_indexer(comp_ids, ngroups, mask,
+                                           method == 'pad')
+
+    def cumcount(self, ascending=True):
+        """
+        number the rows of each group from 0 to the size of the group - 1,
+        in the order of the rows (or in reverse); the rows outside of any
+        group are numbered among themselves
+        """
+        comp_ids, _, ngroups = self.group_info
+        indexer, counts = _algos.groupsort_indexer(comp_ids, ngroups)
+
+        # the position of each row in the (stable) sort by group, less the
+        # position of the first row of its group
+        starts = counts.cumsum() - counts
+        result = np.arange(len(indexer)) - np.repeat(starts, counts)
+        if not ascending:
+            result = np.repeat(counts - 1, counts) - result
+
+        cumcounts = np.empty(len(indexer), dtype=np.int64)
+        cumcounts[indexer] = result
+        return cumcounts
+
     def agg_series(self, obj, func):
         try:
             return self._aggregate_series_fast(obj, func)
@@ -1579,6 +2165,12 @@ class BinGrouper(BaseGrouper):
         'add': 'group_add_bin',
         'prod': 'group_prod_bin',
         'mean': 'group_mean_bin',
+        'median': {
+            'name': 'group_quantile_bin',
+            'f': lambda func, a, b, c, d: func(a, b, c, d, 0.5)
+        },
+        'quantile': 'group_quantile_bin',
+        'count': 'group_count_bin',
         'min': 'group_min_bin',
         'max': 'group_max_bin',
         'var': 'group_var_bin',
@@ -1595,9 +2187,13 @@ class BinGrouper(BaseGrouper):
         'ohlc': lambda *args: ['open', 'high', 'low', 'close']
     }
 
+    # bins cannot be split in row partitions
+    _partitioned_functions = []
+
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how, is_numeric=True):
+    def _aggregate(self, result, counts, values, how, is_numeric=True,
+                   **kwargs):
 
         agg_func, dtype = self._get_aggregate_function(how, values)
         trans_func = self._cython_transforms.get(how, lambda x: x)
@@ -1607,9 +2203,9 @@ class BinGrouper(BaseGrouper):
             raise NotImplementedError
         elif values.ndim > 2:
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
-                agg_func(result[:, :, i], counts, chunk, self.bins)
+                agg_func(result[:, :, i], counts, chunk, self.bins, **kwargs)
         else:
-            agg_func(result, counts, values, self.bins)
+            agg_func(result, counts, values, self.bins, **kwargs)
 
         return trans_func(result)
 
@@ -1907,6 +2503,45 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
     return grouper, exclusions, obj
 
 
+# the number of groupers kept on a frame by mode.groupby_cache
+_GROUPER_CACHE_SIZE = 8
+
+
+def _get_cached_grouper(obj, key=None, axis=0, level=None, sort=True):
+    """
+    _get_grouper, reusing the grouper of a previous groupby of the DataFrame
+    over the same columns while the index and the key columns are unchanged
+
+    The groupers are kept on the frame, up to _GROUPER_CACHE_SIZE of them
+    (dropping the least recently used), and are dropped whenever the frame
+    is written to through setitem, the indexers, set_value or one of its
+    cached columns; writes bypassing them (e.g. to ``df.values``) are not
+    caught
+    """
+    keys = key if isinstance(key, list) else [key]
+    if (not isinstance(obj, DataFrame) or axis != 0 or level is not None
+            or not keys or isinstance(obj.columns, MultiIndex)
+            or not obj.columns.is_unique
+            or not all(_is_label_like(k) and k in obj.columns for k in keys)):
+        return _get_grouper(obj, key, axis=axis, level=level, sort=sort)
+
+    cache = obj.__dict__.setdefault('_grouper_cache', OrderedDict())
+    cache_key = tuple(keys), sort
+
+    if cache_key in cache:
+        grouper, exclusions, index = cache.pop(cache_key)
+        if index is obj.index:
+            cache[cache_key] = grouper, exclusions, index
+            return grouper, exclusions, obj
+
+    grouper, exclusions, obj = _get_grouper(obj, key, axis=axis, level=level,
+                                            sort=sort)
+    cache[cache_key] = grouper, exclusions, obj.index
+    while len(cache) > _GROUPER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return grouper, exclusions, obj
+
+
 def _is_label_like(val):
     return isinstance(val, compat.string_types) or np.isscalar(val)
 
@@ -2028,16 +2663,62 @@ class SeriesGroupBy(GroupBy):
             arg = lzip(columns, arg)
 
         results = {}
+        fused = self._aggregate_fused(arg)
 
         for name, func in arg:
             if name in results:
                 raise SpecificationError('Function names must be unique, '
                                          'found multiple named %s' % name)
 
-            results[name] = self.aggregate(func)
+            if name in fused:
+                results[name] = fused[name]
+            else:
+                results[name] = self.aggregate(func)
 
         return DataFrame(results, columns=columns)
 
+    # aggregations the grouper can compute together in one pass
+    _fused_aggregations = {
+        'count': 'count', 'sum': 'add', 'mean': 'mean', 'var': 'var',
+        'std': 'std', 'min': 'min', 'max': 'max', 'first': 'first',
+        'last': 'last'
+    }
+
+    def _aggregate_fused(self, arg):
+        """
+        compute the aggregations of the (name, func) pairs of arg that the
+        grouper supports in one pass over the values, if there are several;
+        return a dict of name -> result
+        """
+        hows = {}
+        for name, func in arg:
+            if not isinstance(func, compat.string_types):
+                func = _intercept_cython(func)
+            how = self._fused_aggregations.get(func)
+            if how is not None:
+                hows[name] = how
+
+        obj = self._selected_obj
+        if (len(hows) < 2 or isinstance(self.grouper, BinGrouper) or
+                not is_numeric_dtype(obj.dtype) or obj.dtype == np.bool_):
+            return {}
+
+        try:
+            stats = self.grouper.aggregate_stats(obj.values,
+                                                 set(hows.values()))
+        except NotImplementedError:
+            return {}
+
+        index = self.grouper.result_index
+        results = {}
+        for name, how in compat.iteritems(hows):
+            if how == 'count':
+                values = stats[how].astype(np.int64)
+            else:
+                values = self._try_cast(stats[how], obj)
+            results[name] = Series(values, index=index, name=self.name)
+        return results
+
     def _wrap_aggregated_output(self, output, names=None):
         # sort of a kludge
         output = output[self.name]
@@ -2106,6 +2787,15 @@ class SeriesGroupBy(GroupBy):
         -------
         transformed : Series
         """
+        # aggregations with a cython kernel are computed for all the groups
+        # at once and broadcast back to their rows
+        how = _intercept_broadcast(func)
+        if how is not None and not args and not kwargs:
+            try:
+                return self._broadcast_aggregation(how)
+            except NotImplementedError:
+                pass
+
         result = self._selected_obj.copy()
         if hasattr(result, 'values'):
             result = result.values
@@ -2134,6 +2824,31 @@ class SeriesGroupBy(GroupBy):
         return self._selected_obj.__class__(result, index=self._selected_obj.index,
                                   name=self._selected_obj.name)
 
+    def _broadcast_aggregation(self, how):
+        """
+        compute the cython aggregation how of the groups and broadcast it
+        back to their rows, as transform does with a function reducing each
+        group (the rows outside of any group keep their values)
+        """
+        obj = self._selected_obj
+        if (isinstance(self.grouper, BinGrouper) or
+                not is_numeric_dtype(obj.dtype) or obj.dtype == np.bool_):
+            raise NotImplementedError('cannot broadcast the aggregation of '
+                                      'this groupby')
+
+        comp_ids, _, ngroups = self.grouper.group_info
+        agged = getattr(self, how)()
+        if len(agged) != ngroups:
+            raise NotImplementedError('the aggregation dropped groups')
+
+        result = com.take_nd(agged.values, comp_ids)
+        mask = comp_ids < 0
+        if mask.any():
+            result[mask] = obj.values[mask]
+
+        result = _possibly_downcast_to_dtype(result, obj.dtype)
+        return obj._constructor(result, index=obj.index, name=obj.name)
+
     def filter(self, func, dropna=True, *args, **kwargs):
         """
         Return a copy of a Series excluding elements from groups that
@@ -2141,19 +2856,26 @@ class SeriesGroupBy(GroupBy):
 
         Parameters
         ----------
-        func : function
-            To apply to each group. Should return True or False.
+        func : function, or boolean Series indexed by the group keys
+            To apply to each group. Should return True or False. A boolean
+            Series (such as a comparison of an aggregation of the groups)
+            gives the criterion of every group at once; the groups missing
+            from it, or NaN in it, are excluded.
         dropna : Drop groups that do not pass the filter. True by default;
             if False, groups that evaluate False are filled with NaNs.
 
         Example
         -------
         >>> grouped.filter(lambda x: x.mean() > 0)
+        >>> grouped.filter(grouped.mean() > 0)
 
         Returns
         -------
         filtered : Series
         """
+        if _is_group_mask(func):
+            return self._apply_filter(self._group_mask(func), dropna)
+
         if isinstance(func, compat.string_types):
             wrapper = lambda x: getattr(x, func)(*args, **kwargs)
         else:
@@ -2164,15 +2886,17 @@ class SeriesGroupBy(GroupBy):
             b = wrapper(x, *args, **kwargs)
             return b and notnull(b)
 
+        keep = np.zeros(self.ngroups, dtype=bool)
         try:
-            indices = [self._get_index(name) if true_and_notnull(group) else []
-                       for name, group in self]
+            for i, (name, group) in enumerate(self):
+                if true_and_notnull(group):
+                    keep[i] = True
         except ValueError:
             raise TypeError("the filter must return a boolean result")
         except TypeError:
             raise TypeError("the filter must return a boolean result")
 
-        filtered = self._apply_filter(indices, dropna)
+        filtered = self._apply_filter(keep, dropna)
         return filtered
 
 
@@ -2195,8 +2919,9 @@ class NDFrameGroupBy(GroupBy):
                 continue
             yield val, slicer(val)
 
-    def _cython_agg_general(self, how, numeric_only=True):
-        new_blocks = self._cython_agg_blocks(how, numeric_only=numeric_only)
+    def _cython_agg_general(self, how, numeric_only=True, **kwargs):
+        new_blocks = self._cython_agg_blocks(how, numeric_only=numeric_only,
+                                             **kwargs)
         return self._wrap_agged_blocks(new_blocks)
 
     def _wrap_agged_blocks(self, blocks):
@@ -2218,29 +2943,38 @@ class NDFrameGroupBy(GroupBy):
 
     _block_agg_axis = 0
 
-    def _cython_agg_blocks(self, how, numeric_only=True):
+    def _cython_agg_blocks(self, how, numeric_only=True, **kwargs):
         data, agg_axis = self._get_data_to_aggregate()
 
-        new_blocks = []
+        blocks = [block for block in data.blocks
+                  if not numeric_only or is_numeric_dtype(block.dtype)]
 
-        for block in data.blocks:
-            values = block.values
-
-            is_numeric = is_numeric_dtype(values.dtype)
-
-            if numeric_only and not is_numeric:
-                continue
+        # aggregate the blocks in parallel, or the rows of a single block
+        num_threads = self._get_num_threads()
+        block_threads = min(num_threads, len(blocks))
+        if block_threads > 1:
+            num_threads = 1
 
-            if is_numeric:
+        def aggregate_block(block):
+            values = block.values
+            if is_numeric_dtype(values.dtype):
                 values = com.ensure_float(values)
 
-            result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
+            result, _ = self.grouper.aggregate(values, how, axis=agg_axis,
+                                               num_threads=num_threads,
+                                               **kwargs)
 
             # see if we can cast the block back to the original dtype
             result = block._try_cast_result(result)
 
-            newb = make_block(result, block.items, block.ref_items)
-            new_blocks.append(newb)
+            return make_block(result, block.items, block.ref_items)
+
+        if block_threads > 1:
+            # compute the group labels once, before the threads need them
+            self.grouper.group_info
+            new_blocks = _thread_map(aggregate_block, blocks, block_threads)
+        else:
+            new_blocks = lmap(aggregate_block, blocks)
 
         if len(new_blocks) == 0:
             raise DataError('No numeric types to aggregate')
@@ -2299,13 +3033,15 @@ class NDFrameGroupBy(GroupBy):
 
                 for fname, agg_how in compat.iteritems(arg):
                     colg = SeriesGroupBy(subset, selection=self._selection,
-                                         grouper=self.grouper)
+                                         grouper=self.grouper,
+                                         num_threads=self.num_threads)
                     result[fname] = colg.aggregate(agg_how)
                     keys.append(fname)
             else:
                 for col, agg_how in compat.iteritems(arg):
                     colg = SeriesGroupBy(obj[col], selection=col,
-                                         grouper=self.grouper)
+                                         grouper=self.grouper,
+                                         num_threads=self.num_threads)
                     result[col] = colg.aggregate(agg_how)
                     keys.append(col)
 
@@ -2364,7 +3100,8 @@ class NDFrameGroupBy(GroupBy):
         for col in obj:
             try:
                 colg = SeriesGroupBy(obj[col], selection=col,
-                                     grouper=self.grouper)
+                                     grouper=self.grouper,
+                                     num_threads=self.num_threads)
                 results.append(colg.aggregate(arg))
                 keys.append(col)
             except (TypeError, DataError):
@@ -2418,7 +3155,8 @@ class NDFrameGroupBy(GroupBy):
             try:
                 data = obj[item]
                 colg = SeriesGroupBy(data, selection=item,
-                                     grouper=self.grouper)
+                                     grouper=self.grouper,
+                                     num_threads=self.num_threads)
                 result[item] = self._try_cast(
                     colg.aggregate(func, *args, **kwargs), data)
             except ValueError:
@@ -2613,6 +3351,15 @@ class NDFrameGroupBy(GroupBy):
         """
         from pandas.tools.merge import concat
 
+        # aggregations with a cython kernel are computed for all the groups
+        # at once and broadcast back to their rows
+        how = _intercept_broadcast(func)
+        if how is not None and not args and not kwargs:
+            try:
+                return self._broadcast_aggregation(how)
+            except NotImplementedError:
+                pass
+
         applied = []
 
         obj = self._obj_with_exclusions
@@ -2652,6 +3399,38 @@ class NDFrameGroupBy(GroupBy):
         concatenated.sort_index(inplace=True)
         return concatenated
 
+    def _broadcast_aggregation(self, how):
+        """
+        compute the cython aggregation how of the groups and broadcast it
+        back to their rows, as transform does with a function reducing each
+        group, where this gives the same columns and rows
+        """
+        obj = self._obj_with_exclusions
+        if (self.axis != 0 or not self.as_index or
+                isinstance(self.grouper, BinGrouper) or
+                not obj.index.is_monotonic):
+            raise NotImplementedError('cannot broadcast the aggregation of '
+                                      'this groupby')
+
+        # transform drops the rows outside of any group
+        comp_ids, _, ngroups = self.grouper.group_info
+        if (comp_ids < 0).any():
+            raise NotImplementedError('rows outside of any group')
+
+        agged = getattr(self, how)()
+        if len(agged) != ngroups or not agged.columns.equals(obj.columns):
+            raise NotImplementedError('the aggregation dropped groups or '
+                                      'columns')
+
+        result = {}
+        for i in range(len(obj.columns)):
+            values = com.take_nd(agged.iloc[:, i].values, comp_ids)
+            result[i] = _possibly_downcast_to_dtype(values,
+                                                    obj.iloc[:, i].dtype)
+        result = DataFrame(result, index=obj.index)
+        result.columns = obj.columns
+        return result
+
     def _define_paths(self, func, *args, **kwargs):
         if isinstance(func, compat.string_types):
             fast_path = lambda group: getattr(group, func)(*args, **kwargs)
@@ -2710,8 +3489,11 @@ class NDFrameGroupBy(GroupBy):
 
         Parameters
         ----------
-        f : function
+        f : function, or boolean Series indexed by the group keys
             Function to apply to each subframe. Should return True or False.
+            A boolean Series (such as a comparison of an aggregation of the
+            groups) gives the criterion of every group at once; the groups
+            missing from it, or NaN in it, are excluded.
         dropna : Drop groups that do not pass the filter. True by default;
             if False, groups that evaluate False are filled with NaNs.
 
@@ -2724,10 +3506,12 @@ class NDFrameGroupBy(GroupBy):
         --------
         >>> grouped = df.groupby(lambda x: mapping[x])
         >>> grouped.filter(lambda x: x['A'].sum() + x['B'].sum() > 0)
+        >>> grouped.filter(grouped['A'].sum() + grouped['B'].sum() > 0)
         """
-        from pandas.tools.merge import concat
+        if _is_group_mask(func):
+            return self._apply_filter(self._group_mask(func), dropna)
 
-        indices = []
+        keep = np.zeros(self.ngroups, dtype=bool)
 
         obj = self._selected_obj
         gen = self.grouper.get_iterator(obj, axis=self.axis)
@@ -2735,7 +3519,7 @@ class NDFrameGroupBy(GroupBy):
         fast_path, slow_path = self._define_paths(func, *args, **kwargs)
 
         path = None
-        for name, group in gen:
+        for i, (name, group) in enumerate(gen):
             object.__setattr__(group, 'name', name)
 
             if path is None:
@@ -2748,24 +3532,21 @@ class NDFrameGroupBy(GroupBy):
             else:
                 res = path(group)
 
-            def add_indices():
-                indices.append(self._get_index(name))
-
             # interpret the result of the filter
             if isinstance(res, (bool, np.bool_)):
                 if res:
-                    add_indices()
+                    keep[i] = True
             else:
                 if getattr(res, 'ndim', None) == 1:
                     val = res.ravel()[0]
                     if val and notnull(val):
-                        add_indices()
+                        keep[i] = True
                 else:
 
                     # in theory you could do .all() on the boolean result ?
                     raise TypeError("the filter must return a boolean result")
 
-        filtered = self._apply_filter(indices, dropna)
+        filtered = self._apply_filter(keep, dropna)
         return filtered
 
 
@@ -2783,14 +3564,16 @@ class DataFrameGroupBy(NDFrameGroupBy):
             return DataFrameGroupBy(self.obj, self.grouper, selection=key,
                                     grouper=self.grouper,
                                     exclusions=self.exclusions,
-                                    as_index=self.as_index)
+                                    as_index=self.as_index,
+                                    num_threads=self.num_threads)
         else:
             if key not in self.obj:  # pragma: no cover
                 raise KeyError(str(key))
             # kind of a kludge
             return SeriesGroupBy(self.obj[key], selection=key,
                                  grouper=self.grouper,
-                                 exclusions=self.exclusions)
+                                 exclusions=self.exclusions,
+                                 num_threads=self.num_threads)
 
     def _wrap_generic_output(self, result, obj):
         result_index = self.grouper.levels[0]
@@ -2882,7 +3665,8 @@ class DataFrameGroupBy(NDFrameGroupBy):
             yield colname, SeriesGroupBy(self._selected_obj.iloc[:, i],
                                          selection=colname,
                                          grouper=self.grouper,
-                                         exclusions=self.exclusions)
+                                         exclusions=self.exclusions,
+                                         num_threads=self.num_threads)
 
     def _apply_to_column_groupbys(self, func):
         from pandas.tools.merge import concat
@@ -2973,7 +3757,8 @@ class PanelGroupBy(NDFrameGroupBy):
                 try:
                     itemg = DataFrameGroupBy(obj[item],
                                              axis=self.axis - 1,
-                                             grouper=self.grouper)
+                                             grouper=self.grouper,
+                                             num_threads=self.num_threads)
                     result[item] = itemg.aggregate(func, *args, **kwargs)
                 except (ValueError, TypeError):
                     raise
@@ -3351,6 +4136,24 @@ _cython_table = {
 }
 
 
+# the aggregations transform broadcasts back to the rows
+_broadcast_functions = frozenset(['sum', 'prod', 'mean', 'median', 'std',
+                                  'var', 'min', 'max'])
+
+
+def _intercept_broadcast(func):
+    if isinstance(func, compat.string_types):
+        how = func
+    else:
+        how = _cython_table.get(func)
+    return how if how in _broadcast_functions else None
+
+
+def _is_group_mask(func):
+    """ whether the filter func gives the criterion of all the groups """
+    return isinstance(func, (Series, np.ndarray, list))
+
+
 def _intercept_function(func):
     return _func_table.get(func, func)
 
@@ -3,6 +3,7 @@ import re
 import operator
 from datetime import datetime, timedelta
 import copy
+import weakref
 from collections import defaultdict
 
 import numpy as np
@@ -19,12 +20,104 @@ from pandas.sparse.array import _maybe_to_sparse, SparseArray
 import pandas.lib as lib
 import pandas.tslib as tslib
 import pandas.computation.expressions as expressions
+from pandas.core.config import get_option
 
 from pandas.tslib import Timestamp
 from pandas import compat
 from pandas.compat import range, lrange, lmap, callable, map, zip, u
 from pandas.tseries.timedeltas import _coerce_scalar_to_timedelta_type
 
+
+# copy-on-write (mode.copy_on_write): deep copies of blocks share their values,
+# whose base arrays are registered here by id; a block copies them before
+# modifying them in place
+_copy_on_write = False
+_shared_values = weakref.WeakValueDictionary()
+
+
+def _use_copy_on_write(key):
+    """Option change callback for copy-on-write block sharing"""
+    global _copy_on_write
+    _copy_on_write = bool(get_option(key))
+
+
+# mode.consolidation_threshold and mode.consolidation_growth, read on every
+# insert
+_consolidation_threshold = 100
+_consolidation_growth = 0.1
+
+
+def _use_consolidation_options(key):
+    """Option change callback for the consolidation of inserted items"""
+    global _consolidation_threshold, _consolidation_growth
+    _consolidation_threshold = get_option('mode.consolidation_threshold')
+    _consolidation_growth = get_option('mode.consolidation_growth')
+
+
+def _values_base(values):
+    """ return the array owning the memory of values """
+    base = values
+    while isinstance(base.base, np.ndarray):
+        base = base.base
+    return base
+
+
+def _share_values(values):
+    """ mark values, and every view on the same memory, as shared """
+    base = _values_base(values)
+    _shared_values[id(base)] = base
+
+
+def _is_shared(values):
+    """ return True if values were shared by a copy-on-write copy """
+    if not len(_shared_values) or not isinstance(values, np.ndarray):
+        return False
+    base = _values_base(values)
+    return _shared_values.get(id(base)) is base
+
+
+# the active AllocationTracker, see track_allocations
+_allocation_tracker = None
+
+
+def _record_allocation(name, blocks, old_blocks=()):
+    """
+    record in the active tracker the bytes of the values of blocks that do
+    not share memory with the values of old_blocks
+    """
+    bases = set(id(_values_base(b.values)) for b in old_blocks
+                if isinstance(b.values, np.ndarray))
+    nbytes = sum(b.values.nbytes for b in blocks
+                 if isinstance(b.values, np.ndarray) and
+                 id(_values_base(b.values)) not in bases)
+    _allocation_tracker.record(name, nbytes)
+
+
+# work done consolidating blocks, see consolidation_stats
+_consolidation_stats = dict(consolidations=0, blocks_merged=0, bytes_copied=0)
+
+
+def consolidation_stats(reset=False):
+    """
+    Return the number of consolidations done, and of blocks merged and bytes
+    copied by them, as a dict
+
+    Parameters
+    ----------
+    reset : boolean, default False
+        Reset the counters to zero after reading them
+
+    Returns
+    -------
+    stats : dict
+    """
+    stats = dict(_consolidation_stats)
+    if reset:
+        for k in _consolidation_stats:
+            _consolidation_stats[k] = 0
+    return stats
+
+
 class Block(PandasObject):
 
     """
@@ -275,7 +368,12 @@ class Block(PandasObject):
 
         new_items = new_ref_items
         if indexer is None:
-            new_values = self.values.copy() if copy else self.values
+            new_values = self.values
+            if copy:
+                if _copy_on_write:
+                    _share_values(new_values)
+                else:
+                    new_values = new_values.copy()
 
         else:
 
@@ -290,8 +388,17 @@ class Block(PandasObject):
 
                 masked_idx = indexer[indexer != -1]
                 new_items = self.items.take(masked_idx)
-                new_values = com.take_nd(self.values, masked_idx, axis=0,
-                                         allow_fill=False)
+
+                # a run of consecutive items (e.g. a whole block selected by
+                # df[[...]]) is a view, shared under copy-on-write
+                if (_copy_on_write and not needs_fill and len(masked_idx) and
+                        (np.diff(masked_idx) == 1).all()):
+                    start = masked_idx[0]
+                    new_values = self.values[start:start + len(masked_idx)]
+                    _share_values(new_values)
+                else:
+                    new_values = com.take_nd(self.values, masked_idx, axis=0,
+                                             allow_fill=False)
         # fill if needed
         if needs_fill:
             new_values = com.interpolate_2d(new_values, method=method,
@@ -313,6 +420,20 @@ class Block(PandasObject):
     def iget(self, i):
         return self.values[i]
 
+    def unshare(self):
+        """
+        Make my values private if they are shared with another block through
+        copy-on-write, before modifying them in place
+
+        Returns
+        -------
+        copied : boolean
+        """
+        if self.is_sparse or not _is_shared(self.values):
+            return False
+        self.values = self.values.copy()
+        return True
+
     def set(self, item, value, check=False):
         """
         Modify Block in-place with new item value
@@ -322,6 +443,7 @@ class Block(PandasObject):
         None
         """
         loc = self.items.get_loc(item)
+        self.unshare()
         self.values[loc] = value
 
     def delete(self, item):
@@ -491,6 +613,31 @@ class Block(PandasObject):
 
         return [self.copy()] if copy else [self]
 
+    def compact(self, integers=False, copy=True):
+        """ store the items in the smallest dtypes that hold their values
+            exactly, integers only if integers; return a list of blocks
+            by default the values are kept as they are """
+
+        return [self.copy()] if copy else [self]
+
+    def _split_by_dtypes(self, dtypes, copy=True):
+        """ cast each item to its dtype in the list of dtypes, making one
+            block for the items of each dtype """
+
+        if all(dtype == self.dtype for dtype in dtypes):
+            return [self.copy()] if copy else [self]
+
+        is_unique = self.items.is_unique
+        blocks = []
+        for dtype in sorted(set(dtypes), key=lambda x: x.str):
+            locs = [i for i, d in enumerate(dtypes) if d == dtype]
+            values = self.values[locs].astype(dtype)
+            placement = None if is_unique else self.ref_locs[locs]
+            blocks.append(make_block(values, self.items.take(locs),
+                                     self.ref_items, ndim=self.ndim,
+                                     placement=placement))
+        return blocks
+
     def prepare_for_merge(self, **kwargs):
         """ a regular block is ok to merge as is """
         return self
@@ -584,7 +731,10 @@ class Block(PandasObject):
     def copy(self, deep=True, ref_items=None):
         values = self.values
         if deep:
-            values = values.copy()
+            if _copy_on_write and not self.is_sparse:
+                _share_values(values)
+            else:
+                values = values.copy()
         if ref_items is None:
             ref_items = self.ref_items
         return make_block(values, self.items, ref_items, ndim=self.ndim,
@@ -618,6 +768,7 @@ class Block(PandasObject):
         """
 
         # coerce args
+        self.unshare()
         values, value = self._try_coerce_args(self.values, value)
         arr_value = np.array(value)
 
@@ -700,6 +851,8 @@ class Block(PandasObject):
         a new block(s), the result of the putmask
         """
 
+        if inplace:
+            self.unshare()
         new_values = self.values if inplace else self.values.copy()
 
         # may need to align the new
@@ -881,6 +1034,8 @@ class Block(PandasObject):
                     return [self.copy()]
 
         fill_value = self._try_fill(fill_value)
+        if inplace:
+            self.unshare()
         values = self.values if inplace else self.values.copy()
         values = self._try_operate(values)
         values = com.interpolate_2d(values,
@@ -901,6 +1056,8 @@ class Block(PandasObject):
                      inplace=False, downcast=None, **kwargs):
         """ interpolate using scipy wrappers """
 
+        if inplace:
+            self.unshare()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -1253,6 +1410,17 @@ class FloatBlock(FloatOrComplexBlock):
         return (issubclass(value.dtype.type, np.floating) and
                 value.dtype == self.dtype)
 
+    def compact(self, integers=False, copy=True):
+        """ use float32 for the items that it represents exactly """
+        if self.dtype.itemsize <= 4 or not self.values.size:
+            return Block.compact(self, copy=copy)
+
+        values = self.values.reshape(len(self.items), -1)
+        exact = ((values.astype(np.float32) == values) |
+                 np.isnan(values)).all(axis=1)
+        dtypes = [np.dtype(np.float32) if x else self.dtype for x in exact]
+        return self._split_by_dtypes(dtypes, copy=copy)
+
 
 class ComplexBlock(FloatOrComplexBlock):
     is_complex = True
@@ -1293,6 +1461,22 @@ class IntBlock(NumericBlock):
     def should_store(self, value):
         return com.is_integer_dtype(value) and value.dtype == self.dtype
 
+    def compact(self, integers=False, copy=True):
+        """ use the smallest integer dtype holding the range of each item;
+            arithmetic in that dtype wraps around on overflow, so this is
+            only done if integers """
+        if not integers or self.is_timedelta or not self.values.size:
+            return Block.compact(self, copy=copy)
+
+        values = self.values.reshape(len(self.items), -1)
+        dtypes = []
+        for lo, hi in zip(values.min(axis=1), values.max(axis=1)):
+            dtype = _smallest_int_dtype(lo, hi)
+            if dtype is None or dtype.itemsize >= self.dtype.itemsize:
+                dtype = self.dtype
+            dtypes.append(dtype)
+        return self._split_by_dtypes(dtypes, copy=copy)
+
 
 class TimeDeltaBlock(IntBlock):
     is_timedelta = True
@@ -1440,6 +1624,9 @@ class ObjectBlock(Block):
         blocks = []
         if by_item and not self._is_single_block:
 
+            # convert each item, then make one block per resulting dtype
+            dtypes = []
+            converted = {}
             for i, c in enumerate(self.items):
                 values = self.iget(i)
 
@@ -1448,9 +1635,18 @@ class ObjectBlock(Block):
                     convert_numeric=convert_numeric,
                     convert_timedeltas=convert_timedeltas,
                 ).reshape(values.shape)
-                values = _block_shape(values, ndim=self.ndim)
-                items = self.items.take([i])
-                placement = None if is_unique else [i]
+                if values.dtype not in converted:
+                    dtypes.append(values.dtype)
+                    converted[values.dtype] = []
+                converted[values.dtype].append((i, values))
+
+            for dtype in dtypes:
+                locs = [i for i, _ in converted[dtype]]
+                values = np.empty((len(locs),) + self.shape[1:], dtype=dtype)
+                for j, (_, v) in enumerate(converted[dtype]):
+                    values[j] = v
+                items = self.items.take(locs)
+                placement = None if is_unique else locs
                 newb = make_block(values, items, self.ref_items,
                                   ndim=self.ndim, placement=placement)
                 blocks.append(newb)
@@ -1476,6 +1672,7 @@ class ObjectBlock(Block):
         """
 
         loc = self.items.get_loc(item)
+        self.unshare()
 
         # GH6026
         if check:
@@ -1592,6 +1789,8 @@ class ObjectBlock(Block):
                 result = [result]
             return result
 
+        if inplace:
+            self.unshare()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -1695,6 +1894,8 @@ class DatetimeBlock(Block):
                inplace=False, downcast=None):
 
         # straight putmask here
+        if inplace:
+            self.unshare()
         values = self.values if inplace else self.values.copy()
         mask = isnull(self.values)
         value = self._try_fill(value)
@@ -1758,6 +1959,7 @@ class DatetimeBlock(Block):
         if value.dtype != _NS_DTYPE:
             value = tslib.cast_to_nanoseconds(value)
 
+        self.unshare()
         self.values[loc] = value
 
     def get_values(self, dtype=None):
@@ -2090,8 +2292,9 @@ class BlockManager(PandasObject):
     -----
     This is *not* a public API class
     """
-    __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
-                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map']
+    __slots__ = ['axes', '_blocks', '_ndim', '_shape', '_known_consolidated',
+                 '_is_consolidated', '_has_sparse', '_ref_locs', '_items_map',
+                 '_blknos', '_blklocs', '_xs_indexers']
 
     def __init__(self, blocks, axes, do_integrity_check=True, fastpath=True):
         self.axes = [_ensure_index(ax) for ax in axes]
@@ -2313,6 +2516,123 @@ class BlockManager(PandasObject):
         self._items_map = im
         return im
 
+    def _get_blocks(self):
+        return self._blocks
+
+    def _set_blocks(self, blocks):
+        # a new list of blocks is placed from scratch when next needed
+        self._blocks = blocks
+        self._reset_placement()
+
+    blocks = property(fget=_get_blocks, fset=_set_blocks)
+
+    def _get_placement(self, build=True):
+        """
+        return the integer placement of the items as a tuple of arrays
+        (blknos, blklocs): for each item location, the number of the block
+        holding it and the location of the item inside that block
+
+        the arrays are built when the blocks are set and kept up to date by
+        insert, delete and set; returns None if the items cannot be placed
+        (e.g. null labels that the index cannot look up), or if build=False
+        and the arrays are not built
+        """
+        blknos = getattr(self, '_blknos', None)
+        if blknos is not None:
+            return blknos, self._blklocs
+
+        if not build:
+            return None
+
+        items = self.items
+        n = len(items)
+        blknos = np.empty(n, dtype=np.int64)
+        blknos.fill(-1)
+        blklocs = np.empty(n, dtype=np.int64)
+
+        if items.is_unique:
+            for blkno, blk in enumerate(self.blocks):
+                indexer = items.get_indexer(blk.items)
+                if (indexer == -1).any():
+                    return None
+                blknos[indexer] = blkno
+                blklocs[indexer] = np.arange(len(indexer))
+
+        else:
+            ref_locs = self._set_ref_locs()
+            if ref_locs is None:
+                return None
+            blknos_map = dict((id(blk), blkno)
+                              for blkno, blk in enumerate(self.blocks))
+            for i, v in enumerate(ref_locs):
+                if v is None or id(v[0]) not in blknos_map:
+                    return None
+                blknos[i] = blknos_map[id(v[0])]
+                blklocs[i] = v[1]
+
+        if (blknos == -1).any():
+            return None
+
+        self._set_placement(blknos, blklocs)
+        return blknos, blklocs
+
+    def _get_block_indexers(self):
+        """
+        return a list holding, for each block, the locations of its items in
+        the items; cached along with the placement arrays, returns None if
+        the items cannot be placed
+        """
+        placement = self._get_placement()
+        if placement is None:
+            return None
+        blknos = placement[0]
+
+        cached = getattr(self, '_xs_indexers', None)
+        if cached is not None:
+            return cached
+
+        order = blknos.argsort(kind='mergesort')
+        if len(order):
+            counts = np.bincount(blknos, minlength=len(self.blocks))
+            indexers = np.split(order, counts.cumsum()[:-1])
+        else:
+            # no items; bincount of an empty array fails on older numpy
+            indexers = [order] * len(self.blocks)
+        self._xs_indexers = indexers
+        return indexers
+
+    def _set_placement(self, blknos, blklocs):
+        """ set the placement arrays of the items """
+        self._blknos = blknos
+        self._blklocs = blklocs
+        self._xs_indexers = None
+
+    def _reset_placement(self):
+        """ drop the placement arrays, to be rebuilt when next needed """
+        self._set_placement(None, None)
+
+    def _place_deleted(self, blkno, block, mask):
+        """
+        update the placement arrays after the block blkno was removed from
+        the blocks, and the items of block kept by the boolean mask were
+        appended as the blocks made by the ranges of com.split_ranges(mask)
+
+        the locations of the deleted items are left with the block number -1
+        """
+        blknos, blklocs = self._blknos, self._blklocs
+        in_block = np.flatnonzero(blknos == blkno)
+        blknos[blknos > blkno] -= 1
+        blknos[in_block] = -1
+
+        locs = blklocs[in_block]
+        newno = len(self.blocks) - 1
+        for s, e in com.split_ranges(mask):
+            newno += 1
+            sel = in_block[(locs >= s) & (locs < e)]
+            blknos[sel] = newno
+            blklocs[sel] -= s
+        self._xs_indexers = None
+
     # make items read only for now
     def _get_items(self):
         return self.axes[0]
@@ -2449,6 +2769,8 @@ class BlockManager(PandasObject):
                 result_blocks.extend(applied)
             else:
                 result_blocks.append(applied)
+        if _allocation_tracker is not None:
+            _record_allocation(f, result_blocks, self.blocks)
         if len(result_blocks) == 0:
             return self.make_empty(axes or self.axes)
         bm = self.__class__(result_blocks, axes or self.axes,
@@ -2487,11 +2809,76 @@ class BlockManager(PandasObject):
         return self.apply('downcast', **kwargs)
 
     def astype(self, dtype, **kwargs):
+        if isinstance(dtype, dict):
+            return self._astype_items(dtype, **kwargs)
         return self.apply('astype', dtype=dtype, **kwargs)
 
+    def _astype_items(self, dtypes, copy=True, raise_on_error=True):
+        """
+        cast the items that are keys of the dtypes dict to their dtype,
+        forming the new blocks in one go rather than casting each item to a
+        block of its own that has to be consolidated afterwards; the blocks
+        holding none of these items are passed through (copied if copy)
+        """
+        missing = [item for item in dtypes if item not in self.items]
+        if missing:
+            raise KeyError('items %s are not in the items axis' % missing)
+
+        def _cast(values, item):
+            try:
+                return com._astype_nansafe(values, dtypes[item], copy=copy)
+            except:
+                if raise_on_error is True:
+                    raise
+                return values
+
+        # duplicate items are placed by the block manager from the arrays,
+        # which it stacks, hence copies
+        if not self.items.is_unique:
+            arrays = []
+            for i, item in enumerate(self.items):
+                values = self.iget(i)
+                if item in dtypes:
+                    values = _cast(values, item)
+                arrays.append(values)
+            return create_block_manager_from_arrays(arrays, self.items,
+                                                    self.axes)
+
+        new_blocks = []
+        cast_items = []
+        cast_arrays = []
+        for blk in self.blocks:
+            mask = np.array([item in dtypes for item in blk.items],
+                            dtype=bool)
+            if not mask.any():
+                new_blocks.append(blk.copy(deep=copy))
+                continue
+            if not mask.all():
+                new_blocks.append(make_block(blk.values[-mask],
+                                             blk.items[-mask], self.items,
+                                             fastpath=True))
+            for j in mask.nonzero()[0]:
+                item = blk.items[j]
+                cast_items.append(item)
+                cast_arrays.append(_cast(blk.iget(j), item))
+
+        # forming the blocks stacks, hence copies, the cast items
+        cast_items = Index(cast_items)
+        for blk in form_blocks(cast_arrays, cast_items,
+                               [cast_items] + self.axes[1:]):
+            blk.ref_items = self.items
+            new_blocks.append(blk)
+
+        mgr = self.__class__(new_blocks, self.axes)
+        mgr._consolidate_inplace()
+        return mgr
+
     def convert(self, **kwargs):
         return self.apply('convert', **kwargs)
 
+    def compact(self, **kwargs):
+        return self.apply('compact', **kwargs)
+
     def replace(self, **kwargs):
         return self.apply('replace', **kwargs)
 
@@ -2783,6 +3170,28 @@ class BlockManager(PandasObject):
         return self.apply('copy', axes=new_axes, deep=deep,
                           ref_items=new_axes[0], do_integrity_check=False)
 
+    def unshare(self, item=None):
+        """
+        Make the values of the block holding item (or of all blocks if item
+        is None) private, if they are shared through copy-on-write; any view
+        of the old values (e.g. a cached column) is then stale
+
+        Returns
+        -------
+        copied : boolean
+        """
+        if not len(_shared_values):
+            return False
+        if item is None:
+            blocks = self.blocks
+        else:
+            blocks = [self._find_block(item)[1]]
+        copied = False
+        for blk in blocks:
+            if blk.unshare():
+                copied = True
+        return copied
+
     def as_matrix(self, items=None):
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
@@ -2834,6 +3243,9 @@ class BlockManager(PandasObject):
         if not itemmask.all():
             raise AssertionError('Some items were not contained in blocks')
 
+        if _allocation_tracker is not None:
+            _allocation_tracker.record('interleave', result.nbytes)
+
         return result
 
     def xs(self, key, axis=1, copy=True, takeable=False):
@@ -2899,6 +3311,22 @@ class BlockManager(PandasObject):
 
         items = self.items
 
+        # gather the row from each block with one take per block
+        indexers = None
+        if self.ndim == 2 and not self._has_sparse:
+            indexers = self._get_block_indexers()
+        if indexers is not None:
+            blknos, blklocs = self._get_placement()
+            dtype = _interleaved_dtype(self.blocks)
+            result = np.empty(len(items), dtype=dtype)
+            for blk, indexer in zip(self.blocks, indexers):
+                values = blk.values[blklocs[indexer], loc]
+                if (dtype == np.object_ and
+                        (blk.is_datetime or blk.is_timedelta)):
+                    values = [blk._try_coerce_result(v) for v in values]
+                result[indexer] = values
+            return result, True
+
         # non-unique (GH4726)
         if not items.is_unique:
             result = self._interleave(items)
@@ -2984,6 +3412,14 @@ class BlockManager(PandasObject):
             return mgr
 
     def iget(self, i):
+
+        placement = self._get_placement()
+        if placement is not None:
+            blknos, blklocs = placement
+            blk = self.blocks[blknos[i]]
+            if not blk.is_sparse:
+                return blk.iget(blklocs[i])
+
         item = self.items[i]
 
         # unique
@@ -3036,6 +3472,16 @@ class BlockManager(PandasObject):
         new_items = self.items.delete(loc)
         self.set_items_norename(new_items)
 
+        # drop the deleted items from the placement arrays
+        placement = self._get_placement(build=False)
+        if placement is not None:
+            blknos, blklocs = placement
+            kept = blknos != -1
+            if kept.sum() == len(new_items):
+                self._set_placement(blknos[kept], blklocs[kept])
+            else:
+                self._reset_placement()
+
         self._known_consolidated = False
 
         if not is_unique:
@@ -3060,6 +3506,18 @@ class BlockManager(PandasObject):
                 # delete from block, create and append new block
                 self._delete_from_block(i, item)
                 self._add_new_block(item, arr, loc=None)
+
+                # the item now lives alone in the appended block
+                placement = self._get_placement(build=False)
+                if placement is not None:
+                    loc = self.items.get_loc(item)
+                    if com.is_integer(loc):
+                        blknos, blklocs = placement
+                        blknos[loc] = len(self.blocks) - 1
+                        blklocs[loc] = 0
+                        self._xs_indexers = None
+                    else:
+                        self._reset_placement()
             else:
                 block.set(item, arr, check=check)
 
@@ -3113,6 +3571,8 @@ class BlockManager(PandasObject):
             # Should this be a different kind of error??
             raise ValueError('cannot insert %s, already exists' % item)
 
+        nblocks = len(self.blocks)
+
         try:
             new_items = self.items.insert(loc, item)
             self.set_items_norename(new_items)
@@ -3126,11 +3586,12 @@ class BlockManager(PandasObject):
             # GH 3010
             new_items = self.items.delete(loc)
             self.set_items_norename(new_items)
+            self._reset_placement()
 
             # re-raise
             raise
 
-        if len(self.blocks) > 100:
+        if _consolidation_due(self.blocks):
             self._consolidate_inplace()
 
         self._known_consolidated = False
@@ -3139,6 +3600,13 @@ class BlockManager(PandasObject):
         if loc != len(self.items) - 1 and new_items.is_unique:
             self.set_items_clear(new_items)
 
+        # the new block was appended, unless consolidating reset the blocks
+        placement = self._get_placement(build=False)
+        if placement is not None:
+            blknos, blklocs = placement
+            self._set_placement(np.insert(blknos, loc, nblocks),
+                                np.insert(blklocs, loc, 0))
+
     def set_items_norename(self, value):
         self.set_axis(0, value, maybe_rename=False, check_axis=False)
         self._shape = None
@@ -3189,6 +3657,13 @@ class BlockManager(PandasObject):
                 mask[loc] = False
             else:  # already a mask, inverted
                 mask = -loc
+        else:
+            mask = np.zeros(len(block), dtype=bool)
+
+        if self._get_placement(build=False) is not None:
+            self._place_deleted(i, block, mask)
+
+        if block._can_consolidate:
 
             # split the block
             counter = 0
@@ -3266,6 +3741,18 @@ class BlockManager(PandasObject):
 
     def _find_block(self, item):
         self._check_have(item)
+
+        # a single location can be looked up in the placement arrays
+        try:
+            loc = self.items.get_loc(item)
+        except (KeyError, TypeError):
+            loc = None
+        if com.is_integer(loc):
+            placement = self._get_placement()
+            if placement is not None:
+                blkno = placement[0][loc]
+                return blkno, self.blocks[blkno]
+
         for i, block in enumerate(self.blocks):
             if item in block:
                 return i, block
@@ -3334,6 +3821,9 @@ class BlockManager(PandasObject):
                 indexer, axis=axis, fill_value=fill_value)
             new_blocks.append(newb)
 
+        if _allocation_tracker is not None:
+            _record_allocation('reindex', new_blocks, self.blocks)
+
         new_axes = list(self.axes)
         new_axes[axis] = new_axis
         return self.__class__(new_blocks, new_axes)
@@ -3403,6 +3893,9 @@ class BlockManager(PandasObject):
                 new_blocks.append(na_block)
                 new_blocks = _consolidate(new_blocks, new_items)
 
+        if _allocation_tracker is not None:
+            _record_allocation('reindex', new_blocks, self.blocks)
+
         return self.__class__(new_blocks, new_axes)
 
     def reindex_items(self, new_items, indexer=None, copy=True,
@@ -3613,7 +4106,10 @@ class BlockManager(PandasObject):
 
     @property
     def block_id_vector(self):
-        # TODO
+        placement = self._get_placement()
+        if placement is not None:
+            return placement[0].astype(int)
+
         result = np.empty(len(self.items), dtype=int)
         result.fill(-1)
 
@@ -3656,8 +4152,7 @@ class SingleBlockManager(BlockManager):
     ndim = 1
     _is_consolidated = True
     _known_consolidated = True
-    __slots__ = ['axes', 'blocks', '_block',
-                 '_values', '_shape', '_has_sparse']
+    __slots__ = ['axes', '_block', '_values', '_shape', '_has_sparse']
 
     def __init__(self, block, axis, do_integrity_check=False, fastpath=True):
 
@@ -3728,6 +4223,9 @@ class SingleBlockManager(BlockManager):
         ssee also BlockManager.apply
         """
         applied = getattr(self._block, f)(**kwargs)
+        if _allocation_tracker is not None:
+            _record_allocation(f, applied if isinstance(applied, list)
+                               else [applied], [self._block])
         bm = self.__class__(applied, axes or self.axes,
                             do_integrity_check=do_integrity_check)
         bm._consolidate_inplace()
@@ -3743,6 +4241,8 @@ class SingleBlockManager(BlockManager):
                                                method=method,
                                                fill_value=fill_value,
                                                limit=limit, copy=copy)
+        if _allocation_tracker is not None:
+            _record_allocation('reindex', [block], [self._block])
         mgr = SingleBlockManager(block, new_axis)
         mgr._consolidate_inplace()
         return mgr
@@ -3829,6 +4329,12 @@ class SingleBlockManager(BlockManager):
     def _consolidate_inplace(self):
         pass
 
+    def unshare(self, item=None):
+        copied = super(SingleBlockManager, self).unshare(item)
+        if copied:
+            self._values = self._block.values
+        return copied
+
     def fast_xs(self, loc, copy=False):
         """
         fast path for getting a cross-section
@@ -3836,6 +4342,66 @@ class SingleBlockManager(BlockManager):
         result = self._block.values[loc]
         return result, False
 
+
+class AllocationTracker(object):
+
+    """
+    Record the bytes of block data allocated by BlockManager operations
+
+    The block operations (under the name of the block method, such as
+    'copy' or 'fillna'), the consolidations, reindexing and interleaving of
+    the blocks are recorded; values are counted as allocated if they do not
+    share memory with the values of the blocks operated on.
+
+    Use through ``track_allocations``
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, name, nbytes):
+        self.records.append((name, nbytes))
+
+    @property
+    def total(self):
+        return sum(nbytes for _, nbytes in self.records)
+
+    def summary(self):
+        """
+        Return a DataFrame of the number of calls and bytes allocated per
+        operation, largest allocations first
+        """
+        from pandas.core.frame import DataFrame
+        df = DataFrame(self.records, columns=['operation', 'bytes'])
+        df['calls'] = 1
+        result = df.groupby('operation')[['calls', 'bytes']].sum()
+        return result.sort_index(by='bytes', ascending=False)
+
+
+class track_allocations(object):
+
+    """
+    Context manager recording the bytes allocated by the BlockManager
+    operations run inside it
+
+    Examples
+    --------
+    >>> with track_allocations() as tracker:
+    ...     df2 = df.fillna(0).T
+    >>> tracker.summary()
+    """
+
+    def __enter__(self):
+        global _allocation_tracker
+        self.previous = _allocation_tracker
+        _allocation_tracker = AllocationTracker()
+        return _allocation_tracker
+
+    def __exit__(self, *args):
+        global _allocation_tracker
+        _allocation_tracker = self.previous
+
+
 def construction_error(tot_items, block_shape, axes, e=None):
     """ raise a helpful message about our construction """
     passed = tuple(map(int, [tot_items] + list(block_shape)))
@@ -4147,10 +4713,51 @@ def _interleaved_dtype(blocks):
         return _lcd_dtype(counts[FloatBlock] + counts[SparseBlock])
 
 
+_INT_DTYPES = [np.dtype(x) for x in ['int8', 'uint8', 'int16', 'uint16',
+                                     'int32', 'uint32', 'int64', 'uint64']]
+
+
+def _smallest_int_dtype(lo, hi):
+    """ the smallest integer dtype holding values from lo to hi, preferring
+        signed dtypes; None if there is none """
+    for dtype in _INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return None
+
+
+def _consolidation_due(blocks):
+    """
+    Return True if blocks fragmented by inserting items should be
+    consolidated: there are more than mode.consolidation_threshold blocks and
+    the items outside of the largest block of each dtype amount to at least
+    mode.consolidation_growth times the items in those blocks, so that the
+    cost of consolidating stays proportional to the items inserted
+    """
+    if len(blocks) <= _consolidation_threshold:
+        return False
+
+    largest = {}
+    nitems = 0
+    for blk in blocks:
+        if not blk._can_consolidate:
+            continue
+        n = len(blk.items)
+        nitems += n
+        key = blk._consolidate_key
+        if n > largest.get(key, 0):
+            largest[key] = n
+
+    consolidated = sum(largest.values())
+    return nitems - consolidated >= _consolidation_growth * consolidated
+
+
 def _consolidate(blocks, items):
     """
     Merge blocks having same dtype, exclude non-consolidating blocks
     """
+    _consolidation_stats['consolidations'] += 1
 
     # sort by _can_consolidate, dtype
     gkey = lambda x: x._consolidate_key
@@ -4165,6 +4772,9 @@ def _consolidate(blocks, items):
         else:
             new_blocks.append(merged_blocks)
 
+    if _allocation_tracker is not None:
+        _record_allocation('consolidate', new_blocks, blocks)
+
     return new_blocks
 
 
@@ -4186,15 +4796,28 @@ def _merge_blocks(blocks, items, dtype=None, _can_consolidate=True):
                 raise AssertionError("_merge_blocks are invalid!")
             dtype = blocks[0].dtype
 
+        _consolidation_stats['blocks_merged'] += len(blocks)
+
+        # unique, place the items of each block directly in items order
+        if items.is_unique:
+            indexers = [items.get_indexer(b.items) for b in blocks]
+            if not any((indexer == -1).any() for indexer in indexers):
+                new_values, new_items = _stack_in_order(blocks, indexers,
+                                                        items, dtype)
+                _consolidation_stats['bytes_copied'] += new_values.nbytes
+                return make_block(new_values, new_items, items)
+
         if not items.is_unique:
             blocks = sorted(blocks, key=lambda b: b.ref_locs.tolist())
 
         new_values = _vstack([b.values for b in blocks], dtype)
         new_items = blocks[0].items.append([b.items for b in blocks[1:]])
         new_block = make_block(new_values, new_items, items)
+        _consolidation_stats['bytes_copied'] += new_values.nbytes
 
         # unique, can reindex
         if items.is_unique:
+            _consolidation_stats['bytes_copied'] += new_values.nbytes
             return new_block.reindex_items_from(items)
 
         # merge the ref_locs
@@ -4216,6 +4839,38 @@ def _block_shape(values, ndim=1, shape=None):
     return values
 
 
+def _stack_in_order(blocks, indexers, items, dtype):
+    """
+    Stack the values of blocks, whose items are at the indexers locations of
+    items, with their rows in items order, copying the values only once
+
+    Returns
+    -------
+    (new_values, new_items)
+    """
+    indexer = np.concatenate(indexers)
+    order = indexer.argsort(kind='mergesort')
+    rank = np.empty(len(indexer), dtype=np.int64)
+    rank[order] = np.arange(len(indexer))
+
+    # work around NumPy 1.6 bug, as in _vstack
+    dtype = np.dtype(dtype)
+    is_datelike = dtype == _NS_DTYPE or dtype == _TD_DTYPE
+    shape = (len(indexer),) + blocks[0].shape[1:]
+    new_values = np.empty(shape, dtype='i8' if is_datelike else dtype)
+
+    start = 0
+    for blk in blocks:
+        stop = start + len(blk.items)
+        values = blk.values.view('i8') if is_datelike else blk.values
+        new_values[rank[start:stop]] = values
+        start = stop
+
+    if is_datelike:
+        new_values = new_values.view(dtype)
+    return new_values, items.take(indexer[order])
+
+
 def _vstack(to_stack, dtype):
 
     # work around NumPy 1.6 bug
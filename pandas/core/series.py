@@ -587,6 +587,11 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             return self.values[indexer]
 
     def __setitem__(self, key, value):
+
+        # values shared by a copy-on-write copy are written to directly below
+        self._data.unshare()
+        self._clear_cacher_grouper_cache()
+
         try:
             self._set_with_engine(key, value)
             return
@@ -763,6 +768,8 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             otherwise a new object
         """
         try:
+            self._data.unshare()
+            self._clear_cacher_grouper_cache()
             if takeable:
                 self.values[label] = value
             else:
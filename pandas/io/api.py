@@ -11,5 +11,6 @@ from pandas.io.html import read_html
 from pandas.io.sql import read_sql
 from pandas.io.stata import read_stata
 from pandas.io.pickle import read_pickle, to_pickle
+from pandas.io.memmap import read_mmap, to_mmap
 from pandas.io.packers import read_msgpack, to_msgpack
 from pandas.io.gbq import read_gbq
@@ -11,6 +11,8 @@ import numpy as np
 
 from pandas.io.parsers import TextParser
 from pandas.tseries.period import Period
+from pandas.tslib import Timestamp
+import pandas.tslib as tslib
 from pandas import json
 from pandas.compat import map, zip, reduce, range, lrange, u, add_metaclass
 from pandas.core import config
@@ -56,8 +58,9 @@ def read_excel(io, sheetname=0, **kwds):
     ----------
     io : string, file-like object or xlrd workbook
         If a string, expected to be a path to xls or xlsx file
-    sheetname : string or int, default 0
-        Name of Excel sheet or the page number of the sheet
+    sheetname : string, int or list, default 0
+        Name of Excel sheet or the page number of the sheet. If a list of
+        these is passed, a dict of DataFrames keyed by them is returned
     header : int, default 0
         Row to use for the column labels of the parsed DataFrame
     skiprows : list-like
@@ -94,7 +97,7 @@ def read_excel(io, sheetname=0, **kwds):
 
     Returns
     -------
-    parsed : DataFrame
+    parsed : DataFrame or dict of DataFrames
         DataFrame from the passed in Excel file
     """
     if 'kind' in kwds:
@@ -155,8 +158,9 @@ class ExcelFile(object):
 
         Parameters
         ----------
-        sheetname : string or integer
-            Name of Excel sheet or the page number of the sheet
+        sheetname : string, integer or list
+            Name of Excel sheet or the page number of the sheet. If a list of
+            these is passed, a dict of DataFrames keyed by them is returned
         header : int, default 0
             Row to use for the column labels of the parsed DataFrame
         skiprows : list-like
@@ -200,6 +204,22 @@ class ExcelFile(object):
         if skipfooter is not None:
             skip_footer = skipfooter
 
+        if isinstance(sheetname, (list, tuple)):
+            return dict((name, self.parse(sheetname=name, header=header,
+                                          skiprows=skiprows,
+                                          skip_footer=skip_footer,
+                                          index_col=index_col,
+                                          parse_cols=parse_cols,
+                                          parse_dates=parse_dates,
+                                          date_parser=date_parser,
+                                          na_values=na_values,
+                                          thousands=thousands,
+                                          chunksize=chunksize,
+                                          convert_float=convert_float,
+                                          has_index_names=has_index_names,
+                                          **kwds))
+                        for name in sheetname)
+
         return self._parse_excel(sheetname=sheetname, header=header,
                                  skiprows=skiprows,
                                  index_col=index_col,
@@ -213,31 +233,6 @@ class ExcelFile(object):
                                  **kwds)
 
     def _should_parse(self, i, parse_cols):
-
-        def _range2cols(areas):
-            """
-            Convert comma separated list of column names and column ranges to a
-            list of 0-based column indexes.
-
-            >>> _range2cols('A:E')
-            [0, 1, 2, 3, 4]
-            >>> _range2cols('A,C,Z:AB')
-            [0, 2, 25, 26, 27]
-            """
-            def _excel2num(x):
-                "Convert Excel column name like 'AB' to 0-based column index"
-                return reduce(lambda s, a: s * 26 + ord(a) - ord('A') + 1,
-                              x.upper().strip(), 0) - 1
-
-            cols = []
-            for rng in areas.split(','):
-                if ':' in rng:
-                    rng = rng.split(':')
-                    cols += lrange(_excel2num(rng[0]), _excel2num(rng[1]) + 1)
-                else:
-                    cols.append(_excel2num(rng))
-            return cols
-
         if isinstance(parse_cols, int):
             return i <= parse_cols
         elif isinstance(parse_cols, compat.string_types):
@@ -250,47 +245,27 @@ class ExcelFile(object):
                      parse_dates=False, date_parser=None, na_values=None,
                      thousands=None, chunksize=None, convert_float=True,
                      **kwds):
-        from xlrd import (xldate_as_tuple, XL_CELL_DATE,
-                          XL_CELL_ERROR, XL_CELL_BOOLEAN,
-                          XL_CELL_NUMBER)
-
         datemode = self.book.datemode
         if isinstance(sheetname, compat.string_types):
             sheet = self.book.sheet_by_name(sheetname)
         else:  # assume an integer if not a string
             sheet = self.book.sheet_by_index(sheetname)
 
-        data = []
-        should_parse = {}
-        for i in range(sheet.nrows):
-            row = []
-            for j, (value, typ) in enumerate(zip(sheet.row_values(i),
-                                                 sheet.row_types(i))):
-                if parse_cols is not None and j not in should_parse:
-                    should_parse[j] = self._should_parse(j, parse_cols)
-
-                if parse_cols is None or should_parse[j]:
-                    if typ == XL_CELL_DATE:
-                        dt = xldate_as_tuple(value, datemode)
-                        # how to produce this first case?
-                        if dt[0] < datetime.MINYEAR:  # pragma: no cover
-                            value = datetime.time(*dt[3:])
-                        else:
-                            value = datetime.datetime(*dt)
-                    elif typ == XL_CELL_ERROR:
-                        value = np.nan
-                    elif typ == XL_CELL_BOOLEAN:
-                        value = bool(value)
-                    elif convert_float and typ == XL_CELL_NUMBER:
-                        # GH5394 - Excel 'numbers' are always floats
-                        # it's a minimal perf hit and less suprising
-                        val = int(value)
-                        if val == value:
-                            value = val
-
-                    row.append(value)
-
-            data.append(row)
+        # only the columns that are parsed are pulled out of the sheet, and
+        # each of them is converted as a whole rather than cell by cell
+        if isinstance(parse_cols, compat.string_types):
+            parse_cols = _range2cols(parse_cols)
+        cols = [j for j in range(sheet.ncols)
+                if parse_cols is None or self._should_parse(j, parse_cols)]
+        columns = [_convert_excel_column(sheet.col_values(j),
+                                         sheet.col_types(j),
+                                         datemode, convert_float)
+                   for j in cols]
+
+        if columns:
+            data = [list(row) for row in zip(*columns)]
+        else:
+            data = [[] for i in range(sheet.nrows)]
 
         if header is not None:
             data[header] = _trim_excel_header(data[header])
@@ -324,6 +299,112 @@ class ExcelFile(object):
         self.close()
 
 
+def _range2cols(areas):
+    """
+    Convert comma separated list of column names and column ranges to a
+    list of 0-based column indexes.
+
+    >>> _range2cols('A:E')
+    [0, 1, 2, 3, 4]
+    >>> _range2cols('A,C,Z:AB')
+    [0, 2, 25, 26, 27]
+    """
+    def _excel2num(x):
+        "Convert Excel column name like 'AB' to 0-based column index"
+        return reduce(lambda s, a: s * 26 + ord(a) - ord('A') + 1,
+                      x.upper().strip(), 0) - 1
+
+    cols = []
+    for rng in areas.split(','):
+        if ':' in rng:
+            rng = rng.split(':')
+            cols += lrange(_excel2num(rng[0]), _excel2num(rng[1]) + 1)
+        else:
+            cols.append(_excel2num(rng))
+    return cols
+
+
+# first day of the 1900 and 1904 date systems, as Excel serial 0
+_xl_epochs = {0: datetime.datetime(1899, 12, 30),
+              1: datetime.datetime(1904, 1, 1)}
+
+
+def _xldates_to_datetime(xldates, datemode):
+    """
+    Convert an array of Excel date serials to datetime.datetime objects
+    (datetime.time for time-only values), as xlrd.xldate_as_tuple would
+    """
+    from xlrd import xldate_as_tuple
+    from xlrd.xldate import XLDateAmbiguous
+
+    epoch = _xl_epochs[datemode]
+    days = np.floor(xldates)
+    seconds = np.round((xldates - days) * 86400.0)
+
+    # The 1900 date system counts the non-existent 1900-02-29 (serial 60), so
+    # xlrd refuses the dates up to there.
+    if datemode == 0:
+        ambiguous = (days >= 1) & (days < 61)
+        if ambiguous.any():
+            raise XLDateAmbiguous(xldates[ambiguous][0])
+
+    # time-only values and dates that do not fit in a datetime64[ns] are
+    # converted by xlrd
+    max_days = (Timestamp.max - Timestamp(epoch)).days
+    fast = (days >= 1) & (days < max_days)
+
+    result = np.empty(len(xldates), dtype=object)
+    if fast.any():
+        elapsed = (days[fast] * 86400 + seconds[fast]).astype(np.int64)
+        result[fast] = tslib.ints_to_pydatetime(
+            elapsed * 1000000000 + Timestamp(epoch).value)
+
+    for i in np.flatnonzero(~fast):
+        dt = xldate_as_tuple(xldates[i], datemode)
+        # how to produce this first case?
+        if dt[0] < datetime.MINYEAR:  # pragma: no cover
+            result[i] = datetime.time(*dt[3:])
+        else:
+            result[i] = datetime.datetime(*dt)
+    return result
+
+
+def _convert_excel_column(values, types, datemode, convert_float):
+    """
+    Convert the cell values of a sheet column to Python values according to
+    their xlrd cell types, converting all the cells of a type at once
+    """
+    from xlrd import (XL_CELL_DATE, XL_CELL_ERROR, XL_CELL_BOOLEAN,
+                      XL_CELL_NUMBER)
+
+    values = np.array(values, dtype=object)
+    types = np.asarray(types)
+
+    mask = types == XL_CELL_DATE
+    if mask.any():
+        values[mask] = _xldates_to_datetime(values[mask].astype(np.float64),
+                                            datemode)
+
+    mask = types == XL_CELL_ERROR
+    if mask.any():
+        values[mask] = np.nan
+
+    mask = types == XL_CELL_BOOLEAN
+    if mask.any():
+        values[mask] = values[mask].astype(bool)
+
+    mask = types == XL_CELL_NUMBER
+    if convert_float and mask.any():
+        # GH5394 - Excel 'numbers' are always floats
+        # it's a minimal perf hit and less suprising
+        floats = values[mask].astype(np.float64)
+        ints = floats.astype(np.int64)
+        integral = ints == floats
+        values[np.flatnonzero(mask)[integral]] = ints[integral]
+
+    return values
+
+
 def _trim_excel_header(row):
     # trim header row so auto-index inference works
     # xlrd uses '' , openpyxl None
@@ -365,6 +446,12 @@ class ExcelWriter(object):
     datetime_format : string, default None
         Format string for datetime objects written into Excel files
         (e.g. 'YYYY-MM-DD HH:MM:SS')
+    streaming : boolean, default False
+        Write cells row by row using the engine's constant memory / write-only
+        mode (where it has one) instead of holding the whole workbook in
+        memory. Rows of a sheet must then be written in increasing order and
+        merged cells are written unmerged. The openpyxl engine does not apply
+        cell styles in this mode.
     """
     # Defining an ExcelWriter implementation (see abstract methods for more...)
 
@@ -440,7 +527,8 @@ class ExcelWriter(object):
         pass
 
     def __init__(self, path, engine=None,
-                 date_format=None, datetime_format=None, **engine_kwargs):
+                 date_format=None, datetime_format=None, streaming=False,
+                 **engine_kwargs):
         # validate that this engine can handle the extension
         ext = os.path.splitext(path)[-1]
         self.check_extension(ext)
@@ -448,6 +536,10 @@ class ExcelWriter(object):
         self.path = path
         self.sheets = {}
         self.cur_sheet = None
+        self.streaming = streaming
+        # style objects converted so far, keyed on the style dict and number
+        # format, so that each distinct style is only created once per book
+        self._style_cache = {}
 
         if date_format is None:
             self.date_format = 'YYYY-MM-DD'
@@ -458,6 +550,16 @@ class ExcelWriter(object):
         else:
             self.datetime_format = datetime_format
 
+    def _get_style(self, style, num_format_str=None):
+        stylekey = json.dumps(style)
+        if num_format_str:
+            stylekey += num_format_str
+
+        if stylekey not in self._style_cache:
+            self._style_cache[stylekey] = self._convert_to_style(
+                style, num_format_str)
+        return self._style_cache[stylekey]
+
     def _get_sheet_name(self, sheet_name):
         if sheet_name is None:
             sheet_name = self.cur_sheet
@@ -501,8 +603,11 @@ class _OpenpyxlWriter(ExcelWriter):
 
         super(_OpenpyxlWriter, self).__init__(path, **engine_kwargs)
 
-        # Create workbook object with default optimized_write=True.
-        self.book = Workbook()
+        # Create workbook object, in write-only mode when streaming. Rows
+        # already appended to a write-only sheet can't be revisited, so keep
+        # track of the next row to be written for each of them.
+        self.book = Workbook(optimized_write=self.streaming)
+        self._next_rows = {}
         # Openpyxl 1.6.1 adds a dummy sheet. We remove it.
         if self.book.worksheets:
             self.book.remove_sheet(self.book.worksheets[0])
@@ -526,6 +631,10 @@ class _OpenpyxlWriter(ExcelWriter):
             wks.title = sheet_name
             self.sheets[sheet_name] = wks
 
+        if self.streaming:
+            self._append_rows(wks, sheet_name, cells, startrow, startcol)
+            return
+
         for cell in cells:
             colletter = get_column_letter(startcol + cell.col + 1)
             xcell = wks.cell("%s%s" % (colletter, startrow + cell.row + 1))
@@ -570,6 +679,39 @@ class _OpenpyxlWriter(ExcelWriter):
                                 xcell.style.__setattr__(
                                     field, style.__getattribute__(field))
 
+    def _append_rows(self, wks, sheet_name, cells, startrow, startcol):
+        # A write-only sheet can only append whole rows, so collect the
+        # values of the current row and append them once a later row starts.
+        nextrow = self._next_rows.get(sheet_name, 0)
+        rownum = None
+        row = []
+        for cell in cells:
+            cellrow = startrow + cell.row
+            if cellrow != rownum:
+                if rownum is not None:
+                    wks.append(row)
+                    nextrow = rownum + 1
+                if cellrow < nextrow:
+                    raise ValueError("Rows must be written in increasing "
+                                     "order when streaming, row %d of sheet "
+                                     "'%s' has already been written"
+                                     % (cellrow, sheet_name))
+                while nextrow < cellrow:
+                    wks.append([])
+                    nextrow += 1
+                rownum = cellrow
+                row = []
+
+            col = startcol + cell.col
+            if len(row) <= col:
+                row.extend([None] * (col + 1 - len(row)))
+            row[col] = _conv_value(cell.val)
+
+        if rownum is not None:
+            wks.append(row)
+            nextrow = rownum + 1
+        self._next_rows[sheet_name] = nextrow
+
     @classmethod
     def _convert_to_style(cls, style_dict):
         """
@@ -610,6 +752,9 @@ class _XlwtWriter(ExcelWriter):
         self.fm_datetime = xlwt.easyxf(num_format_str=self.datetime_format)
         self.fm_date = xlwt.easyxf(num_format_str=self.date_format)
 
+    # number of rows between serializations of the row data when streaming
+    flush_rows = 1000
+
     def save(self):
         """
         Save workbook to disk.
@@ -627,7 +772,7 @@ class _XlwtWriter(ExcelWriter):
             wks = self.book.add_sheet(sheet_name)
             self.sheets[sheet_name] = wks
 
-        style_dict = {}
+        rownum = None
 
         for cell in cells:
             val = _conv_value(cell.val)
@@ -638,15 +783,14 @@ class _XlwtWriter(ExcelWriter):
             if isinstance(cell.val, datetime.date):
                 num_format_str = self.date_format
 
-            stylekey = json.dumps(cell.style)
-            if num_format_str:
-                stylekey += num_format_str
+            style = self._get_style(cell.style, num_format_str)
 
-            if stylekey in style_dict:
-                style = style_dict[stylekey]
-            else:
-                style = self._convert_to_style(cell.style, num_format_str)
-                style_dict[stylekey] = style
+            if self.streaming and cell.row != rownum:
+                # xlwt has no write-only mode, but serializing the finished
+                # rows releases their cell objects
+                if rownum is not None and cell.row % self.flush_rows == 0:
+                    wks.flush_row_data()
+                rownum = cell.row
 
             if cell.mergestart is not None and cell.mergeend is not None:
                 wks.write_merge(startrow + cell.row,
@@ -722,14 +866,20 @@ class _XlsxWriter(ExcelWriter):
     supported_extensions = ('.xlsx',)
 
     def __init__(self, path, engine=None,
-                 date_format=None, datetime_format=None, **engine_kwargs):
+                 date_format=None, datetime_format=None, streaming=False,
+                 **engine_kwargs):
         # Use the xlsxwriter module as the Excel writer.
         import xlsxwriter
 
         super(_XlsxWriter, self).__init__(path, engine=engine,
             date_format=date_format, datetime_format=datetime_format,
-            **engine_kwargs)
+            streaming=streaming, **engine_kwargs)
 
+        if streaming:
+            # each row is flushed to disk as soon as a later row is written
+            options = dict(engine_kwargs.pop('options', None) or {})
+            options['constant_memory'] = True
+            engine_kwargs['options'] = options
         self.book = xlsxwriter.Workbook(path, **engine_kwargs)
 
     def save(self):
@@ -749,8 +899,6 @@ class _XlsxWriter(ExcelWriter):
             wks = self.book.add_worksheet(sheet_name)
             self.sheets[sheet_name] = wks
 
-        style_dict = {}
-
         for cell in cells:
             num_format_str = None
             if isinstance(cell.val, datetime.datetime):
@@ -758,15 +906,7 @@ class _XlsxWriter(ExcelWriter):
             if isinstance(cell.val, datetime.date):
                 num_format_str = self.date_format
 
-            stylekey = json.dumps(cell.style)
-            if num_format_str:
-                stylekey += num_format_str
-
-            if stylekey in style_dict:
-                style = style_dict[stylekey]
-            else:
-                style = self._convert_to_style(cell.style, num_format_str)
-                style_dict[stylekey] = style
+            style = self._get_style(cell.style, num_format_str)
 
             if cell.mergestart is not None and cell.mergeend is not None:
                 wks.merge_range(startrow + cell.row,
@@ -8,6 +8,7 @@ import re
 import numbers
 import collections
 import warnings
+from itertools import islice
 
 from distutils.version import LooseVersion
 
@@ -70,6 +71,39 @@ def _remove_whitespace(s, regex=_RE_WHITESPACE):
     return regex.sub(' ', s.strip())
 
 
+def _remove_whitespace_all(strings, regex=_RE_WHITESPACE, sep=u('\x00')):
+    """Apply :func:`_remove_whitespace` to each of a list of strings.
+
+    The strings are joined so that the regular expression runs once over all
+    of them, which is much cheaper than one substitution per cell.
+
+    Parameters
+    ----------
+    strings : list of str or unicode
+
+    regex : regex
+        The regular expression to use to remove extra whitespace.
+
+    sep : unicode
+        A non-whitespace separator used to join the strings.
+
+    Returns
+    -------
+    subd : list of str or unicode
+    """
+    parts = regex.sub(' ', sep.join(strings)).split(sep)
+    if len(parts) != len(strings):
+        # the separator occurs in the text itself
+        return [_remove_whitespace(x, regex) for x in strings]
+    return [x.strip() for x in parts]
+
+
+def _split_rows(values, lengths):
+    """Split a flat list of cell values into rows of the given lengths."""
+    values = iter(values)
+    return [list(islice(values, n)) for n in lengths]
+
+
 def _get_skiprows(skiprows):
     """Get an iterator given an integer, slice or container.
 
@@ -194,9 +228,10 @@ class _HtmlFrameParser(object):
         -------
         data : list of list of strings
         """
-        data = [[_remove_whitespace(self._text_getter(col)) for col in
-                 self._parse_td(row)] for row in rows]
-        return data
+        rows = [self._parse_td(row) for row in rows]
+        texts = _remove_whitespace_all([self._text_getter(col)
+                                        for row in rows for col in row])
+        return _split_rows(texts, lmap(len, rows))
 
     def _text_getter(self, obj):
         """Return the text of an individual DOM node.
@@ -450,6 +485,19 @@ def _build_xpath_expr(attrs):
 _re_namespace = {'re': 'http://exslt.org/regular-expressions'}
 _valid_schemes = 'http', 'file', 'ftp'
 
+_xpath_cache = {}
+
+
+def _compiled_xpath(expr):
+    """Return a compiled :class:`lxml.etree.XPath` for `expr`, so that the
+    expressions evaluated for every table and row are only parsed once."""
+    try:
+        return _xpath_cache[expr]
+    except KeyError:
+        from lxml.etree import XPath
+        xpath = _xpath_cache[expr] = XPath(expr)
+        return xpath
+
 
 class _LxmlFrameParser(_HtmlFrameParser):
     """HTML to DataFrame parser that uses lxml under the hood.
@@ -475,11 +523,10 @@ class _LxmlFrameParser(_HtmlFrameParser):
         return obj.text_content()
 
     def _parse_td(self, row):
-        return row.xpath('.//td|.//th')
+        return _compiled_xpath('.//td|.//th')(row)
 
     def _parse_tr(self, table):
-        expr = './/tr[normalize-space()]'
-        return table.xpath(expr)
+        return _compiled_xpath('.//tr[normalize-space()]')(table)
 
     def _parse_tables(self, doc, match, kwargs):
         pattern = match.pattern
@@ -565,13 +612,38 @@ class _LxmlFrameParser(_HtmlFrameParser):
 
     def _parse_raw_thead(self, table):
         expr = './/thead//th'
-        return [_remove_whitespace(x.text_content()) for x in
-                table.xpath(expr)]
+        return _remove_whitespace_all([x.text_content() for x in
+                                       _compiled_xpath(expr)(table)])
 
     def _parse_raw_tfoot(self, table):
         expr = './/tfoot//th'
-        return [_remove_whitespace(x.text_content()) for x in
-                table.xpath(expr)]
+        return _remove_whitespace_all([x.text_content() for x in
+                                       _compiled_xpath(expr)(table)])
+
+    def _parse_raw_tbody(self, table):
+        tbody = self._parse_tbody(table)
+
+        try:
+            root = tbody[0]
+        except IndexError:
+            root = table
+
+        rows = self._parse_tr(root)
+
+        # In the common case every cell is a child of its row, so the cells
+        # of all the rows come out of a single query in document order and
+        # only have to be split by the number of children of each row.
+        # Nested tables (whose cells also count for the enclosing row) and
+        # rows holding anything else go through the row by row path.
+        cells = _compiled_xpath('.//tr[normalize-space()]/td|'
+                                './/tr[normalize-space()]/th')(root)
+        lengths = lmap(len, rows)
+        if (sum(lengths) != len(cells) or
+                _compiled_xpath('.//table')(root)):
+            return self._parse_raw_data(rows)
+
+        texts = _remove_whitespace_all([x.text_content() for x in cells])
+        return _split_rows(texts, lengths)
 
 
 def _expand_elements(body):
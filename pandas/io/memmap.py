@@ -0,0 +1,149 @@
+"""
+Write pandas objects to a simple binary file whose data can be memory mapped
+back, so that the processes reading the same file share one copy of it
+
+The file holds:
+
+* an 8 byte magic string and the length of the header, as a little endian
+  unsigned 64 bit integer
+* the pickled header: the type of the object, its axes and, for each block,
+  its items, dtype, shape and the offset of its data (object blocks, which
+  cannot be mapped, are stored in the header itself)
+* the raw C-ordered data of each block, aligned on _ALIGNMENT bytes
+"""
+
+import struct
+
+import numpy as np
+
+from pandas import DataFrame, Series, Panel
+from pandas.core.internals import BlockManager, SingleBlockManager, make_block
+from pandas.compat import cPickle as pkl
+
+_MAGIC = b'PDMMAP01'
+_ALIGNMENT = 64
+_PREAMBLE = len(_MAGIC) + 8
+
+_TYPES = {'series': Series, 'frame': DataFrame, 'panel': Panel}
+
+
+def _aligned(n):
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+def _get_type(obj):
+    for typ, klass in _TYPES.items():
+        if isinstance(obj, klass):
+            return typ
+    raise TypeError('cannot memory map an object of type %s' % type(obj))
+
+
+def to_mmap(obj, path):
+    """
+    Write a Series, DataFrame or Panel to a file that can be memory mapped
+    with read_mmap
+
+    Parameters
+    ----------
+    obj : Series, DataFrame or Panel
+    path : string
+        File path
+    """
+    typ = _get_type(obj)
+    mgr = obj._data.consolidate()
+    unique = mgr.items.is_unique
+
+    blocks = []
+    data = []
+    offset = 0
+    for blk in mgr.blocks:
+        if blk.is_sparse:
+            raise NotImplementedError('cannot memory map sparse data')
+
+        items = None if typ == 'series' else blk.items
+        placement = None if unique or typ == 'series' else blk.ref_locs
+        values = blk.values
+
+        if values.dtype == np.object_:
+            blocks.append(dict(items=items, placement=placement,
+                               values=values))
+            continue
+
+        values = np.ascontiguousarray(values)
+        blocks.append(dict(items=items, placement=placement,
+                           dtype=values.dtype.str, shape=values.shape,
+                           offset=offset))
+        data.append((offset, values))
+        offset = _aligned(offset + values.nbytes)
+
+    header = dict(typ=typ, axes=mgr.axes, blocks=blocks,
+                  name=getattr(obj, 'name', None))
+    header = pkl.dumps(header, protocol=pkl.HIGHEST_PROTOCOL)
+    start = _aligned(_PREAMBLE + len(header))
+
+    with open(path, 'wb') as f:
+        f.write(_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for offset, values in data:
+            f.write(b'\x00' * (start + offset - f.tell()))
+            values.tofile(f)
+
+
+def read_mmap(path, mode='r'):
+    """
+    Load a pandas object written by to_mmap, with its data memory mapped
+    from the file rather than read into memory
+
+    Warning: the header of the file is pickled; loading files received from
+    untrusted sources can be unsafe.
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mode : {'r', 'c', 'r+'}, default 'r'
+        'r' maps the data read-only, 'c' maps it copy-on-write (changes are
+        kept in memory), 'r+' writes changes through to the file
+
+    Returns
+    -------
+    obj : Series, DataFrame or Panel
+    """
+    if mode not in ('r', 'c', 'r+'):
+        raise ValueError("mode must be one of 'r', 'c' or 'r+'")
+
+    with open(path, 'rb') as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError('%s is not a pandas memory mapped file' % path)
+        header_length, = struct.unpack('<Q', f.read(8))
+        header = pkl.loads(f.read(header_length))
+    start = _aligned(_PREAMBLE + header_length)
+
+    typ = header['typ']
+    axes = header['axes']
+    mapped = None
+
+    blocks = []
+    for meta in header['blocks']:
+        if 'values' in meta:
+            values = meta['values']
+        else:
+            if mapped is None:
+                mapped = np.memmap(path, dtype=np.uint8, mode=mode)
+            dtype = np.dtype(meta['dtype'])
+            shape = meta['shape']
+            begin = start + meta['offset']
+            end = begin + dtype.itemsize * int(np.prod(shape))
+            values = np.asarray(mapped[begin:end]).view(dtype).reshape(shape)
+
+        items = axes[0] if meta['items'] is None else meta['items']
+        blocks.append(make_block(values, items, axes[0],
+                                 placement=meta['placement']))
+
+    if typ == 'series':
+        mgr = SingleBlockManager(blocks[0], axes[0], fastpath=False)
+        return Series(mgr, name=header['name'], fastpath=True)
+
+    mgr = BlockManager(blocks, axes)
+    return _TYPES[typ](mgr)
@@ -23,10 +23,12 @@ from pandas import compat
 from pandas.compat import long, lrange, lmap, lzip, text_type, string_types
 from pandas import isnull
 from pandas.io.common import get_filepath_or_buffer
-from pandas.tslib import NaT
+from pandas.tseries.index import DatetimeIndex
+from pandas.tslib import NaT, Timestamp, iNaT
 
 def read_stata(filepath_or_buffer, convert_dates=True,
-               convert_categoricals=True, encoding=None, index=None):
+               convert_categoricals=True, encoding=None, index=None,
+               columns=None, chunksize=None):
     """
     Read Stata file into DataFrame
 
@@ -43,10 +45,25 @@ def read_stata(filepath_or_buffer, convert_dates=True,
         support unicode. None defaults to cp1252.
     index : identifier of index column
         identifier of column that should be used as index of the DataFrame
+    columns : list or None
+        Columns to retain.  Columns will be returned in the given order.  None
+        returns all columns
+    chunksize : int, default None
+        Return an iterator yielding DataFrames of (at most) chunksize
+        observations each, rather than reading the whole file at once
+
+    Returns
+    -------
+    DataFrame, or an iterator of DataFrames if chunksize is given
     """
     reader = StataReader(filepath_or_buffer, encoding)
 
-    return reader.data(convert_dates, convert_categoricals, index)
+    if chunksize is not None:
+        return reader.iterchunks(chunksize, convert_dates=convert_dates,
+                                 convert_categoricals=convert_categoricals,
+                                 index=index, columns=columns)
+
+    return reader.data(convert_dates, convert_categoricals, index, columns)
 
 _date_formats = ["%tc", "%tC", "%td", "%d", "%tw", "%tm", "%tq", "%th", "%ty"]
 
@@ -137,49 +154,54 @@ def _stata_elapsed_date_to_datetime(date, fmt):
         raise ValueError("Date fmt %s not understood" % fmt)
 
 
-def _datetime_to_stata_elapsed(date, fmt):
+def _datetime_to_stata_elapsed(dates, fmt):
     """
     Convert from datetime to SIF. http://www.stata.com/help.cgi?datetime
 
     Parameters
     ----------
-    date : datetime.datetime
-        The date to convert to the Stata Internal Format given by fmt
+    dates : array-like of datetime-likes
+        The dates to convert to the Stata Internal Format given by fmt
     fmt : str
         The format to convert to. Can be, tc, td, tw, tm, tq, th, ty
+
+    Returns
+    -------
+    ndarray of float64, with NaT mapped to the Stata missing value ('.')
     """
-    if not isinstance(date, datetime.datetime):
-        raise ValueError("date should be datetime.datetime format")
-    stata_epoch = datetime.datetime(1960, 1, 1)
-    # Handle NaTs
-    if date is NaT:
-        # Missing value for dates ('.'), assumed always double
-        # TODO: Should be moved so a const somewhere, and consolidated
-        return struct.unpack('<d', b'\x00\x00\x00\x00\x00\x00\xe0\x7f')[0]
-    if fmt in ["%tc", "tc"]:
-        delta = date - stata_epoch
-        return (delta.days * 86400000 + delta.seconds*1000 +
-                delta.microseconds/1000)
-    elif fmt in ["%tC", "tC"]:
+    if fmt in ["%tC", "tC"]:
         from warnings import warn
         warn("Stata Internal Format tC not supported.")
-        return date
+        return dates
+
+    dates = DatetimeIndex(dates)
+    stata_epoch = datetime.datetime(1960, 1, 1)
+    years = dates.year - stata_epoch.year
+    if fmt in ["%tc", "tc"]:
+        ns = dates.asi8 - Timestamp(stata_epoch).value
+        elapsed = ns / 1000000.
     elif fmt in ["%td", "td"]:
-        return (date - stata_epoch).days
+        ns = dates.asi8 - Timestamp(stata_epoch).value
+        elapsed = ns // (86400 * 1000000000)
     elif fmt in ["%tw", "tw"]:
-        return (52*(date.year-stata_epoch.year) +
-                (date - datetime.datetime(date.year, 1, 1)).days / 7)
+        elapsed = 52 * years + (dates.dayofyear - 1) // 7
     elif fmt in ["%tm", "tm"]:
-        return (12 * (date.year - stata_epoch.year) + date.month - 1)
+        elapsed = 12 * years + dates.month - 1
     elif fmt in ["%tq", "tq"]:
-        return 4*(date.year-stata_epoch.year) + int((date.month - 1)/3)
+        elapsed = 4 * years + (dates.month - 1) // 3
     elif fmt in ["%th", "th"]:
-        return 2 * (date.year - stata_epoch.year) + int(date.month > 6)
+        elapsed = 2 * years + (dates.month > 6)
     elif fmt in ["%ty", "ty"]:
-        return date.year
+        elapsed = dates.year
     else:
         raise ValueError("fmt %s not understood" % fmt)
 
+    elapsed = np.asarray(elapsed, dtype=np.float64)
+    # Missing value for dates ('.'), assumed always double
+    elapsed[dates.asi8 == iNaT] = struct.unpack(
+        '<d', b'\x00\x00\x00\x00\x00\x00\xe0\x7f')[0]
+    return elapsed
+
 
 class PossiblePrecisionLoss(Warning):
     pass
@@ -355,6 +377,18 @@ class StataParser(object):
                     (65530, 'b')
                 ]
             )
+        # numpy equivalents of the fixed width numeric types, used to lay
+        # out a whole data record as a structured dtype. 'Q' is the 8 byte
+        # (v, o) reference into the strL table of format 117 files.
+        self.NUMPY_TYPE_MAP = \
+            {
+                'b': 'i1',
+                'h': 'i2',
+                'l': 'i4',
+                'f': 'f4',
+                'd': 'f8',
+                'Q': 'u8'
+            }
         #NOTE: technically, some of these are wrong. there are more numbers
         # that can be represented. it's the 27 ABOVE and BELOW the max listed
         # numeric data type in [U] 12.2.2 of the 11.2 manual
@@ -444,6 +478,9 @@ class StataReader(StataParser):
         self._missing_values = False
         self._data_read = False
         self._value_labels_read = False
+        self._strls_read = False
+        self._dtype = None
+        self._lines_read = 0
         if isinstance(path_or_buf, str):
             path_or_buf, encoding = get_filepath_or_buffer(
                 path_or_buf, encoding=self._default_encoding
@@ -512,8 +549,10 @@ class StataReader(StataParser):
             try:
                 i = 0
                 for typ in typlist:
-                    if typ <= 2045 or typ == 32768:
-                        self.typlist[i] = None
+                    if typ <= 2045:
+                        self.typlist[i] = typ
+                    elif typ == 32768:
+                        self.typlist[i] = 'Q'
                     else:
                         self.typlist[i] = self.TYPE_MAP_XML[typ]
                     i += 1
@@ -668,17 +707,6 @@ class StataReader(StataParser):
         else:
             return self.col_sizes[k]
 
-    def _unpack(self, fmt, byt):
-        d = struct.unpack(self.byteorder + fmt, byt)[0]
-        if fmt[-1] in self.VALID_RANGE:
-            nmin, nmax = self.VALID_RANGE[fmt[-1]]
-            if d < nmin or d > nmax:
-                if self._missing_values:
-                    return StataMissingValue(nmax, d)
-                else:
-                    return None
-        return d
-
     def _null_terminate(self, s):
         if compat.PY3 or self._encoding is not None:  # have bytes not strings,
                                                       # so must decode
@@ -695,71 +723,39 @@ class StataReader(StataParser):
             except:
                 return s
 
-    def _next(self):
-        typlist = self.typlist
-        if self.has_string_data:
-            data = [None] * self.nvar
-            for i in range(len(data)):
-                if type(typlist[i]) is int:
-                    data[i] = self._null_terminate(
-                        self.path_or_buf.read(typlist[i])
-                    )
-                else:
-                    data[i] = self._unpack(
-                        typlist[i], self.path_or_buf.read(self._col_size(i))
-                    )
-            return data
-        else:
-            return list(
-                map(
-                    lambda i: self._unpack(typlist[i],
-                                           self.path_or_buf.read(
-                                               self._col_size(i)
-                                           )),
-                    range(self.nvar)
-                )
-            )
-
-    def _dataset(self):
-        """
-        Returns a Python generator object for iterating over the dataset.
-
-
-        Parameters
-        ----------
-
-        Returns
-        -------
-        Generator object for iterating over the dataset.  Yields each row of
-        observations as a list by default.
-
-        Notes
-        -----
-        If missing_values is True during instantiation of StataReader then
-        observations with _StataMissingValue(s) are not filtered and should
-        be handled by your applcation.
-        """
-
-        self.path_or_buf.seek(self.data_location)
+    def _setup_dtype(self):
+        """Map the fixed width layout of a data record onto a numpy
+        structured dtype, with one field per variable"""
+        if self._dtype is not None:
+            return self._dtype
+
+        dtype = []
+        for i, typ in enumerate(self.typlist):
+            if typ in self.NUMPY_TYPE_MAP:
+                dtype.append(('s' + str(i),
+                              self.byteorder + self.NUMPY_TYPE_MAP[typ]))
+            else:
+                dtype.append(('s' + str(i), 'S' + str(typ)))
+        self._dtype = np.dtype(dtype)
 
-        for i in range(self.nobs):
-            yield self._next()
+        return self._dtype
 
     def _read_value_labels(self):
+        if self._value_labels_read:
+            raise Exception("Value labels have already been read.")
         if self.format_version >= 117:
             self.path_or_buf.seek(self.seek_value_labels)
         else:
-            if not self._data_read:
-                raise Exception("Data has not been read. Because of the "
-                                "layout of Stata files, this is necessary "
-                                "before reading value labels.")
-            if self._value_labels_read:
-                raise Exception("Value labels have already been read.")
+            # value labels directly follow the fixed width data records
+            dtype = self._setup_dtype()
+            self.path_or_buf.seek(self.data_location +
+                                  self.nobs * dtype.itemsize)
 
         self.value_label_dict = dict()
 
         if self.format_version <= 108:
             # Value labels are not supported in version 108 and earlier.
+            self._value_labels_read = True
             return
 
         while True:
@@ -803,15 +799,17 @@ class StataReader(StataParser):
             if self.path_or_buf.read(3) != b'GSO':
                 break
 
-            v_o = struct.unpack(self.byteorder + 'L',
+            v_o = struct.unpack(self.byteorder + 'Q',
                                 self.path_or_buf.read(8))[0]
             typ = self.path_or_buf.read(1)
             length = struct.unpack(self.byteorder + 'I',
                                    self.path_or_buf.read(4))[0]
             self.GSO[v_o] = self.path_or_buf.read(length-1)
             self.path_or_buf.read(1)  # zero-termination
+        self._strls_read = True
 
-    def data(self, convert_dates=True, convert_categoricals=True, index=None):
+    def data(self, convert_dates=True, convert_categoricals=True, index=None,
+             columns=None):
         """
         Reads observations from Stata file, converting them into a dataframe
 
@@ -824,6 +822,9 @@ class StataReader(StataParser):
             variables
         index : identifier of index column
             identifier of column that should be used as index of the DataFrame
+        columns : list or None
+            Columns to retain.  Columns will be returned in the given order.
+            None returns all columns
 
         Returns
         -------
@@ -833,50 +834,86 @@ class StataReader(StataParser):
             raise Exception("Data has already been read.")
         self._data_read = True
 
-        if self.format_version >= 117:
-            self._read_strls()
+        return self.read(convert_dates=convert_dates,
+                         convert_categoricals=convert_categoricals,
+                         index=index, columns=columns)
+
+    def iterchunks(self, chunksize, convert_dates=True,
+                   convert_categoricals=True, index=None, columns=None):
+        """
+        Iterate over the remaining observations, chunksize at a time
 
-        stata_dta = self._dataset()
+        Parameters
+        ----------
+        chunksize : int
+            Number of observations in each DataFrame that is yielded
+        convert_dates, convert_categoricals, index, columns :
+            see :meth:`StataReader.data`
 
-        data = []
-        for rownum, line in enumerate(stata_dta):
-            # doesn't handle missing value objects, just casts
-            # None will only work without missing value object.
-            for i, val in enumerate(line):
-                #NOTE: This will only be scalar types because missing strings
-                # are empty not None in Stata
-                if val is None:
-                    line[i] = np.nan
-            data.append(tuple(line))
+        Returns
+        -------
+        Generator object yielding DataFrames
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        self._data_read = True
+        while self._lines_read < self.nobs:
+            yield self.read(chunksize, convert_dates=convert_dates,
+                            convert_categoricals=convert_categoricals,
+                            index=index, columns=columns)
 
-        if convert_categoricals:
+    def read(self, nrows=None, convert_dates=True, convert_categoricals=True,
+             index=None, columns=None):
+        """
+        Reads the next nrows observations (all remaining ones if nrows is
+        None) into a DataFrame. See :meth:`StataReader.data` for the other
+        parameters.
+        """
+        if self.format_version >= 117 and not self._strls_read:
+            self._read_strls()
+
+        if convert_categoricals and not self._value_labels_read:
             self._read_value_labels()
 
-        data = DataFrame(data, columns=self.varlist, index=index)
+        dtype = self._setup_dtype()
+        remaining = self.nobs - self._lines_read
+        if nrows is None or nrows > remaining:
+            nrows = remaining
+
+        # every record has the same fixed width, so a block of records is a
+        # structured array that can be decoded a whole variable at a time
+        self.path_or_buf.seek(self.data_location +
+                              self._lines_read * dtype.itemsize)
+        raw_data = np.frombuffer(self.path_or_buf.read(nrows * dtype.itemsize),
+                                 dtype=dtype, count=nrows)
+        start = self._lines_read
+        self._lines_read += nrows
+
+        if columns is None:
+            col_locs = lrange(self.nvar)
+        else:
+            col_locs = self._get_column_locs(columns)
+        varlist = [self.varlist[i] for i in col_locs]
 
-        cols_ = np.where(self.dtyplist)[0]
-        for i in cols_:
-            if self.dtyplist[i] is not None:
-                col = data.columns[i]
-                if data[col].dtype is not np.dtype(object):
-                    data[col] = Series(data[col], data[col].index,
-                                       self.dtyplist[i])
+        data = dict((self.varlist[i],
+                     self._decode_column(i, raw_data['s' + str(i)]))
+                    for i in col_locs)
+        data = DataFrame(data, columns=varlist,
+                         index=np.arange(start, start + nrows))
 
         if convert_dates:
-            cols = np.where(lmap(lambda x: x in _date_formats,
-                                 self.fmtlist))[0]
-            for i in cols:
-                col = data.columns[i]
-                data[col] = data[col].apply(_stata_elapsed_date_to_datetime,
-                                            args=(self.fmtlist[i],))
+            for i in col_locs:
+                if self.fmtlist[i] in _date_formats:
+                    col = self.varlist[i]
+                    data[col] = data[col].apply(
+                        _stata_elapsed_date_to_datetime,
+                        args=(self.fmtlist[i],))
 
         if convert_categoricals:
-            cols = np.where(
-                lmap(lambda x: x in compat.iterkeys(self.value_label_dict),
-                     self.lbllist)
-            )[0]
-            for i in cols:
-                col = data.columns[i]
+            for i in col_locs:
+                if self.lbllist[i] not in self.value_label_dict:
+                    continue
+                col = self.varlist[i]
                 labeled_data = np.copy(data[col])
                 labeled_data = labeled_data.astype(object)
                 for k, v in compat.iteritems(
@@ -884,8 +921,43 @@ class StataReader(StataParser):
                     labeled_data[(data[col] == k).values] = v
                 data[col] = Categorical.from_array(labeled_data)
 
+        if index is not None:
+            data = data.set_index(index)
+
         return data
 
+    def _get_column_locs(self, columns):
+        locs = []
+        for col in columns:
+            try:
+                locs.append(self.varlist.index(col))
+            except ValueError:
+                raise ValueError("column %s is not a variable of the Stata "
+                                 "file" % col)
+        return locs
+
+    def _decode_column(self, i, values):
+        """Convert the raw field values of variable i to a native ndarray,
+        replacing Stata missing values with NaN"""
+        typ = self.typlist[i]
+        if typ == 'Q':
+            return np.array([self._null_terminate(self.GSO.get(v, b''))
+                             for v in values], dtype=object)
+        elif type(typ) is int:
+            # missing strings are empty, not NaN, in Stata
+            return np.array([self._null_terminate(v) for v in values],
+                            dtype=object)
+
+        values = values.astype(self.NUMPY_TYPE_MAP[typ])
+        nmin, nmax = self.VALID_RANGE[typ]
+        missing = (values < nmin) | (values > nmax)
+        if missing.any():
+            # integer variables cannot hold NaN
+            if values.dtype.kind == 'i':
+                values = values.astype(np.float64)
+            values[missing] = np.nan
+        return values
+
     def data_label(self):
         """Returns data label of Stata file"""
         return self.data_label
@@ -1074,6 +1146,9 @@ class StataWriter(StataParser):
     >>> writer = StataWriter('./date_data_file.dta', date, {2 : 'tw'})
     >>> writer.write_file()
     """
+    # bytes of record data serialized per write call
+    _write_chunksize = 1 << 22
+
     def __init__(self, fname, data, convert_dates=None, write_index=True,
                  encoding="latin-1", byteorder=None, time_stamp=None,
                  data_label=None):
@@ -1091,7 +1166,6 @@ class StataWriter(StataParser):
         self._file = _open_file_binary_write(
             fname, self._encoding or self._default_encoding
         )
-        self.type_converters = {253: np.int32, 252: np.int16, 251: np.int8}
 
     def _write(self, to_write):
         """
@@ -1178,7 +1252,7 @@ class StataWriter(StataParser):
         # Check date conversion, and fix key if needed
         if self._convert_dates:
             for c, o in zip(columns, original_columns):
-                if c != o:
+                if c != o and o in self._convert_dates:
                     self._convert_dates[c] = self._convert_dates[o]
                     del self._convert_dates[o]
 
@@ -1193,15 +1267,6 @@ class StataWriter(StataParser):
     def _prepare_pandas(self, data):
         #NOTE: we might need a different API / class for pandas objects so
         # we can set different semantics - handle this with a PR to pandas.io
-        class DataFrameRowIter(object):
-            def __init__(self, data):
-                self.data = data
-
-            def __iter__(self):
-                for row in data.itertuples():
-                    # First element is index, so remove
-                    yield row[1:]
-
         if self._write_index:
             data = data.reset_index()
         # Check columns for compatibility with stata
@@ -1210,7 +1275,6 @@ class StataWriter(StataParser):
         data = self._check_column_names(data)
         # Replace NaNs with Stata missing values
         data = self._replace_nans(data)
-        self.datarows = DataFrameRowIter(data)
         self.nobs, self.nvar = data.shape
         self.data = data
         self.varlist = data.columns.tolist()
@@ -1238,10 +1302,7 @@ class StataWriter(StataParser):
         self._write_variable_labels()
         # write 5 zeros for expansion fields
         self._write(_pad_bytes("", 5))
-        if self._convert_dates is None:
-            self._write_data_nodates()
-        else:
-            self._write_data_dates()
+        self._write_data()
         #self._write_value_labels()
         self._file.close()
 
@@ -1309,53 +1370,51 @@ class StataWriter(StataParser):
             for i in range(nvar):
                 self._write(_pad_bytes("", 81))
 
-    def _write_data_nodates(self):
-        data = self.datarows
-        byteorder = self._byteorder
-        TYPE_MAP = self.TYPE_MAP
-        typlist = self.typlist
-        for row in data:
-            #row = row.squeeze().tolist() # needed for structured arrays
-            for i, var in enumerate(row):
-                typ = ord(typlist[i])
-                if typ <= 244:  # we've got a string
-                    if var is None or var == np.nan:
-                        var = _pad_bytes('', typ)
-                    if len(var) < typ:
-                        var = _pad_bytes(var, typ)
-                    self._write(var)
-                else:
-                    try:
-                        self._file.write(struct.pack(byteorder + TYPE_MAP[typ],
-                                                     var))
-                    except struct.error:
-                        # have to be strict about type pack won't do any
-                        # kind of casting
-                        self._file.write(struct.pack(byteorder+TYPE_MAP[typ],
-                                         self.type_converters[typ](var)))
-
-    def _write_data_dates(self):
-        convert_dates = self._convert_dates
-        data = self.datarows
+    def _write_data(self):
+        """Serialize the observations as fixed width records, building one
+        structured array per chunk of rows and writing it in a single call"""
+        data = self.data
+        convert_dates = self._convert_dates or {}
         byteorder = self._byteorder
         TYPE_MAP = self.TYPE_MAP
-        MISSING_VALUES = self.MISSING_VALUES
-        typlist = self.typlist
-        for row in data:
-            #row = row.squeeze().tolist() # needed for structured arrays
-            for i, var in enumerate(row):
-                typ = ord(typlist[i])
-                #NOTE: If anyone finds this terribly slow, there is
-                # a vectorized way to convert dates, see genfromdta for going
-                # from int to datetime and reverse it. will copy data though
+
+        dtype = []
+        columns = []
+        for i, typ in enumerate(self.typlist):
+            typ = ord(typ)
+            values = data.iloc[:, i].values
+            if typ <= 244:  # we've got a string
+                dtype.append(('s' + str(i), 'S' + str(typ)))
+                values = self._encode_strings(values)
+            else:
+                dtype.append(('s' + str(i),
+                              byteorder + self.NUMPY_TYPE_MAP[TYPE_MAP[typ]]))
                 if i in convert_dates:
-                    var = _datetime_to_stata_elapsed(var, self.fmtlist[i])
-                if typ <= 244:  # we've got a string
-                    if len(var) < typ:
-                        var = _pad_bytes(var, typ)
-                    self._write(var)
-                else:
-                    self._file.write(struct.pack(byteorder+TYPE_MAP[typ], var))
+                    values = _datetime_to_stata_elapsed(values,
+                                                        self.fmtlist[i])
+            columns.append(values)
+        dtype = np.dtype(dtype)
+
+        chunksize = max(1, self._write_chunksize // max(1, dtype.itemsize))
+        for start in range(0, self.nobs, chunksize):
+            stop = min(start + chunksize, self.nobs)
+            records = np.empty(stop - start, dtype=dtype)
+            for i, values in enumerate(columns):
+                records['s' + str(i)] = values[start:stop]
+            self._file.write(records.tostring())
+
+    def _encode_strings(self, values):
+        """Encode a column of strings, mapping missing values to empty
+        strings; numpy pads them with nulls to the field width"""
+        encoding = self._encoding or self._default_encoding
+        result = np.empty(len(values), dtype=object)
+        for j, v in enumerate(values):
+            if v is None or (isinstance(v, float) and np.isnan(v)):
+                v = b''
+            elif isinstance(v, text_type):
+                v = v.encode(encoding)
+            result[j] = v
+        return result
 
     def _null_terminate(self, s, as_string=False):
         null_byte = '\x00'
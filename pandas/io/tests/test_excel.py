@@ -1,7 +1,7 @@
 # pylint: disable=E1101
 
 from pandas.compat import u, range, map
-from datetime import datetime, date
+from datetime import datetime, date, time
 import os
 
 import nose
@@ -105,6 +105,45 @@ class ExcelReaderTests(SharedItems, tm.TestCase):
             tm.assert_frame_equal(df, df2, check_names=False)
             tm.assert_frame_equal(df3, df2, check_names=False)
 
+    def test_parse_sheet_list(self):
+        _skip_if_no_xlrd()
+
+        pth = os.path.join(self.dirpath, 'test.xls')
+        xls = ExcelFile(pth)
+        result = xls.parse(['Sheet1', 1], index_col=0, parse_dates=True)
+        self.assertEqual(sorted(result.keys(), key=str), [1, 'Sheet1'])
+        tm.assert_frame_equal(result['Sheet1'],
+                              xls.parse('Sheet1', index_col=0,
+                                        parse_dates=True))
+        tm.assert_frame_equal(result[1],
+                              xls.parse(1, index_col=0, parse_dates=True))
+
+    def test_xldates_to_datetime(self):
+        _skip_if_no_xlrd()
+        from xlrd import xldate_as_tuple
+        from xlrd.xldate import XLDateAmbiguous
+        from pandas.io.excel import _xldates_to_datetime
+
+        serials = np.array([0.25, 61., 61.5, 41000.25, 41000.9999999,
+                            2957003.])
+        for datemode in [0, 1]:
+            result = _xldates_to_datetime(serials, datemode)
+            for serial, value in zip(serials, result):
+                dt = xldate_as_tuple(serial, datemode)
+                if dt[0] == 0:
+                    expected = time(*dt[3:])
+                else:
+                    expected = datetime(*dt)
+                self.assertEqual(value, expected)
+
+        # the 1900 date system is ambiguous up to its nonexistent 1900-02-29
+        serials = np.array([1.5, 59., 61.])
+        self.assertRaises(XLDateAmbiguous, _xldates_to_datetime, serials, 0)
+        result = _xldates_to_datetime(serials, 1)
+        self.assertEqual(list(result),
+                         [datetime(*xldate_as_tuple(serial, 1))
+                          for serial in serials])
+
     def test_parse_cols_list(self):
         _skip_if_no_openpyxl()
         _skip_if_no_xlrd()
@@ -396,6 +435,39 @@ class ExcelWriterBase(SharedItems):
 
             self.assertRaises(xlrd.XLRDError, xl.parse, '0')
 
+    def test_excelwriter_streaming(self):
+        _skip_if_no_xlrd()
+
+        frame = self.mixed_frame
+        with ensure_clean(self.ext) as path:
+            with ExcelWriter(path, streaming=True) as writer:
+                frame.to_excel(writer, 'Data1')
+                self.frame2.to_excel(writer, 'Data2')
+
+            with ExcelFile(path) as reader:
+                tm.assert_frame_equal(reader.parse('Data1'), frame)
+                tm.assert_frame_equal(reader.parse('Data2'), self.frame2)
+
+    def test_excelwriter_streaming_multiindex(self):
+        _skip_if_no_xlrd()
+
+        frame = self.frame
+        arrays = np.arange(len(frame.index) * 2).reshape(2, -1) // 4
+        frame.index = MultiIndex.from_arrays(arrays, names=['first', 'second'])
+
+        with ensure_clean(self.ext) as path:
+            with ExcelWriter(path, streaming=True) as writer:
+                # merged cells are written unmerged when streaming
+                with tm.assert_produces_warning(UserWarning):
+                    frame.to_excel(writer, 'test1', merge_cells=True)
+                with tm.assert_produces_warning(False):
+                    frame.to_excel(writer, 'test2', merge_cells=False)
+                    self.frame2.to_excel(writer, 'test3')
+
+            df = read_excel(path, 'test1', index_col=[0, 1],
+                            parse_dates=False, has_index_names=False)
+            tm.assert_frame_equal(frame, df)
+
     def test_excel_deprecated_options(self):
         with ensure_clean(self.ext) as path:
             with tm.assert_produces_warning(FutureWarning):
@@ -1079,6 +1151,14 @@ class OpenpyxlTests(ExcelWriterBase, tm.TestCase):
                           xlsx_style.alignment.vertical)
 
 
+    def test_streaming_rows_out_of_order(self):
+        with ensure_clean(self.ext) as path:
+            writer = ExcelWriter(path, streaming=True)
+            self.frame.to_excel(writer, 'test1')
+            self.assertRaises(ValueError, self.frame.to_excel, writer,
+                              'test1', startrow=2)
+
+
 class XlwtTests(ExcelWriterBase, tm.TestCase):
     ext = '.xls'
     engine_name = 'xlwt'
@@ -1139,6 +1219,25 @@ class XlsxWriterTests_NoMerge(ExcelWriterBase, tm.TestCase):
     merge_cells = False
 
 
+class ExcelFormatterTests(tm.TestCase):
+    def test_cells_in_row_order(self):
+        from pandas.core.format import ExcelFormatter
+
+        frame = DataFrame(np.random.randn(25, 3), columns=list('ABC'))
+        mi_frame = frame.copy()
+        mi_frame.index = MultiIndex.from_arrays(
+            [np.arange(25) // 5, np.arange(25)], names=['first', 'second'])
+
+        for df in [frame, mi_frame]:
+            for merge_cells in [True, False]:
+                formatter = ExcelFormatter(df, merge_cells=merge_cells)
+                # force several chunks
+                formatter.chunksize = 7
+                rows = [cell.row for cell in formatter.get_formatted_cells()]
+                self.assertEqual(rows, sorted(rows))
+                self.assertEqual(len(set(rows)), rows[-1] - rows[0] + 1)
+
+
 class ExcelWriterEngineTests(tm.TestCase):
     def test_ExcelWriter_dispatch(self):
         with tm.assertRaisesRegexp(ValueError, 'No engine'):
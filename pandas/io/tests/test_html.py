@@ -622,6 +622,23 @@ class TestReadHtmlLxml(tm.TestCase):
         tm.assert_isinstance(dfs, list)
         tm.assert_isinstance(dfs[0], DataFrame)
 
+    def test_cell_fast_path_matches_row_path(self):
+        from pandas.io.html import _LxmlFrameParser
+        html = """<table>
+                    <tr><td>a  b</td><td> 1 </td></tr>
+                    <tr><td>c\nd</td><!-- comment --><td>2</td></tr>
+                    <tr><td>e</td><td><table><tr><td>3</td></tr></table></td></tr>
+                    <tr><td>f\tg</td><td>4</td></tr>
+                  </table>"""
+        parser = _LxmlFrameParser(html, re.compile('.+'), {})
+        table = parser._parse_tables(parser._build_doc(), parser.match,
+                                     parser.attrs)[0]
+        expected = parser._parse_raw_data(parser._parse_tr(table))
+        self.assertEqual(parser._parse_raw_tbody(table), expected)
+        self.assertEqual(expected[0], ['a b', '1'])
+        self.assertEqual(expected[1], ['c d', '2'])
+        self.assertEqual(expected[-1], ['f\tg', '4'])
+
     @slow
     def test_fallback_success(self):
         _skip_if_none_of(('bs4', 'html5lib'))
@@ -692,6 +709,16 @@ def test_lxml_finds_tbody():
     assert get_lxml_elements(filepath, 'tbody')
 
 
+def test_remove_whitespace_all():
+    from pandas.io.html import _remove_whitespace, _remove_whitespace_all
+    strings = [' a  b ', 'c\r\nd', '', ' ', 'e\tf', 'g\x00h  ']
+    assert (_remove_whitespace_all(strings) ==
+            [_remove_whitespace(x) for x in strings])
+    assert (_remove_whitespace_all(strings[:-1]) ==
+            [_remove_whitespace(x) for x in strings[:-1]])
+    assert _remove_whitespace_all([]) == []
+
+
 def test_same_ordering():
     _skip_if_none_of(['bs4', 'lxml', 'html5lib'])
     filename = os.path.join(DATA_PATH, 'valid_markup.html')
@@ -0,0 +1,79 @@
+import nose
+
+import numpy as np
+
+import pandas.util.testing as tm
+from pandas import DataFrame, Series, Index, date_range, read_mmap
+from pandas.util.testing import (assert_frame_equal, assert_series_equal,
+                                 assert_panel_equal, ensure_clean)
+
+
+class TestMemmap(tm.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.frame = DataFrame({'a': np.arange(10.),
+                                'b': np.arange(10),
+                                'c': list('abcdefghij'),
+                                'd': date_range('20130101', periods=10),
+                                'e': np.arange(10) > 4},
+                               index=list('ABCDEFGHIJ'))
+
+    def test_round_trip_frame(self):
+        with ensure_clean('__tmp_to_mmap__') as path:
+            self.frame.to_mmap(path)
+            result = read_mmap(path)
+            assert_frame_equal(result, self.frame)
+
+            # the numeric data is mapped from the file
+            values = result._data.get('a')
+            self.assertFalse(values.flags.owndata)
+            self.assertFalse(values.flags.writeable)
+            self.assertRaises((ValueError, RuntimeError),
+                              result._data.get('b').__setitem__, 0, 5)
+
+    def test_round_trip_other(self):
+        with ensure_clean('__tmp_to_mmap__') as path:
+            s = Series(np.random.randn(5), name='foo')
+            s.to_mmap(path)
+            assert_series_equal(read_mmap(path), s)
+            self.assertEqual(read_mmap(path).name, 'foo')
+
+            p = tm.makePanel()
+            p.to_mmap(path)
+            assert_panel_equal(read_mmap(path), p)
+
+            df = DataFrame(np.random.randn(3, 4), columns=list('aabb'))
+            df['c'] = 'foo'
+            df.to_mmap(path)
+            assert_frame_equal(read_mmap(path), df)
+
+            df = DataFrame(index=Index([], dtype=object))
+            df.to_mmap(path)
+            assert_frame_equal(read_mmap(path), df)
+
+    def test_modes(self):
+        with ensure_clean('__tmp_to_mmap__') as path:
+            self.frame.to_mmap(path)
+
+            df = read_mmap(path, mode='c')
+            df.loc['A', 'a'] = 100.
+            self.assertEqual(read_mmap(path).loc['A', 'a'], 0.)
+
+            df = read_mmap(path, mode='r+')
+            df.loc['A', 'a'] = 100.
+            del df
+            self.assertEqual(read_mmap(path).loc['A', 'a'], 100.)
+
+            self.assertRaises(ValueError, read_mmap, path, mode='w')
+
+    def test_invalid_file(self):
+        with ensure_clean('__tmp_to_mmap__') as path:
+            with open(path, 'wb') as f:
+                f.write(b'not a pandas file')
+            self.assertRaises(ValueError, read_mmap, path)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
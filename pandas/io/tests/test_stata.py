@@ -197,6 +197,29 @@ class TestStata(tm.TestCase):
         tm.assert_frame_equal(parsed_115, expected)
         tm.assert_frame_equal(parsed_117, expected)
 
+    def test_read_chunks(self):
+        for fname in [self.dta1_114, self.dta1_117, self.dta3_113,
+                      self.dta3_117, self.dta4_114, self.dta4_117,
+                      self.dta15_115]:
+            expected = self.read_dta(fname)
+            for chunksize in [1, 3, 100]:
+                chunks = list(read_stata(fname, convert_dates=True,
+                                         chunksize=chunksize))
+                self.assertTrue(all(len(c) <= chunksize for c in chunks))
+                tm.assert_frame_equal(pd.concat(chunks), expected)
+
+    def test_read_columns(self):
+        expected = self.read_dta(self.dta3_114)
+        columns = ['quarter', 'year']
+        parsed = read_stata(self.dta3_114, columns=columns)
+        tm.assert_frame_equal(parsed, expected[columns])
+
+        chunks = read_stata(self.dta3_114, columns=columns, chunksize=5)
+        tm.assert_frame_equal(pd.concat(list(chunks)), expected[columns])
+
+        self.assertRaises(ValueError, read_stata, self.dta3_114,
+                          columns=['not_a_column'])
+
     def test_read_write_dta5(self):
         # skip_if_not_little_endian()
 
@@ -518,6 +541,37 @@ class TestStata(tm.TestCase):
             tm.assert_frame_equal(written_and_read_again.set_index('index'),
                                   expected)
 
+    def test_write_chunked_records(self):
+        from pandas.io.stata import StataWriter
+        original = DataFrame({'int8': np.arange(100, dtype=np.int8),
+                              'int32': np.arange(100, dtype=np.int32),
+                              'float': np.random.randn(100),
+                              'str': ['s%d' % i for i in range(100)],
+                              'date': pd.date_range('2000-01-01',
+                                                    periods=100)})
+        original.loc[5, 'float'] = np.nan
+        original.loc[7, 'date'] = pd.NaT
+        original.loc[9, 'str'] = None
+        original.index.name = 'index'
+        original.index = original.index.astype(np.int32)
+
+        expected = original.copy()
+        expected.loc[9, 'str'] = ''
+        # float is a reserved word
+        expected = expected.rename(columns={'float': '_float'})
+
+        with tm.ensure_clean() as path:
+            with warnings.catch_warnings(record=True) as w:
+                writer = StataWriter(path, original, {'date': 'td'})
+                # force several writes of a handful of records each
+                writer._write_chunksize = 100
+                writer.write_file()
+            tm.assert_equal(len(w), 1)
+            self.assertTrue(issubclass(w[0].category, InvalidColumnName))
+            written_and_read_again = self.read_dta(path)
+            tm.assert_frame_equal(written_and_read_again.set_index('index'),
+                                  expected)
+
 
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
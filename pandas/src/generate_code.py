@@ -824,7 +824,7 @@ def group_add_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         %(dest_type2)s val, count
         ndarray[%(dest_type2)s, ndim=2] sumx, nobs
 
@@ -835,41 +835,43 @@ def group_add_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
 """
 
 group_add_bin_template = """@cython.boundscheck(False)
@@ -1051,9 +1053,10 @@ group_var_template = """@cython.wraparound(False)
 def group_var_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
               ndarray[int64_t] counts,
               ndarray[%(dest_type2)s, ndim=2] values,
-              ndarray[int64_t] labels):
+              ndarray[int64_t] labels,
+              double ddof=1):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         %(dest_type2)s val, ct
         ndarray[%(dest_type2)s, ndim=2] nobs, sumx, sumxx
 
@@ -1065,48 +1068,50 @@ def group_var_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     sumxx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
+    with nogil:
+        if K > 1:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
+                counts[lab] += 1
 
-            for j in range(K):
-                val = values[i, j]
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-                    sumxx[lab, j] += val * val
-    else:
-        for i in range(N):
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-                sumxx[lab, 0] += val * val
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
 
 
-    for i in range(len(counts)):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
-            else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct <= ddof or ct == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * (ct - ddof)))
 """
 
 group_var_bin_template = """@cython.wraparound(False)
@@ -1114,7 +1119,8 @@ group_var_bin_template = """@cython.wraparound(False)
 def group_var_bin_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
                   ndarray[int64_t] counts,
                   ndarray[%(dest_type2)s, ndim=2] values,
-                  ndarray[int64_t] bins):
+                  ndarray[int64_t] bins,
+                  double ddof=1):
 
     cdef:
         Py_ssize_t i, j, N, K, ngroups, b
@@ -1165,15 +1171,130 @@ def group_var_bin_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     for i in range(ngroups):
         for j in range(K):
             ct = nobs[i, j]
-            if ct < 2:
+            if ct <= ddof or ct == 0:
                 out[i, j] = nan
             else:
                 out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+                             (ct * (ct - ddof)))
 """
 
 # add passing bin edges, instead of labels
 
+#----------------------------------------------------------------------
+# group_count, group_quantile
+
+group_count_bin_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_count_bin_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[%(dest_type2)s, ndim=2] values,
+                    ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        %(dest_type2)s val
+        ndarray[%(dest_type2)s, ndim=2] nobs
+
+    nobs = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[b, j] += 1
+
+    for i in range(ngroups):
+        for j in range(K):
+            out[i, j] = nobs[i, j]
+"""
+
+group_quantile_bin_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_quantile_bin_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(dest_type2)s, ndim=2] values,
+                       ndarray[int64_t] bins,
+                       double q=0.5):
+    '''
+    Only aggregates on axis=0; the quantile q of the non-null values of each
+    bin, interpolating linearly between the two nearest values (the median
+    for q=0.5)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, ngroups, b, start, end, nobs, lo
+        %(dest_type2)s val
+        float64_t idx, frac, result, upper
+        ndarray[float64_t] buf
+        float64_t* ptr
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1, got %%s' %% q)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    buf = np.empty(N, dtype=np.float64)
+    ptr = <float64_t*> buf.data
+
+    start = 0
+    for b in range(ngroups):
+        if b < len(bins):
+            end = bins[b]
+        else:
+            end = N
+        counts[b] = end - start
+
+        for j in range(K):
+            nobs = 0
+            for i in range(start, end):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    buf[nobs] = val
+                    nobs += 1
+
+            if nobs == 0:
+                out[b, j] = nan
+                continue
+
+            idx = q * (nobs - 1)
+            lo = <Py_ssize_t> idx
+            frac = idx - lo
+
+            # the values after the kth smallest are all larger than it
+            result = kth_smallest_c(ptr, lo, nobs)
+            if frac > 0:
+                upper = buf[lo + 1]
+                for k in range(lo + 2, nobs):
+                    if buf[k] < upper:
+                        upper = buf[k]
+                result += (upper - result) * frac
+            out[b, j] = result
+
+        start = end
+"""
+
 
 #----------------------------------------------------------------------
 # group_min, group_max
@@ -1251,7 +1372,7 @@ def group_max_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         %(dest_type2)s val, count
         ndarray[%(dest_type2)s, ndim=2] maxx, nobs
 
@@ -1264,43 +1385,45 @@ def group_max_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     maxx.fill(-np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val > maxx[lab, j]:
-                        maxx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val > maxx[lab, 0]:
-                    maxx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = maxx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
 """
 
 group_max_bin_template = """@cython.wraparound(False)
@@ -1376,7 +1499,7 @@ def group_min_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         %(dest_type2)s val, count
         ndarray[%(dest_type2)s, ndim=2] minx, nobs
 
@@ -1389,43 +1512,45 @@ def group_min_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     minx.fill(np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val < minx[lab, j]:
-                        minx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val < minx[lab, 0]:
-                    minx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = minx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
 """
 
 
@@ -1436,7 +1561,7 @@ def group_mean_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
                ndarray[%(dest_type2)s, ndim=2] values,
                ndarray[int64_t] labels):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         %(dest_type2)s val, count
         ndarray[%(dest_type2)s, ndim=2] sumx, nobs
 
@@ -1447,40 +1572,42 @@ def group_mean_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-
-    for i in range(len(counts)):
-        for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j] / count
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
 """
 
 group_mean_bin_template = """
@@ -1613,6 +1740,152 @@ def group_ohlc_%(name)s(ndarray[%(dest_type2)s, ndim=2] out,
             out[b, 3] = vclose
 """
 
+group_stats_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_stats_%(name)s(ndarray[%(dest_type2)s, ndim=3] out,
+                ndarray[int64_t] counts,
+                ndarray[%(dest_type2)s, ndim=2] values,
+                ndarray[int64_t] labels,
+                ndarray[int64_t] stats):
+    '''
+    Compute several statistics of each group in one pass over the values:
+    out[k] receives the statistic coded by stats[k], one of 0 (count of
+    the non-null values), 1 (sum), 2 (sum of squares), 3 (min), 4 (max),
+    5 (first non-null value) and 6 (last non-null value)
+
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, lab, nstats, ncounts
+        Py_ssize_t icount = -1, isum = -1, isumsq = -1, imin = -1
+        Py_ssize_t imax = -1, ifirst = -1, ilast = -1
+        %(dest_type2)s val
+        ndarray[int64_t, ndim=2] nobs
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    nstats = len(stats)
+    for k in range(nstats):
+        if stats[k] == 0:
+            icount = k
+        elif stats[k] == 1:
+            isum = k
+        elif stats[k] == 2:
+            isumsq = k
+        elif stats[k] == 3:
+            imin = k
+        elif stats[k] == 4:
+            imax = k
+        elif stats[k] == 5:
+            ifirst = k
+        elif stats[k] == 6:
+            ilast = k
+        else:
+            raise ValueError('invalid statistic code %%d' %% stats[k])
+
+    (<object> out).fill(0)
+    if imin >= 0:
+        (<object> out)[imin] = np.inf
+    if imax >= 0:
+        (<object> out)[imax] = -np.inf
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+    nobs = np.zeros((ncounts, K), dtype=np.int64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if isum >= 0:
+                        out[isum, lab, j] += val
+                    if isumsq >= 0:
+                        out[isumsq, lab, j] += val * val
+                    if imin >= 0 and val < out[imin, lab, j]:
+                        out[imin, lab, j] = val
+                    if imax >= 0 and val > out[imax, lab, j]:
+                        out[imax, lab, j] = val
+                    if ifirst >= 0 and nobs[lab, j] == 1:
+                        out[ifirst, lab, j] = val
+                    if ilast >= 0:
+                        out[ilast, lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    for k in range(nstats):
+                        out[k, i, j] = nan
+                if icount >= 0:
+                    out[icount, i, j] = nobs[i, j]
+"""
+
+group_cumulative_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_cumulative_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                     ndarray[%(c_type)s, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t ngroups,
+                     int how):
+    '''
+    Compute a cumulative statistic of the non-null values of each group, in
+    the order of the rows: how is one of 0 (sum), 1 (product), 2 (min) and
+    3 (max). Null values get a null result; out is left untouched for the
+    rows outside of any group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        %(c_type)s val
+        ndarray[%(c_type)s, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    if how < 0 or how > 3:
+        raise ValueError('invalid cumulative function code %%d' %% how)
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=%(dtype)s)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    if not seen[lab, j]:
+                        seen[lab, j] = 1
+                        accum[lab, j] = val
+                    elif how == 0:
+                        accum[lab, j] += val
+                    elif how == 1:
+                        accum[lab, j] *= val
+                    elif how == 2:
+                        if val < accum[lab, j]:
+                            accum[lab, j] = val
+                    elif val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = val
+"""
+
 arrmap_template = """@cython.wraparound(False)
 @cython.boundscheck(False)
 def arrmap_%(name)s(ndarray[%(c_type)s] index, object func):
@@ -2271,7 +2544,12 @@ groupbys = [group_last_template,
             group_min_bin_template,
             group_max_template,
             group_max_bin_template,
-            group_ohlc_template]
+            group_count_bin_template,
+            group_quantile_bin_template,
+            group_ohlc_template,
+            group_stats_template]
+
+cumulatives = [group_cumulative_template]
 
 templates_1d = [map_indices_template,
                 pad_template,
@@ -2312,6 +2590,11 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in groupbys:
             print(generate_put_template(template, use_ints = False), file=f)
 
+        for template in cumulatives:
+            print(generate_from_template(template,
+                                         exclude=['object', 'bool', 'int32']),
+                  file=f)
+
         # for template in templates_1d_datetime:
         #     print >> f, generate_from_template_datetime(template)
 
@@ -5506,7 +5506,7 @@ def group_add_float64(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] sumx, nobs
 
@@ -5517,41 +5517,43 @@ def group_add_float64(ndarray[float64_t, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
 @cython.boundscheck(False)
 @cython.wraparound(False)
 def group_add_float32(ndarray[float32_t, ndim=2] out,
@@ -5562,7 +5564,7 @@ def group_add_float32(ndarray[float32_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float32_t val, count
         ndarray[float32_t, ndim=2] sumx, nobs
 
@@ -5573,41 +5575,43 @@ def group_add_float32(ndarray[float32_t, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -5953,9 +5957,10 @@ def group_prod_bin_float32(ndarray[float32_t, ndim=2] out,
 def group_var_float64(ndarray[float64_t, ndim=2] out,
               ndarray[int64_t] counts,
               ndarray[float64_t, ndim=2] values,
-              ndarray[int64_t] labels):
+              ndarray[int64_t] labels,
+              double ddof=1):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, ct
         ndarray[float64_t, ndim=2] nobs, sumx, sumxx
 
@@ -5967,56 +5972,59 @@ def group_var_float64(ndarray[float64_t, ndim=2] out,
     sumxx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
+    with nogil:
+        if K > 1:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
+                counts[lab] += 1
 
-            for j in range(K):
-                val = values[i, j]
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-                    sumxx[lab, j] += val * val
-    else:
-        for i in range(N):
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-                sumxx[lab, 0] += val * val
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
 
 
-    for i in range(len(counts)):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
-            else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct <= ddof or ct == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * (ct - ddof)))
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_var_float32(ndarray[float32_t, ndim=2] out,
               ndarray[int64_t] counts,
               ndarray[float32_t, ndim=2] values,
-              ndarray[int64_t] labels):
+              ndarray[int64_t] labels,
+              double ddof=1):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float32_t val, ct
         ndarray[float32_t, ndim=2] nobs, sumx, sumxx
 
@@ -6028,55 +6036,58 @@ def group_var_float32(ndarray[float32_t, ndim=2] out,
     sumxx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
+    with nogil:
+        if K > 1:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
+                counts[lab] += 1
 
-            for j in range(K):
-                val = values[i, j]
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-                    sumxx[lab, j] += val * val
-    else:
-        for i in range(N):
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
 
-            lab = labels[i]
-            if lab < 0:
-                continue
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
-                sumxx[lab, 0] += val * val
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
 
 
-    for i in range(len(counts)):
-        for j in range(K):
-            ct = nobs[i, j]
-            if ct < 2:
-                out[i, j] = nan
-            else:
-                out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct <= ddof or ct == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * (ct - ddof)))
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_var_bin_float64(ndarray[float64_t, ndim=2] out,
                   ndarray[int64_t] counts,
                   ndarray[float64_t, ndim=2] values,
-                  ndarray[int64_t] bins):
+                  ndarray[int64_t] bins,
+                  double ddof=1):
 
     cdef:
         Py_ssize_t i, j, N, K, ngroups, b
@@ -6127,17 +6138,18 @@ def group_var_bin_float64(ndarray[float64_t, ndim=2] out,
     for i in range(ngroups):
         for j in range(K):
             ct = nobs[i, j]
-            if ct < 2:
+            if ct <= ddof or ct == 0:
                 out[i, j] = nan
             else:
                 out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+                             (ct * (ct - ddof)))
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_var_bin_float32(ndarray[float32_t, ndim=2] out,
                   ndarray[int64_t] counts,
                   ndarray[float32_t, ndim=2] values,
-                  ndarray[int64_t] bins):
+                  ndarray[int64_t] bins,
+                  double ddof=1):
 
     cdef:
         Py_ssize_t i, j, N, K, ngroups, b
@@ -6188,11 +6200,11 @@ def group_var_bin_float32(ndarray[float32_t, ndim=2] out,
     for i in range(ngroups):
         for j in range(K):
             ct = nobs[i, j]
-            if ct < 2:
+            if ct <= ddof or ct == 0:
                 out[i, j] = nan
             else:
                 out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
-                             (ct * ct - ct))
+                             (ct * (ct - ddof)))
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -6201,7 +6213,7 @@ def group_mean_float64(ndarray[float64_t, ndim=2] out,
                ndarray[float64_t, ndim=2] values,
                ndarray[int64_t] labels):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] sumx, nobs
 
@@ -6212,40 +6224,42 @@ def group_mean_float64(ndarray[float64_t, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j] / count
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_mean_float32(ndarray[float32_t, ndim=2] out,
@@ -6253,7 +6267,7 @@ def group_mean_float32(ndarray[float32_t, ndim=2] out,
                ndarray[float32_t, ndim=2] values,
                ndarray[int64_t] labels):
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float32_t val, count
         ndarray[float32_t, ndim=2] sumx, nobs
 
@@ -6264,40 +6278,42 @@ def group_mean_float32(ndarray[float32_t, ndim=2] out,
     sumx = np.zeros_like(out)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
                 # not nan
                 if val == val:
-                    nobs[lab, j] += 1
-                    sumx[lab, j] += val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
-
-            counts[lab] += 1
-            val = values[i, 0]
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                sumx[lab, 0] += val
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            count = nobs[i, j]
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = sumx[i, j] / count
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
 
 
 def group_mean_bin_float64(ndarray[float64_t, ndim=2] out,
@@ -6416,7 +6432,7 @@ def group_min_float64(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] minx, nobs
 
@@ -6429,43 +6445,45 @@ def group_min_float64(ndarray[float64_t, ndim=2] out,
     minx.fill(np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val < minx[lab, j]:
-                        minx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val < minx[lab, 0]:
-                    minx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = minx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_min_float32(ndarray[float32_t, ndim=2] out,
@@ -6476,7 +6494,7 @@ def group_min_float32(ndarray[float32_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float32_t val, count
         ndarray[float32_t, ndim=2] minx, nobs
 
@@ -6489,43 +6507,45 @@ def group_min_float32(ndarray[float32_t, ndim=2] out,
     minx.fill(np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val < minx[lab, j]:
-                        minx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val < minx[lab, 0]:
-                    minx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = minx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -6660,7 +6680,7 @@ def group_max_float64(ndarray[float64_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float64_t val, count
         ndarray[float64_t, ndim=2] maxx, nobs
 
@@ -6673,43 +6693,45 @@ def group_max_float64(ndarray[float64_t, ndim=2] out,
     maxx.fill(-np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val > maxx[lab, j]:
-                        maxx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val > maxx[lab, 0]:
-                    maxx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = maxx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_max_float32(ndarray[float32_t, ndim=2] out,
@@ -6720,7 +6742,7 @@ def group_max_float32(ndarray[float32_t, ndim=2] out,
     Only aggregates on axis=0
     '''
     cdef:
-        Py_ssize_t i, j, N, K, lab
+        Py_ssize_t i, j, N, K, lab, ncounts
         float32_t val, count
         ndarray[float32_t, ndim=2] maxx, nobs
 
@@ -6733,43 +6755,45 @@ def group_max_float32(ndarray[float32_t, ndim=2] out,
     maxx.fill(-np.inf)
 
     N, K = (<object> values).shape
+    ncounts = len(counts)
 
-    if K > 1:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            for j in range(K):
-                val = values[i, j]
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
 
-                # not nan
-                if val == val:
-                    nobs[lab, j] += 1
-                    if val > maxx[lab, j]:
-                        maxx[lab, j] = val
-    else:
-        for i in range(N):
-            lab = labels[i]
-            if lab < 0:
-                continue
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
 
-            counts[lab] += 1
-            val = values[i, 0]
+                counts[lab] += 1
+                val = values[i, 0]
 
-            # not nan
-            if val == val:
-                nobs[lab, 0] += 1
-                if val > maxx[lab, 0]:
-                    maxx[lab, 0] = val
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
 
-    for i in range(len(counts)):
-        for j in range(K):
-            if nobs[i, j] == 0:
-                out[i, j] = nan
-            else:
-                out[i, j] = maxx[i, j]
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -6892,6 +6916,224 @@ def group_max_bin_float32(ndarray[float32_t, ndim=2] out,
             else:
                 out[i, j] = maxx[i, j]
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_count_bin_float64(ndarray[float64_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[float64_t, ndim=2] values,
+                    ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val
+        ndarray[float64_t, ndim=2] nobs
+
+    nobs = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[b, j] += 1
+
+    for i in range(ngroups):
+        for j in range(K):
+            out[i, j] = nobs[i, j]
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_count_bin_float32(ndarray[float32_t, ndim=2] out,
+                    ndarray[int64_t] counts,
+                    ndarray[float32_t, ndim=2] values,
+                    ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float32_t val
+        ndarray[float32_t, ndim=2] nobs
+
+    nobs = np.zeros_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    b = 0
+    for i in range(N):
+        while b < ngroups - 1 and i >= bins[b]:
+            b += 1
+
+        counts[b] += 1
+        for j in range(K):
+            val = values[i, j]
+
+            # not nan
+            if val == val:
+                nobs[b, j] += 1
+
+    for i in range(ngroups):
+        for j in range(K):
+            out[i, j] = nobs[i, j]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_quantile_bin_float64(ndarray[float64_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float64_t, ndim=2] values,
+                       ndarray[int64_t] bins,
+                       double q=0.5):
+    '''
+    Only aggregates on axis=0; the quantile q of the non-null values of each
+    bin, interpolating linearly between the two nearest values (the median
+    for q=0.5)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, ngroups, b, start, end, nobs, lo
+        float64_t val
+        float64_t idx, frac, result, upper
+        ndarray[float64_t] buf
+        float64_t* ptr
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    buf = np.empty(N, dtype=np.float64)
+    ptr = <float64_t*> buf.data
+
+    start = 0
+    for b in range(ngroups):
+        if b < len(bins):
+            end = bins[b]
+        else:
+            end = N
+        counts[b] = end - start
+
+        for j in range(K):
+            nobs = 0
+            for i in range(start, end):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    buf[nobs] = val
+                    nobs += 1
+
+            if nobs == 0:
+                out[b, j] = nan
+                continue
+
+            idx = q * (nobs - 1)
+            lo = <Py_ssize_t> idx
+            frac = idx - lo
+
+            # the values after the kth smallest are all larger than it
+            result = kth_smallest_c(ptr, lo, nobs)
+            if frac > 0:
+                upper = buf[lo + 1]
+                for k in range(lo + 2, nobs):
+                    if buf[k] < upper:
+                        upper = buf[k]
+                result += (upper - result) * frac
+            out[b, j] = result
+
+        start = end
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_quantile_bin_float32(ndarray[float32_t, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[float32_t, ndim=2] values,
+                       ndarray[int64_t] bins,
+                       double q=0.5):
+    '''
+    Only aggregates on axis=0; the quantile q of the non-null values of each
+    bin, interpolating linearly between the two nearest values (the median
+    for q=0.5)
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, ngroups, b, start, end, nobs, lo
+        float32_t val
+        float64_t idx, frac, result, upper
+        ndarray[float64_t] buf
+        float64_t* ptr
+
+    if not 0 <= q <= 1:
+        raise ValueError('quantile must be between 0 and 1, got %s' % q)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    buf = np.empty(N, dtype=np.float64)
+    ptr = <float64_t*> buf.data
+
+    start = 0
+    for b in range(ngroups):
+        if b < len(bins):
+            end = bins[b]
+        else:
+            end = N
+        counts[b] = end - start
+
+        for j in range(K):
+            nobs = 0
+            for i in range(start, end):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    buf[nobs] = val
+                    nobs += 1
+
+            if nobs == 0:
+                out[b, j] = nan
+                continue
+
+            idx = q * (nobs - 1)
+            lo = <Py_ssize_t> idx
+            frac = idx - lo
+
+            # the values after the kth smallest are all larger than it
+            result = kth_smallest_c(ptr, lo, nobs)
+            if frac > 0:
+                upper = buf[lo + 1]
+                for k in range(lo + 2, nobs):
+                    if buf[k] < upper:
+                        upper = buf[k]
+                result += (upper - result) * frac
+            out[b, j] = result
+
+        start = end
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def group_ohlc_float64(ndarray[float64_t, ndim=2] out,
@@ -7039,6 +7281,347 @@ def group_ohlc_float32(ndarray[float32_t, ndim=2] out,
             out[b, 2] = vlow
             out[b, 3] = vclose
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_stats_float64(ndarray[float64_t, ndim=3] out,
+                ndarray[int64_t] counts,
+                ndarray[float64_t, ndim=2] values,
+                ndarray[int64_t] labels,
+                ndarray[int64_t] stats):
+    '''
+    Compute several statistics of each group in one pass over the values:
+    out[k] receives the statistic coded by stats[k], one of 0 (count of
+    the non-null values), 1 (sum), 2 (sum of squares), 3 (min), 4 (max),
+    5 (first non-null value) and 6 (last non-null value)
+
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, lab, nstats, ncounts
+        Py_ssize_t icount = -1, isum = -1, isumsq = -1, imin = -1
+        Py_ssize_t imax = -1, ifirst = -1, ilast = -1
+        float64_t val
+        ndarray[int64_t, ndim=2] nobs
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    nstats = len(stats)
+    for k in range(nstats):
+        if stats[k] == 0:
+            icount = k
+        elif stats[k] == 1:
+            isum = k
+        elif stats[k] == 2:
+            isumsq = k
+        elif stats[k] == 3:
+            imin = k
+        elif stats[k] == 4:
+            imax = k
+        elif stats[k] == 5:
+            ifirst = k
+        elif stats[k] == 6:
+            ilast = k
+        else:
+            raise ValueError('invalid statistic code %d' % stats[k])
+
+    (<object> out).fill(0)
+    if imin >= 0:
+        (<object> out)[imin] = np.inf
+    if imax >= 0:
+        (<object> out)[imax] = -np.inf
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+    nobs = np.zeros((ncounts, K), dtype=np.int64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if isum >= 0:
+                        out[isum, lab, j] += val
+                    if isumsq >= 0:
+                        out[isumsq, lab, j] += val * val
+                    if imin >= 0 and val < out[imin, lab, j]:
+                        out[imin, lab, j] = val
+                    if imax >= 0 and val > out[imax, lab, j]:
+                        out[imax, lab, j] = val
+                    if ifirst >= 0 and nobs[lab, j] == 1:
+                        out[ifirst, lab, j] = val
+                    if ilast >= 0:
+                        out[ilast, lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    for k in range(nstats):
+                        out[k, i, j] = nan
+                if icount >= 0:
+                    out[icount, i, j] = nobs[i, j]
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_stats_float32(ndarray[float32_t, ndim=3] out,
+                ndarray[int64_t] counts,
+                ndarray[float32_t, ndim=2] values,
+                ndarray[int64_t] labels,
+                ndarray[int64_t] stats):
+    '''
+    Compute several statistics of each group in one pass over the values:
+    out[k] receives the statistic coded by stats[k], one of 0 (count of
+    the non-null values), 1 (sum), 2 (sum of squares), 3 (min), 4 (max),
+    5 (first non-null value) and 6 (last non-null value)
+
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, k, N, K, lab, nstats, ncounts
+        Py_ssize_t icount = -1, isum = -1, isumsq = -1, imin = -1
+        Py_ssize_t imax = -1, ifirst = -1, ilast = -1
+        float32_t val
+        ndarray[int64_t, ndim=2] nobs
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    nstats = len(stats)
+    for k in range(nstats):
+        if stats[k] == 0:
+            icount = k
+        elif stats[k] == 1:
+            isum = k
+        elif stats[k] == 2:
+            isumsq = k
+        elif stats[k] == 3:
+            imin = k
+        elif stats[k] == 4:
+            imax = k
+        elif stats[k] == 5:
+            ifirst = k
+        elif stats[k] == 6:
+            ilast = k
+        else:
+            raise ValueError('invalid statistic code %d' % stats[k])
+
+    (<object> out).fill(0)
+    if imin >= 0:
+        (<object> out)[imin] = np.inf
+    if imax >= 0:
+        (<object> out)[imax] = -np.inf
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+    nobs = np.zeros((ncounts, K), dtype=np.int64)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if isum >= 0:
+                        out[isum, lab, j] += val
+                    if isumsq >= 0:
+                        out[isumsq, lab, j] += val * val
+                    if imin >= 0 and val < out[imin, lab, j]:
+                        out[imin, lab, j] = val
+                    if imax >= 0 and val > out[imax, lab, j]:
+                        out[imax, lab, j] = val
+                    if ifirst >= 0 and nobs[lab, j] == 1:
+                        out[ifirst, lab, j] = val
+                    if ilast >= 0:
+                        out[ilast, lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    for k in range(nstats):
+                        out[k, i, j] = nan
+                if icount >= 0:
+                    out[icount, i, j] = nobs[i, j]
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_cumulative_float64(ndarray[float64_t, ndim=2] out,
+                     ndarray[float64_t, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t ngroups,
+                     int how):
+    '''
+    Compute a cumulative statistic of the non-null values of each group, in
+    the order of the rows: how is one of 0 (sum), 1 (product), 2 (min) and
+    3 (max). Null values get a null result; out is left untouched for the
+    rows outside of any group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float64_t val
+        ndarray[float64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    if how < 0 or how > 3:
+        raise ValueError('invalid cumulative function code %d' % how)
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.float64)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    if not seen[lab, j]:
+                        seen[lab, j] = 1
+                        accum[lab, j] = val
+                    elif how == 0:
+                        accum[lab, j] += val
+                    elif how == 1:
+                        accum[lab, j] *= val
+                    elif how == 2:
+                        if val < accum[lab, j]:
+                            accum[lab, j] = val
+                    elif val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = val
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_cumulative_float32(ndarray[float32_t, ndim=2] out,
+                     ndarray[float32_t, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t ngroups,
+                     int how):
+    '''
+    Compute a cumulative statistic of the non-null values of each group, in
+    the order of the rows: how is one of 0 (sum), 1 (product), 2 (min) and
+    3 (max). Null values get a null result; out is left untouched for the
+    rows outside of any group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        float32_t val
+        ndarray[float32_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    if how < 0 or how > 3:
+        raise ValueError('invalid cumulative function code %d' % how)
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.float32)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    if not seen[lab, j]:
+                        seen[lab, j] = 1
+                        accum[lab, j] = val
+                    elif how == 0:
+                        accum[lab, j] += val
+                    elif how == 1:
+                        accum[lab, j] *= val
+                    elif how == 2:
+                        if val < accum[lab, j]:
+                            accum[lab, j] = val
+                    elif val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = val
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def group_cumulative_int64(ndarray[int64_t, ndim=2] out,
+                     ndarray[int64_t, ndim=2] values,
+                     ndarray[int64_t] labels,
+                     Py_ssize_t ngroups,
+                     int how):
+    '''
+    Compute a cumulative statistic of the non-null values of each group, in
+    the order of the rows: how is one of 0 (sum), 1 (product), 2 (min) and
+    3 (max). Null values get a null result; out is left untouched for the
+    rows outside of any group
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab
+        int64_t val
+        ndarray[int64_t, ndim=2] accum
+        ndarray[uint8_t, ndim=2] seen
+
+    if not len(values) == len(labels):
+       raise AssertionError("len(index) != len(labels)")
+
+    if how < 0 or how > 3:
+        raise ValueError('invalid cumulative function code %d' % how)
+
+    N, K = (<object> values).shape
+    accum = np.empty((ngroups, K), dtype=np.int64)
+    seen = np.zeros((ngroups, K), dtype=np.uint8)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    if not seen[lab, j]:
+                        seen[lab, j] = 1
+                        accum[lab, j] = val
+                    elif how == 0:
+                        accum[lab, j] += val
+                    elif how == 1:
+                        accum[lab, j] *= val
+                    elif how == 2:
+                        if val < accum[lab, j]:
+                            accum[lab, j] = val
+                    elif val > accum[lab, j]:
+                        accum[lab, j] = val
+                    out[i, j] = accum[lab, j]
+                else:
+                    out[i, j] = val
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def left_join_indexer_unique_float64(ndarray[float64_t] left,
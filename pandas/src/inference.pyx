@@ -590,7 +590,7 @@ def maybe_convert_objects(ndarray[object] objects, bint try_float=0,
             else:
                 if not seen_bool:
                     if seen_datetime:
-                        if not seen_numeric:
+                        if not seen_numeric and not seen_timedelta:
                             return datetimes
                     elif seen_timedelta:
                         if not seen_numeric:
@@ -618,7 +618,7 @@ def maybe_convert_objects(ndarray[object] objects, bint try_float=0,
             else:
                 if not seen_bool:
                     if seen_datetime:
-                        if not seen_numeric:
+                        if not seen_numeric and not seen_timedelta:
                             return datetimes
                     elif seen_timedelta:
                         if not seen_numeric:
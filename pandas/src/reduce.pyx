@@ -478,46 +478,68 @@ def apply_frame_axis0(object frame, object f, object names,
         Py_ssize_t i, n = len(starts)
         list results
         object piece
-        dict item_cache
+        dict item_cache, index_cache
+        bint mutated = False
 
     if frame.index._has_complex_internals:
         raise InvalidApply('Cannot modify frame index internals')
 
-
     results = []
 
-    # Need to infer if our low-level mucking is going to cause a segfault
+    # Need to infer if our low-level mucking is going to cause a segfault;
+    # the first group is applied to a real slice and its result kept
     if n > 0:
         chunk = frame[starts[0]:ends[0]]
+        object.__setattr__(chunk, 'name', names[0])
         shape_before = chunk.shape
         try:
-            result = f(chunk)
-            if result is chunk:
-                raise InvalidApply('Function unsafe for fast apply')
+            piece = f(chunk)
         except:
             raise InvalidApply('Let this error raise above us')
+        if piece is chunk or chunk.shape != shape_before:
+            raise InvalidApply('Function unsafe for fast apply')
+
+        try:
+            if piece.index is not chunk.index:
+                mutated = True
+        except AttributeError:
+            pass
+        results.append(piece)
 
     slider = BlockSlider(frame)
 
-    mutated = False
     item_cache = slider.dummy._item_cache
     gin = slider.dummy.index._engine # f7u12
+    index_cache = slider.dummy.index._cache
     try:
-        for i in range(n):
+        for i in range(1, n):
             slider.move(starts[i], ends[i])
 
             item_cache.clear() # ugh
             gin.clear_mapping()
 
+            # the cached properties of the index, such as the inferred_freq
+            # of a DatetimeIndex, describe the previous group
+            index_cache.clear()
+            index_cache['_engine'] = gin
+
             object.__setattr__(slider.dummy, 'name', names[i])
             piece = f(slider.dummy)
 
+            # the remaining groups would be read from blocks no longer in
+            # the frame if f modified it
+            if not slider.intact():
+                raise InvalidApply('Function modified the group')
+
             # I'm paying the price for index-sharing, ugh
             try:
                 if piece.index is slider.dummy.index:
                     piece = piece.copy()
                 else:
                     mutated = True
+
+                # copy-on-write copies share the values of the moving blocks
+                piece._data.unshare()
             except AttributeError:
                 pass
             results.append(piece)
@@ -559,6 +581,19 @@ cdef class BlockSlider:
     def __dealloc__(self):
         free(self.base_ptrs)
 
+    cpdef bint intact(self):
+        '''
+        True if the frame still holds the blocks being moved
+        '''
+        cdef list blocks = self.dummy._data.blocks
+
+        if len(blocks) != self.nblocks:
+            return False
+        for i in range(self.nblocks):
+            if blocks[i].values is not self.blocks[i]:
+                return False
+        return True
+
     cpdef move(self, int start, int end):
         cdef:
             ndarray arr
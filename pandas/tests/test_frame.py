@@ -3745,6 +3745,43 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         casted = mn.astype('O')
         _check_cast(casted, 'object')
 
+    def test_astype_dict(self):
+        df = DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5],
+                        'c': ['1', '2', '3'], 'd': [4, 5, 6]},
+                       columns=['a', 'b', 'c', 'd'])
+        result = df.astype({'a': 'float64', 'c': 'int64'})
+        self.assertEqual(list(result.dtypes),
+                         [np.float64, np.float64, np.int64, np.int64])
+        self.assertEqual(len(result._data.blocks), 2)
+        expected = DataFrame({'a': [1., 2., 3.], 'b': [1.5, 2.5, 3.5],
+                              'c': [1, 2, 3], 'd': [4, 5, 6]},
+                             columns=['a', 'b', 'c', 'd'])
+        assert_frame_equal(result, expected)
+
+        # the other columns are copied
+        result['d'] = 0
+        self.assertEqual(df['d'][0], 4)
+
+        # unless copy=False, passing the untouched blocks through
+        result = df.astype({'a': 'float64'}, copy=False)
+        self.assertTrue(result._data.get('c').base is df._data.get('c').base)
+
+        # duplicate columns
+        dup = df.copy()
+        dup.columns = ['a', 'a', 'c', 'd']
+        result = dup.astype({'a': 'int32'})
+        self.assertEqual(list(result.dtypes),
+                         [np.int32, np.int32, np.object_, np.int64])
+
+        self.assertRaises(KeyError, df.astype, {'e': 'float64'})
+        self.assertRaises(TypeError, df.astype, {'b': object, 'a': 'foo'})
+        result = df.astype({'a': 'int64', 'c': 'foo'}, raise_on_error=False)
+        assert_frame_equal(result, df)
+
+        s = Series([1, 2], name='foo')
+        assert_series_equal(s.astype({'foo': 'float64'}), s.astype('float64'))
+        self.assertRaises(KeyError, s.astype, {'bar': 'float64'})
+
     def test_astype_with_exclude_string(self):
         df = self.frame.copy()
         expected = self.frame.astype(int)
@@ -4542,6 +4579,35 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
         dfaa = df[['a', 'a']]
         self.assertEqual(list(dfaa.itertuples()), [(0, 1, 1), (1, 2, 2), (2, 3, 3)])
 
+    def test_iterrecords(self):
+        for chunksize in [1, 7, 1000]:
+            records = list(self.frame.iterrecords(chunksize=chunksize))
+            self.assertEqual(records, list(self.frame.itertuples()))
+
+        df = DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z'],
+                        'c': date_range('20130101', periods=3),
+                        'not valid': [0.5, 1.5, 2.5]},
+                       index=date_range('20140101', periods=3, tz='US/Eastern'))
+        rec = list(df.iterrecords())[1]
+        self.assertEqual(rec._fields, ('Index', 'a', 'b', 'c', 'not valid'))
+        self.assertEqual(rec.Index, df.index[1])
+        self.assertEqual(rec.a, 2)
+        tm.assert_isinstance(rec.a, int)
+        self.assertEqual(rec.b, 'y')
+        self.assertEqual(rec.c, Timestamp('20130102'))
+        self.assertEqual(rec[4], 1.5)
+        self.assertFalse(hasattr(rec, '__dict__'))
+        self.assertEqual(list(rec._asdict()), list(rec._fields))
+
+        rec = next(df.iterrecords(index=False, columns=['b', 'a']))
+        self.assertEqual(rec, ('x', 1))
+        self.assertEqual(repr(rec), "Record(b='x', a=1)")
+
+        dfaa = df[['a', 'a']]
+        self.assertEqual(list(dfaa.iterrecords(index=False)),
+                         [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(list(DataFrame().iterrecords()), [])
+
     def test_len(self):
         self.assertEqual(len(self.frame), len(self.frame.index))
 
@@ -6286,6 +6352,78 @@ class TestDataFrame(tm.TestCase, CheckIndexing,
             name = '%d    %d non-null %s' % (i, n, dtype)
             assert name in res
 
+    def test_info_memory_usage(self):
+        df = DataFrame({'a': np.arange(10.), 'b': ['x'] * 10})
+        buf = StringIO()
+        df.info(buf=buf)
+        self.assertIn('memory usage: ', buf.getvalue())
+        self.assertTrue(buf.getvalue().rstrip().endswith('+'))
+
+        buf = StringIO()
+        df.info(buf=buf, memory_usage=False)
+        self.assertNotIn('memory usage', buf.getvalue())
+
+    def test_memory_usage(self):
+        n = 10
+        df = DataFrame({'a': np.arange(n, dtype='int64'),
+                        'b': np.arange(n, dtype='float32'),
+                        'c': ['foo'] * n,
+                        'd': date_range('20130101', periods=n)},
+                       columns=['a', 'b', 'c', 'd'])
+        result = df.memory_usage()
+        expected = Series([n * 8, n * 8, n * 4, n * np.dtype(object).itemsize,
+                           n * 8], index=['Index', 'a', 'b', 'c', 'd'])
+        assert_series_equal(result, expected)
+
+        result = df.memory_usage(index=False)
+        assert_series_equal(result, expected[1:])
+
+        deep = df.memory_usage(deep=True)
+        self.assertEqual(deep['c'] - result['c'], n * sys.getsizeof('foo'))
+        self.assertEqual(deep['a'], result['a'])
+
+        # a MultiIndex is counted by its levels and labels
+        df.index = MultiIndex.from_arrays([[0] * n, lrange(n)])
+        labels_nbytes = sum(lab.nbytes for lab in df.index.labels)
+        self.assertEqual(df.memory_usage()['Index'],
+                         8 + n * 8 + labels_nbytes)
+
+    def test_compact(self):
+        df = DataFrame({'a': [0, 100, -100], 'b': [0, 200, 255],
+                        'c': [0, 70000, -1], 'd': [0, 2 ** 40, 1],
+                        'e': [0.5, 1.25, np.nan], 'f': [0.1, 0.2, 0.3],
+                        'g': ['x', 'y', 'z'], 'h': [True, False, True],
+                        'i': date_range('20130101', periods=3)},
+                       columns=list('abcdefghi'))
+        result = df.compact()
+        self.assertEqual(list(result.dtypes),
+                         [np.dtype(x) for x in ['int64', 'int64', 'int64',
+                                                'int64', 'float32', 'float64',
+                                                'object', 'bool', 'M8[ns]']])
+        assert_frame_equal(result, df, check_dtype=False)
+
+        # integers are only downcast on request
+        result = df.compact(integers=True)
+        self.assertEqual(list(result.dtypes),
+                         [np.dtype(x) for x in ['int8', 'uint8', 'int32',
+                                                'int64', 'float32', 'float64',
+                                                'object', 'bool', 'M8[ns]']])
+        assert_frame_equal(result, df, check_dtype=False)
+        saved = (df.memory_usage() - result.memory_usage()).sum()
+        self.assertEqual(saved, 7 * 3 + 7 * 3 + 4 * 3 + 4 * 3)
+
+        # a copy is returned
+        result['d'] = 5
+        self.assertEqual(df['d'][0], 0)
+
+        # duplicate columns and empty frames
+        dup = df[['a', 'a', 'f']]
+        result = dup.compact(integers=True)
+        self.assertEqual(list(result.dtypes),
+                         [np.dtype(x) for x in ['int8', 'int8', 'float64']])
+        assert_frame_equal(result, dup, check_dtype=False)
+        assert_frame_equal(df.iloc[:0].compact(), df.iloc[:0])
+
     def test_dtypes(self):
         self.mixed_frame['bool'] = self.mixed_frame['A'] > 0
         result = self.mixed_frame.dtypes
@@ -13619,6 +13757,52 @@ class TestDataFrameEvalPythonPython(TestDataFrameEvalNumExprPython):
         cls.engine = cls.parser = 'python'
 
 
+class TestDataFrameBuilder(tm.TestCase):
+
+    def test_build(self):
+        index = Index(list('abcde'))
+        builder = pd.DataFrameBuilder(index, capacity={'float64': 2})
+        np.cumsum(np.ones(5), out=builder.add_column('x'))
+        builder['s'] = list('vwxyz')
+        builder.add_column('i', dtype='int64')[:] = np.arange(5)
+        builder['y'] = np.arange(5.)
+        builder['d'] = date_range('20130101', periods=5).values
+        self.assertEqual(len(builder), 5)
+        self.assertIn('y', builder)
+
+        # the storage reserved for the floats is used in place
+        storage = builder._storage[np.dtype('float64')]
+        builder['y'][0] = 10.
+
+        df = builder.finalize()
+        expected = DataFrame({'x': np.arange(1., 6.),
+                              's': list('vwxyz'),
+                              'i': np.arange(5),
+                              'y': [10., 1., 2., 3., 4.],
+                              'd': date_range('20130101', periods=5)},
+                             index=index, columns=['x', 's', 'i', 'y', 'd'])
+        assert_frame_equal(df, expected)
+        self.assertEqual(len(df._data.blocks), 4)
+        self.assertTrue(df._data.get('x').base is storage)
+
+        self.assertRaises(ValueError, builder.add_column, 'z')
+
+    def test_build_grows(self):
+        builder = pd.DataFrameBuilder(lrange(3))
+        for i in range(10):
+            builder[i] = [i, i, i]
+        self.assertRaises(ValueError, builder.add_column, 0, [1, 2, 3])
+        self.assertRaises(ValueError, builder.add_column, 'a', [1, 2])
+
+        df = builder.finalize()
+        assert_frame_equal(df, DataFrame(np.repeat(np.arange(10)[None, :],
+                                                   3, axis=0)))
+        self.assertEqual(len(df._data.blocks), 1)
+
+        df = pd.DataFrameBuilder(lrange(3)).finalize()
+        self.assertEqual(df.shape, (3, 0))
+
+
 if __name__ == '__main__':
     nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
                    exit=False)
@@ -1853,6 +1853,43 @@ class TestGroupBy(tm.TestCase):
         expected = df.take([0, 1, 3, 4, 6, 7])
         assert_frame_equal(result, expected)
 
+    def test_apply_frame_slider(self):
+        df = DataFrame({'key': [1, 1, 1, 2, 2, 2, 3, 3, 3],
+                        'value': np.arange(9.)})
+        grouped = df.groupby('key')
+
+        # the function is called once per group
+        names = []
+
+        def f(g):
+            names.append(g.name)
+            return g['value'].sum()
+
+        result = grouped.apply(f)
+        assert_series_equal(result, grouped['value'].sum())
+        self.assertEqual(names, [1, 2, 3])
+
+        # replacing the columns of the group
+        def f(g):
+            g['value'] = g['value'] * 2
+            return g['value'].sum()
+
+        result = grouped.apply(f)
+        assert_series_equal(result, grouped['value'].sum() * 2)
+
+        with pd.option_context('mode.copy_on_write', True):
+            result = grouped.apply(lambda g: g.copy())
+        assert_frame_equal(result, grouped.apply(lambda g: g.copy()))
+        result = grouped.apply(lambda g: g)
+        assert_frame_equal(result, df)
+
+        # the cached properties of the index follow the groups
+        index = pd.to_datetime(['2014-01-01', '2014-01-02', '2014-01-03',
+                                '2014-01-04', '2014-01-06', '2014-01-08'])
+        df = DataFrame({'key': [1, 1, 1, 2, 2, 2]}, index=index)
+        result = df.groupby('key').apply(lambda g: g.index.inferred_freq)
+        self.assertEqual(list(result), ['D', '2D'])
+
     def test_apply_no_name_column_conflict(self):
         df = DataFrame({'name': [1, 1, 1, 1, 1, 1, 2, 2, 2, 2],
                         'name2': [0, 0, 0, 1, 1, 1, 0, 0, 1, 1],
@@ -2439,6 +2476,111 @@ class TestGroupBy(tm.TestCase):
         result = grouped.sum()
         _check_groupby(df, result, ['a', 'b'], 'd')
 
+    def test_groupby_nosort_multi(self):
+        # groups come out in order of appearance
+        df = DataFrame({'a': ['foo', 'bar', 'foo', np.nan, 'bar', 'foo'],
+                        'b': [2, 1, 2, 1, 3, 1],
+                        'd': np.arange(6.)})
+        result = df.groupby(['a', 'b'], sort=False)['d'].sum()
+        expected = Series([2., 1., 4., 5.],
+                          index=MultiIndex.from_tuples([('foo', 2),
+                                                        ('bar', 1),
+                                                        ('bar', 3),
+                                                        ('foo', 1)],
+                                                       names=['a', 'b']))
+        assert_series_equal(result, expected)
+
+        grouped = df.groupby(['a', 'b'], sort=False)
+        assert_frame_equal(grouped.get_group(('foo', 2)), df.iloc[[0, 2]])
+        self.assertEqual(grouped.ngroups, 4)
+
+        # keys whose cartesian product overflows int64
+        B = np.concatenate((np.arange(1000), np.arange(1000),
+                            np.arange(500)))
+        A = np.arange(2500)
+        df = DataFrame({'A': A, 'B': B, 'C': A, 'D': B, 'E': A, 'F': B,
+                        'G': A, 'H': B, 'values': np.random.randn(2500)})
+        keys = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+        left = df.groupby(keys, sort=False).sum()
+        right = df.groupby(keys).sum()
+        assert_frame_equal(left.sortlevel(0), right)
+
+    def test_groupby_quantile_nunique_mode(self):
+        df = DataFrame({'A': ['foo', 'bar', 'foo', 'bar', 'foo', np.nan,
+                              'bar', 'foo'],
+                        'B': [1., 2., np.nan, 4., 1., 6., 2., 3.],
+                        'C': ['x', 'y', 'x', np.nan, 'z', 'z', 'w', 'z']})
+        grouped = df.groupby('A')
+
+        for q in [0, .25, .5, .8, 1]:
+            assert_series_equal(grouped['B'].quantile(q),
+                                grouped['B'].agg(lambda x: x.quantile(q)))
+        assert_frame_equal(grouped.quantile(.3),
+                           DataFrame({'B': [2., 1.]},
+                                     index=Index(['bar', 'foo'], name='A')))
+
+        result = grouped.nunique()
+        expected = DataFrame({'B': [2, 2], 'C': [2, 2]},
+                             index=Index(['bar', 'foo'], name='A'))
+        assert_frame_equal(result, expected)
+        assert_series_equal(grouped['C'].nunique(),
+                            grouped['C'].agg(lambda x: x.nunique()))
+
+        # the smallest of the most frequent values
+        result = grouped.mode()
+        expected = DataFrame({'B': [2., 1.], 'C': ['w', 'x']},
+                             index=Index(['bar', 'foo'], name='A'))
+        assert_frame_equal(result, expected)
+
+        # groups without values
+        s = Series([np.nan, 1., np.nan, 1.])
+        grouped = s.groupby([0, 1, 0, 1])
+        assert_series_equal(grouped.quantile(), Series([np.nan, 1.]))
+        assert_series_equal(grouped.nunique(), Series([0, 1]))
+        assert_series_equal(grouped.mode(), Series([np.nan, 1.]))
+
+    def test_groupby_cache(self):
+        df = DataFrame({'A': ['foo', 'bar', 'foo', 'bar', 'foo'],
+                        'B': [1, 2, 1, 1, 2],
+                        'C': np.arange(5.)})
+
+        with pd.option_context('mode.groupby_cache', True):
+            grouper = df.groupby(['A', 'B']).grouper
+            self.assertIs(df.groupby(['A', 'B']).grouper, grouper)
+            self.assertIsNot(df.groupby(['A', 'B'], sort=False).grouper,
+                             grouper)
+            self.assertIsNot(df.groupby('A').grouper, grouper)
+            assert_frame_equal(df.groupby(['A', 'B']).sum(),
+                               df.groupby(['A', 'B']).agg(np.sum))
+
+            # the grouper is recomputed once the key columns change
+            df['B'][0] = 3
+            result = df.groupby(['A', 'B'])
+            self.assertIsNot(result.grouper, grouper)
+            self.assertEqual(result.ngroups, 5)
+
+            grouper = df.groupby(['A', 'B']).grouper
+            df['C'] = 1.
+            self.assertIsNot(df.groupby(['A', 'B']).grouper, grouper)
+
+            grouper = df.groupby('A').grouper
+            df.index = df.index + 1
+            self.assertIsNot(df.groupby('A').grouper, grouper)
+
+            grouper = df.groupby('A').grouper
+            df.set_value(2, 'C', 5.)
+            self.assertIsNot(df.groupby('A').grouper, grouper)
+
+            # a limited number of groupers is kept
+            from pandas.core.groupby import _GROUPER_CACHE_SIZE
+            for key in ['A', 'B', 'C', ['A', 'B'], ['A', 'C'], ['B', 'C']]:
+                df.groupby(key)
+                df.groupby(key, sort=False)
+            self.assertEqual(len(df._grouper_cache), _GROUPER_CACHE_SIZE)
+
+        grouper = df.groupby('A').grouper
+        self.assertIsNot(df.groupby('A').grouper, grouper)
+
     def test_intercept_builtin_sum(self):
         s = Series([1., 2., np.nan, 3.])
         grouped = s.groupby([0, 1, 2, 2])
@@ -2590,6 +2732,81 @@ class TestGroupBy(tm.TestCase):
 
         self.assert_numpy_array_equal(result.columns, exp_cols)
 
+    def test_agg_multiple_functions_fused(self):
+        s = Series([1., np.nan, 3., 4., np.nan, 6., 7., -1.])
+        ints = Series([1, 2, 3, 4, 5, 6, 7, -1])
+        labels = np.array([0, 0, 1, 1, 2, 2, 3, 3])
+        funcs = ['count', 'sum', 'mean', 'std', 'var', 'min', 'max', 'first',
+                 'last']
+
+        for obj in [s, ints, s.reindex(lrange(9))]:
+            grouped = obj.groupby(np.append(labels, 3)[:len(obj)])
+            result = grouped.agg(funcs)
+            self.assert_numpy_array_equal(result.columns, funcs)
+            for f in funcs:
+                assert_series_equal(result[f], grouped.agg(f))
+
+            result = grouped.agg([('a', np.mean), ('b', np.std), ('c', 'sum'),
+                                  ('d', lambda x: x.max() - x.min())])
+            assert_series_equal(result['a'], grouped.mean())
+            assert_series_equal(result['b'], grouped.std())
+            assert_series_equal(result['c'], grouped.sum())
+            assert_series_equal(result['d'], grouped.max() - grouped.min())
+
+        # one kernel pass gives every statistic
+        grouper = s.groupby(labels).grouper
+        stats = grouper.aggregate_stats(s.values, ['mean', 'count', 'last'])
+        assert_almost_equal(stats['mean'], [1., 3.5, 6., 3.])
+        assert_almost_equal(stats['count'], [1., 2., 1., 2.])
+        assert_almost_equal(stats['last'], [1., 4., 6., -1.])
+
+        # frames aggregate each column in one pass
+        df = DataFrame({'A': labels, 'B': s, 'C': ints})
+        result = df.groupby('A').agg(['sum', 'max'])
+        for col in ['B', 'C']:
+            assert_series_equal(result[col]['sum'], df.groupby('A')[col].sum())
+            assert_series_equal(result[col]['max'], df.groupby('A')[col].max())
+
+    def test_groupby_num_threads(self):
+        n = 40000
+        values = np.random.randn(n)
+        values[::7] = np.nan
+        labels = np.random.randint(0, 50, size=n)
+        labels[labels == 3] = 4
+        s = Series(values)
+        df = DataFrame({'a': values, 'b': np.arange(n), 'c': values * 2,
+                        'key': labels})
+
+        for how in ['sum', 'mean', 'var', 'std', 'min', 'max']:
+            # over row partitions
+            expected = getattr(s.groupby(labels), how)()
+            result = getattr(s.groupby(labels, num_threads=4), how)()
+            assert_series_equal(result, expected)
+
+            # over blocks
+            expected = getattr(df.groupby('key'), how)()
+            result = getattr(df.groupby('key', num_threads=2), how)()
+            assert_frame_equal(result, expected)
+
+            with pd.option_context('mode.groupby_threads', 3):
+                result = getattr(df[['a', 'c', 'key']].groupby('key'), how)()
+            assert_frame_equal(result, expected[['a', 'c']])
+
+        # the pool of threads is reused across aggregations
+        from pandas.core.groupby import _get_thread_pool
+        pool = _get_thread_pool(2)
+        df.groupby('key', num_threads=2).sum()
+        self.assertIs(_get_thread_pool(2), pool)
+
+        # the threads are kept on the groupby, not on a shared grouper
+        with pd.option_context('mode.groupby_cache', True):
+            grouped = df.groupby('key', num_threads=2)
+            other = df.groupby('key')
+            self.assertIs(other.grouper, grouped.grouper)
+            self.assertIsNone(other.num_threads)
+        self.assertEqual(grouped['a'].num_threads, 2)
+        self.assertEqual(grouped[['a', 'b']].num_threads, 2)
+
     def test_multiple_functions_tuples_and_non_tuples(self):
         # #1359
 
@@ -3156,6 +3373,64 @@ class TestGroupBy(tm.TestCase):
         assert_series_equal(expected, g.cumcount())
         assert_series_equal(expected, sg.cumcount())
 
+    def test_cython_transforms(self):
+        df = DataFrame({'A': ['foo', 'bar', 'foo', 'bar', np.nan, 'foo',
+                              'bar', 'foo'],
+                        'B': [1., np.nan, 3., 2., 5., np.nan, 2., 0.5],
+                        'C': [4, 2, 3, 1, 5, 5, 6, 0]},
+                       index=list('abcdefgh'))
+        grouped = df.groupby('A')[['B', 'C']]
+        per_group = df[['B', 'C']].groupby(df['A'])
+
+        def expected(f):
+            # the rows outside of any group are null
+            result = per_group.apply(f)
+            return result.reindex(df.index)
+
+        for name in ['cumsum', 'cumprod', 'cummin', 'cummax', 'ffill',
+                     'bfill']:
+            assert_frame_equal(getattr(grouped, name)(),
+                               expected(lambda x: getattr(x, name)()))
+            assert_series_equal(getattr(df.groupby('A')['B'], name)(),
+                                expected(lambda x: getattr(x, name)())['B'])
+
+        for periods in [1, 2, -1]:
+            assert_frame_equal(grouped.shift(periods),
+                               expected(lambda x: x.shift(periods)))
+            assert_frame_equal(grouped.diff(periods),
+                               expected(lambda x: x.diff(periods)))
+
+        assert_frame_equal(grouped.fillna(method='pad'),
+                           expected(lambda x: x.fillna(method='pad')))
+
+        for method in ['average', 'min', 'max', 'first', 'dense']:
+            for ascending in [True, False]:
+                f = lambda x: x.rank(method=method, ascending=ascending)
+                assert_frame_equal(grouped.rank(method=method,
+                                                ascending=ascending),
+                                   expected(f))
+        assert_frame_equal(grouped.rank(pct=True),
+                           expected(lambda x: x.rank(pct=True)))
+
+        # the integer column keeps its dtype without rows outside of groups
+        result = df.dropna(subset=['A']).groupby('A')['C'].cumsum()
+        self.assertEqual(result.dtype, np.int64)
+        assert_series_equal(result, Series([4, 2, 7, 3, 12, 9, 12],
+                                           index=list('abcdfgh'), name='C'))
+
+        # transforms without a kernel are applied to each group
+        assert_frame_equal(grouped.cumsum(skipna=False),
+                           expected(lambda x: x.cumsum(skipna=False)))
+
+        # aggregations are broadcast back to the rows, the rows outside of
+        # any group keep their values
+        result = df.groupby('A')['C'].transform('mean')
+        assert_series_equal(result, Series([3, 3, 3, 3, 5, 3, 3, 3],
+                                           index=df.index, name='C'))
+        result = df.groupby('A')['B'].transform(np.sum)
+        assert_series_equal(result, Series([4.5, 4., 4.5, 4., 5., 4.5, 4.,
+                                            4.5], index=df.index, name='B'))
+
 
     def test_filter_series(self):
         import pandas as pd
@@ -3356,6 +3631,39 @@ class TestGroupBy(tm.TestCase):
         expected = s[[]]
         assert_series_equal(actual, expected)
 
+    def test_filter_group_mask(self):
+        df = DataFrame({'A': np.arange(8), 'B': list('aabbbbcc'),
+                        'C': [1, -1, 2, 3, np.nan, 1, -5, 2]})
+        grouped = df.groupby('B')
+
+        assert_frame_equal(grouped.filter(grouped.size() > 2),
+                           grouped.filter(lambda x: len(x) > 2))
+        assert_frame_equal(grouped.filter(grouped['C'].sum() > 0),
+                           df.iloc[2:6])
+        assert_frame_equal(grouped.filter(grouped['C'].sum() > 0,
+                                          dropna=False),
+                           grouped.filter(lambda x: x['C'].sum() > 0,
+                                          dropna=False))
+        assert_frame_equal(grouped.filter(np.array([True, False, True])),
+                           df.iloc[[0, 1, 6, 7]])
+
+        # the groups missing from the mask, or null in it, are excluded
+        mask = Series([True, np.nan], index=['c', 'a'], dtype=object)
+        assert_frame_equal(grouped.filter(mask), df.iloc[[6, 7]])
+
+        s = df['C']
+        grouped = s.groupby(df['B'])
+        assert_series_equal(grouped.filter(grouped.mean() > 0),
+                            grouped.filter(lambda x: x.mean() > 0))
+
+        # the rows outside of any group are excluded
+        grouped = s.groupby(['a', 'a', np.nan, 'b', 'b', 'b', np.nan, 'a'])
+        assert_series_equal(grouped.filter(grouped.count() > 0),
+                            s.iloc[[0, 1, 3, 4, 5, 7]])
+
+        self.assertRaises(ValueError, grouped.filter, [True])
+        self.assertRaises(TypeError, grouped.filter, grouped.sum())
+
     def test_filter_maintains_ordering(self):
         # Simple case: index is sequential. #4621
         df = DataFrame({'pid' : [1,1,1,2,2,3,3,3],
@@ -3696,7 +4004,6 @@ class TestGroupBy(tm.TestCase):
                    'idxmin', 'idxmax',
                    'ffill', 'bfill',
                    'pct_change',
-                   'tshift',
                    #'ohlc'
                    ]
 
@@ -3707,6 +4014,11 @@ class TestGroupBy(tm.TestCase):
 
         # methods which aren't just .foo()
         assert_frame_equal(g.fillna(0), g_exp.fillna(0))
+        assert_frame_equal(g.tshift(freq='D'), g_exp.tshift(freq='D'))
+
+        # the groups are irregular, so no freq can be inferred for them
+        self.assertRaises(ValueError, g.tshift)
+        self.assertRaises(ValueError, g_exp.tshift)
         assert_frame_equal(g.dtypes, g_exp.dtypes)
         assert_frame_equal(g.apply(lambda x: x.sum()),
                            g_exp.apply(lambda x: x.sum()))
@@ -3891,7 +4203,7 @@ class TestGroupBy(tm.TestCase):
             'resample', 'cummin', 'fillna', 'cumsum', 'cumcount',
             'all', 'shift', 'skew', 'bfill', 'irow', 'ffill',
             'take', 'tshift', 'pct_change', 'any', 'mad', 'corr', 'corrwith',
-            'cov', 'dtypes', 'diff', 'idxmax', 'idxmin'
+            'cov', 'dtypes', 'diff', 'idxmax', 'idxmin', 'nunique', 'mode'
         ])
         self.assertEqual(results, expected)
 
@@ -3,14 +3,15 @@
 import nose
 import numpy as np
 
-from pandas import Index, MultiIndex, DataFrame, Series
+from pandas import (Index, MultiIndex, DataFrame, Series, Timestamp,
+                    date_range)
 from pandas.sparse.array import SparseArray
 from pandas.core.internals import *
 import pandas.core.internals as internals
 import pandas.util.testing as tm
 
 from pandas.util.testing import (
-    assert_almost_equal, assert_frame_equal, randn)
+    assert_almost_equal, assert_frame_equal, assert_series_equal, randn)
 from pandas.compat import zip, u
 
 
@@ -283,6 +284,60 @@ class TestBlockManager(tm.TestCase):
         for e, r in zip(expected, result):
             np.dtype(e).kind == np.dtype(r).kind
 
+    def test_placement(self):
+        blknos, blklocs = self.mgr._get_placement()
+        assert_almost_equal(blknos, [0, 1, 0, 1, 0, 2, 3, 4])
+        assert_almost_equal(blklocs, [0, 0, 1, 1, 2, 0, 0, 0])
+        for i, item in enumerate(self.mgr.items):
+            assert_almost_equal(self.mgr.iget(i), self.mgr.get(item))
+
+        # inserting keeps the placement current
+        self.mgr.insert(2, 'baz', np.zeros((1, N)))
+        placement = self.mgr._get_placement(build=False)
+        self.assertIsNotNone(placement)
+        assert_almost_equal(placement[0], [0, 1, 5, 0, 1, 0, 2, 3, 4])
+        assert_almost_equal(placement[1], [0, 0, 0, 1, 1, 2, 0, 0, 0])
+        self._assert_placement_rebuilds(self.mgr)
+
+        # as does deleting, which splits the float block
+        self.mgr.delete('a')
+        placement = self.mgr._get_placement(build=False)
+        self.assertIsNotNone(placement)
+        assert_almost_equal(placement[0], [0, 4, 5, 0, 5, 1, 2, 3])
+        assert_almost_equal(placement[1], [0, 0, 0, 1, 1, 0, 0, 0])
+        self._assert_placement_rebuilds(self.mgr)
+
+        # and setting an item to a new dtype
+        self.mgr.set('c', np.array(['foo'] * N, dtype=object))
+        self.assertIsNotNone(self.mgr._get_placement(build=False))
+        self._assert_placement_rebuilds(self.mgr)
+        self.assertEqual(self.mgr.iget(2).dtype, np.object_)
+
+        for i, item in enumerate(self.mgr.items):
+            assert_almost_equal(self.mgr.iget(i), self.mgr.get(item))
+
+    def _assert_placement_rebuilds(self, mgr):
+        blknos, blklocs = mgr._get_placement()
+        mgr._reset_placement()
+        rebuilt = mgr._get_placement()
+        assert_almost_equal(blknos, rebuilt[0])
+        assert_almost_equal(blklocs, rebuilt[1])
+
+    def test_placement_non_unique(self):
+        items = Index(['a', 'a', 'b'])
+        blocks = [get_bool_ex(['a']), get_float_ex(['a', 'b'])]
+        for b in blocks:
+            b.ref_items = items
+        blocks[0].set_ref_locs([1])
+        blocks[1].set_ref_locs([0, 2])
+        mgr = BlockManager(blocks, [items, np.arange(N)])
+
+        blknos, blklocs = mgr._get_placement()
+        assert_almost_equal(blknos, [1, 0, 1])
+        assert_almost_equal(blklocs, [0, 0, 1])
+        self.assertEqual(mgr.iget(1).dtype, np.bool_)
+        self.assertEqual(mgr.iget(2).dtype, np.float_)
+
     def test_duplicate_item_failure(self):
         items = Index(['a', 'a'])
         blocks = [get_bool_ex(['a']), get_float_ex(['a'])]
@@ -357,6 +412,39 @@ class TestBlockManager(tm.TestCase):
         mgr2.set('quux', randn(N))
         self.assertEqual(mgr2.get('quux').dtype, np.float_)
 
+    def test_copy_on_write(self):
+        from pandas.core.config import option_context
+        df = DataFrame({'a': np.arange(5.), 'b': list('abcde')})
+        with option_context('mode.copy_on_write', True):
+            copied = df.copy()
+            renamed = df.rename(columns={'a': 'c'})
+            selected = df[['a']]
+
+        # the blocks share their values until modified
+        self.assertTrue(copied._data.get('a').base is
+                        df._data.get('a').base)
+        self.assertTrue(renamed._data.get('c').base is
+                        df._data.get('a').base)
+        self.assertTrue(selected._data.get('a').base is
+                        df._data.get('a').base)
+
+        copied.iloc[0, 0] = 10.
+        copied.loc[1, 'b'] = 'z'
+        copied.set_value(2, 'a', 20.)
+        self.assertEqual(list(copied['a']), [10., 1., 20., 3., 4.])
+        self.assertEqual(list(copied['b']), list('azcde'))
+        assert_frame_equal(df, DataFrame({'a': np.arange(5.),
+                                          'b': list('abcde')}))
+
+        df['a'] = -1.
+        self.assertEqual(list(renamed['c']), list(np.arange(5.)))
+        self.assertEqual(list(selected['a']), list(np.arange(5.)))
+
+        # without the option the data is copied right away
+        copied = df.copy()
+        self.assertFalse(copied._data.get('a').base is
+                         df._data.get('a').base)
+
     def test_copy(self):
         shallow = self.mgr.copy(deep=False)
 
@@ -486,6 +574,19 @@ class TestBlockManager(tm.TestCase):
         _check(new_mgr,BoolBlock,['bool'])
         _check(new_mgr,DatetimeBlock,['dt'])
 
+        # the object block converts to one block per dtype
+        mat = np.empty((N, 4), dtype=object)
+        mat[:, 0] = 1
+        mat[:, 1] = 'foo'
+        mat[:, 2] = 2
+        mat[:, 3] = np.timedelta64(1, 's')
+        b = make_block(mat.T, ['a', 'b', 'c', 'd'], ['a', 'b', 'c', 'd'])
+        blocks = b.convert()
+        self.assertEqual([blk.dtype for blk in blocks],
+                         [np.int64, np.object_, np.dtype('m8[ns]')])
+        self.assertEqual([list(blk.items) for blk in blocks],
+                         [['a', 'c'], ['b'], ['d']])
+
     def test_interleave(self):
         pass
 
@@ -500,9 +601,103 @@ class TestBlockManager(tm.TestCase):
         df_unique.columns = ['x', 'y']
         np.testing.assert_array_equal(df_unique.values, df.values)
 
+    def test_fast_xs(self):
+        def _check(mgr):
+            values = mgr.as_matrix().T
+            for loc in range(len(mgr.axes[1])):
+                result, copy = mgr.fast_xs(loc)
+                self.assertTrue(copy)
+                self.assertEqual(result.dtype, values.dtype)
+                assert_almost_equal(result, values[loc])
+
+        _check(self.mgr)
+        _check(create_blockmanager([get_float_ex(), get_int_ex(['b'])]))
+
+        # the cached block indexers follow the placement
+        indexers = self.mgr._get_block_indexers()
+        self.assertIs(indexers, self.mgr._get_block_indexers())
+        self.mgr.insert(0, 'baz', np.zeros((1, N)))
+        self.assertIsNot(indexers, self.mgr._get_block_indexers())
+        _check(self.mgr)
+
+        # non-unique items
+        items = Index(['a', 'a', 'b'])
+        blocks = [get_int_ex(['a']), get_float_ex(['a', 'b'])]
+        for b in blocks:
+            b.ref_items = items
+        blocks[0].set_ref_locs([1])
+        blocks[1].set_ref_locs([0, 2])
+        _check(BlockManager(blocks, [items, np.arange(N)]))
+
+        # datetimes are boxed when mixed with other dtypes
+        df = DataFrame({'a': date_range('20130101', periods=3),
+                        'b': [1.5, 2.5, 3.5], 'c': list('abc')})
+        result, _ = df._data.fast_xs(1)
+        self.assertEqual(result[0], Timestamp('20130102'))
+        self.assertEqual(list(result[1:]), [2.5, 'b'])
+        assert_series_equal(df.iloc[1], df.T[1])
+
+        # no blocks or no items
+        df = DataFrame(index=['a', 'b', 'c'])
+        result, _ = df._data.fast_xs(0)
+        self.assertEqual(len(result), 0)
+        df = DataFrame({'a': [1, 2], 'b': [1.5, 2.5]}).ix[:, :0]
+        result, _ = df._data.fast_xs(1)
+        self.assertEqual(len(result), 0)
+
     def test_consolidate(self):
         pass
 
+    def test_consolidation_policy(self):
+        from pandas.core.config import option_context
+        mgr = create_blockmanager(
+            [get_float_ex(['f%d' % i for i in range(100)])])
+        internals.consolidation_stats(reset=True)
+        with option_context('mode.consolidation_threshold', 10,
+                            'mode.consolidation_growth', 0.5):
+            for i in range(100):
+                mgr.insert(len(mgr.items), 'g%d' % i, np.ones((1, N)))
+
+                # consolidated once the 50 new items reach half of the 100
+                self.assertEqual(len(mgr.blocks),
+                                 i + 2 if i < 49 else i - 48)
+
+        stats = internals.consolidation_stats(reset=True)
+        self.assertEqual(stats['consolidations'], 1)
+        self.assertEqual(stats['blocks_merged'], 51)
+        self.assertEqual(stats['bytes_copied'], 150 * N * 8)
+        self.assertEqual(internals.consolidation_stats()['consolidations'], 0)
+
+        self.assertEqual(len(mgr.blocks), 51)
+        mgr._consolidate_inplace()
+        self.assertTrue(mgr.blocks[0].items.equals(mgr.items))
+        assert_almost_equal(mgr.as_matrix()[:, 0],
+                            list(range(100)) + [1.] * 100)
+
+    def test_track_allocations(self):
+        df = DataFrame({'a': np.arange(10.), 'b': np.arange(10.)})
+        mixed = DataFrame({'a': np.arange(10.), 'b': np.arange(10)})
+        with internals.track_allocations() as tracker:
+            df.copy()
+            df.copy()
+            df.fillna(0)
+            mixed.values
+
+        records = tracker.records
+        self.assertEqual(records, [('copy', 160), ('copy', 160),
+                                   ('fillna', 160), ('interleave', 160)])
+        self.assertEqual(tracker.total, 640)
+
+        summary = tracker.summary()
+        self.assertEqual(summary.loc['copy', 'calls'], 2)
+        self.assertEqual(summary.loc['copy', 'bytes'], 320)
+        self.assertIsNone(internals._allocation_tracker)
+
+        # the values shared with the blocks operated on are not counted
+        with internals.track_allocations() as tracker:
+            df._data.copy(deep=False)
+        self.assertEqual(tracker.records, [('copy', 0)])
+
     def test_consolidate_ordering_issues(self):
         self.mgr.set('f', randn(N))
         self.mgr.set('d', randn(N))
@@ -4808,6 +4808,12 @@ class TestSeries(tm.TestCase, CheckNameIntegration):
             convert_dates='coerce', convert_numeric=True)
         assert_series_equal(result, expected)
 
+        # mixed datetimes and timedeltas stay object
+        s = Series([datetime(2000, 1, 1), timedelta(1), datetime(2000, 1, 3)],
+                   dtype=object)
+        result = s.convert_objects(convert_timedeltas=True)
+        assert_series_equal(result, s)
+
         # preserver all-nans (if convert_dates='coerce')
         s = Series(['foo', 'bar', 1, 1.0], dtype='O')
         result = s.convert_objects(
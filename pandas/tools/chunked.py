@@ -0,0 +1,299 @@
+"""
+Groupby aggregation of data read in chunks
+"""
+
+from pandas.core.api import DataFrame
+from pandas.core.groupby import BaseGrouper
+from pandas.core.index import MultiIndex
+from pandas.tools.merge import concat
+from pandas.compat import lrange
+import pandas.core.common as com
+from pandas import compat
+
+import numpy as np
+
+
+# the statistics kept for each aggregation, as in BaseGrouper.aggregate_stats
+# but for m2, the sum of the squared deviations from the mean of each group
+_aggregation_stats = {
+    'count': ['count'],
+    'sum': ['add'],
+    'mean': ['count', 'add'],
+    'var': ['count', 'mean', 'm2'],
+    'std': ['count', 'mean', 'm2'],
+    'min': ['min'],
+    'max': ['max'],
+    'first': ['first'],
+    'last': ['last'],
+}
+
+# how the statistics of the groups of two chunks are combined; the mean and
+# m2 are combined together, see _combine_moments
+_combine_functions = {
+    'count': 'sum',
+    'add': 'sum',
+    'min': 'min',
+    'max': 'max',
+    'first': 'first',
+    'last': 'last',
+}
+
+
+def aggregate_chunks(chunks, by, func, sort=True):
+    """
+    Aggregate the groups of a DataFrame read in chunks, such as the chunks of
+    read_csv(..., chunksize=n) or HDFStore.select(..., iterator=True), in
+    memory proportional to the number of groups rather than to the rows
+
+    Each chunk is reduced to the count, sum, mean, sum of squared deviations
+    from the mean, min, max, first and last value of its groups, as needed by
+    the aggregations, which are merged into the statistics of the previous
+    chunks.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+    by : column label or list of column labels
+        The columns to group by
+    func : string, list of strings or dict of column -> string or list
+        Aggregations among 'count', 'sum', 'mean', 'var', 'std', 'min',
+        'max', 'first' and 'last'; a string or list applies to all the
+        columns other than the group keys
+    sort : boolean, default True
+        Sort the group keys
+
+    Returns
+    -------
+    aggregated : DataFrame
+        The same as concat(chunks).groupby(by).agg(func)
+
+    Examples
+    --------
+    >>> reader = read_csv('data.csv', chunksize=100000)
+    >>> aggregate_chunks(reader, ['year', 'month'], {'price': ['mean', 'std']})
+    """
+    keys = by if isinstance(by, list) else [by]
+
+    state = None
+    for chunk in chunks:
+        if state is None:
+            funcs, columns = _normalize_funcs(func, chunk, keys)
+            needed = _needed_stats(funcs)
+            dtypes = dict((col, chunk[col].dtype) for col in needed)
+            state = _chunk_stats(chunk, keys, needed)
+        else:
+            state = _combine_stats(state, _chunk_stats(chunk, keys, needed))
+
+    if state is None:
+        raise ValueError('No chunks to aggregate')
+
+    index = state[sorted(state)[0]].index
+    state = dict((stat, frame.reindex(index))
+                 for stat, frame in compat.iteritems(state))
+
+    result = []
+    for col, how in columns:
+        stats = dict((stat, state[stat][col].values)
+                     for stat in _aggregation_stats[how])
+        if how == 'sum':
+            values = stats['add']
+        elif how in ('var', 'std'):
+            values = _derive_variance(stats, how)
+        else:
+            values = BaseGrouper._derive_stats(stats, how)
+
+        dtype = dtypes[col]
+        if how == 'count':
+            values = values.astype(np.int64)
+        elif (how in ('sum', 'min', 'max', 'first', 'last') and
+              com.is_integer_dtype(dtype)):
+            values = com._possibly_downcast_to_dtype(values, dtype)
+        elif (how in ('min', 'max', 'first', 'last') and
+              dtype == np.bool_):
+            values = com._possibly_downcast_to_dtype(values, dtype)
+        result.append(values)
+
+    if any(isinstance(f, list) for f in funcs.values()):
+        result_columns = MultiIndex.from_tuples(columns)
+    else:
+        result_columns = [col for col, _ in columns]
+
+    result = DataFrame(dict(zip(lrange(len(result)), result)), index=index,
+                       columns=lrange(len(result)))
+    result.columns = result_columns
+    if sort:
+        result = result.sort_index()
+    return result
+
+
+def _normalize_funcs(func, chunk, keys):
+    """
+    return the dict of column -> aggregation or list of aggregations, and the
+    list of (column, aggregation) of the result
+    """
+    if isinstance(func, dict):
+        funcs = func
+    else:
+        funcs = dict((col, func) for col in chunk.columns if col not in keys)
+
+    columns = []
+    for col in chunk.columns:
+        if col not in funcs:
+            continue
+        hows = funcs[col] if isinstance(funcs[col], list) else [funcs[col]]
+        for how in hows:
+            if how not in _aggregation_stats:
+                raise ValueError('Unsupported aggregation for chunks: %s'
+                                 % how)
+            columns.append((col, how))
+
+    missing = set(funcs) - set(chunk.columns)
+    if missing:
+        raise KeyError('Columns not found: %s' % sorted(missing))
+
+    return funcs, columns
+
+
+def _needed_stats(funcs):
+    """ dict of column -> statistics of its groups kept across chunks """
+    needed = {}
+    for col, hows in compat.iteritems(funcs):
+        if not isinstance(hows, list):
+            hows = [hows]
+        stats = needed.setdefault(col, [])
+        for how in hows:
+            for stat in _aggregation_stats[how]:
+                if stat not in stats:
+                    stats.append(stat)
+    return needed
+
+
+def _chunk_stats(chunk, keys, needed):
+    """
+    compute the statistics of the groups of one chunk; return a dict of
+    statistic -> DataFrame of the groups by the columns
+    """
+    grouped = chunk.groupby(keys, sort=False)
+    grouper = grouped.grouper
+
+    stats = {}
+    for col, col_stats in compat.iteritems(needed):
+        values = chunk[col].values
+        if com.is_numeric_dtype(values):
+            result = grouper.aggregate_stats(
+                values, [stat for stat in col_stats if stat != 'm2'])
+            if 'm2' in col_stats:
+                result['m2'] = _group_m2(grouper, values)
+        else:
+            # count the non-null values as numbers, the other statistics
+            # through the groupby methods
+            result = {}
+            for stat in col_stats:
+                if stat == 'count':
+                    isnull = com.isnull(values)
+                    result[stat] = grouper.aggregate_stats(
+                        np.where(isnull, np.nan, 0.), ['count'])['count']
+                elif stat in ('min', 'max', 'first', 'last'):
+                    agged = getattr(grouped[col], stat)()
+                    result[stat] = agged.reindex(grouper.result_index).values
+                else:
+                    raise TypeError('Cannot compute %s of a non-numeric '
+                                    'column: %s' % (stat, col))
+
+        for stat, values in compat.iteritems(result):
+            stats.setdefault(stat, {})[col] = values
+
+    index = grouper.result_index
+    return dict((stat, DataFrame(values, index=index))
+                for stat, values in compat.iteritems(stats))
+
+
+def _group_m2(grouper, values):
+    """
+    the sum of the squared deviations of the numeric values from the mean of
+    their group, for each group of the grouper
+    """
+    values = com.ensure_float(values)
+    comp_ids, _, _ = grouper.group_info
+    stats, counts = grouper._compute_stats(values[:, None], comp_ids,
+                                           ['count', 'add'])
+    means = stats['add'][:, 0] / stats['count'][:, 0]
+    deviations = values - com.take_1d(means, comp_ids)
+    stats, _ = grouper._compute_stats((deviations ** 2)[:, None], comp_ids,
+                                      ['add'])
+    m2 = stats['add'][:, 0]
+    if grouper._filter_empty_groups:
+        m2 = m2[counts > 0]
+    return m2
+
+
+def _derive_variance(stats, how):
+    """ the variance or standard deviation from the count and m2 """
+    ct = stats['count']
+    result = stats['m2'] / (ct - 1)
+    result[ct < 2] = np.nan
+    if how == 'std':
+        result = np.sqrt(result)
+    return result
+
+
+def _combine_stats(left, right):
+    """ merge the statistics of the groups of two chunks """
+    result = {}
+    if 'm2' in left:
+        result['mean'], result['m2'] = _combine_moments(left, right)
+
+    for stat, frame in compat.iteritems(left):
+        if stat in result:
+            continue
+        combined = concat([frame, right[stat]])
+        how = _combine_functions[stat]
+
+        columns = {}
+        for col in combined.columns:
+            values = combined[col]
+            if how != 'sum':
+                # the groups without values in a chunk have null statistics
+                values = values.dropna()
+            columns[col] = getattr(_groupby_index(values), how)()
+
+        index = _groupby_index(combined).grouper.result_index
+        result[stat] = DataFrame(columns, index=index,
+                                 columns=combined.columns)
+    return result
+
+
+def _combine_moments(left, right):
+    """
+    merge the means and sums of squared deviations from the mean (m2) of the
+    groups of two chunks, weighting them by the counts of the groups rather
+    than summing squares, which loses precision when the mean is large
+    """
+    columns = left['m2'].columns
+    combined = concat([left['m2'], right['m2']])
+    index = _groupby_index(combined).grouper.result_index
+
+    def _get(stats, stat):
+        # a group missing from a chunk, or without values in it, has a count
+        # of 0 and weighs nothing
+        frame = stats[stat].reindex(index)
+        return frame[columns].fillna(0).values
+
+    na, nb = _get(left, 'count'), _get(right, 'count')
+    mean_a, mean_b = _get(left, 'mean'), _get(right, 'mean')
+    n = na + nb
+    delta = mean_b - mean_a
+    mean = mean_a + delta * nb / n
+    m2 = _get(left, 'm2') + _get(right, 'm2') + delta * delta * na * nb / n
+    mean[n == 0] = np.nan
+    m2[n == 0] = np.nan
+
+    return (DataFrame(mean, index=index, columns=columns),
+            DataFrame(m2, index=index, columns=columns))
+
+
+def _groupby_index(obj):
+    """ group obj by all the levels of its index, in order of appearance """
+    nlevels = obj.index.nlevels
+    level = 0 if nlevels == 1 else lrange(nlevels)
+    return obj.groupby(level=level, sort=False)
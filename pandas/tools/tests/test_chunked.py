@@ -0,0 +1,93 @@
+import nose
+
+import numpy as np
+
+from pandas import DataFrame
+from pandas.tools.chunked import aggregate_chunks
+from pandas.tools.merge import concat
+import pandas.util.testing as tm
+from pandas.util.testing import assert_frame_equal
+
+
+class TestAggregateChunks(tm.TestCase):
+
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.data = DataFrame({'A': ['foo', 'bar', 'foo', 'baz', 'bar',
+                                     'foo', 'baz', 'qux', 'foo', 'bar'],
+                               'B': [1, 2, 1, 2, 1, 2, 1, 2, 1, 2],
+                               'C': np.random.randn(10),
+                               'D': np.arange(10)})
+        self.data.loc[[2, 3, 7], 'C'] = np.nan
+
+    def chunks(self, size=3):
+        return (self.data[i:i + size] for i in range(0, len(self.data), size))
+
+    def test_aggregations(self):
+        for by in ['A', ['A', 'B']]:
+            grouped = self.data.groupby(by)
+            for how in ['count', 'sum', 'mean', 'var', 'std', 'min', 'max',
+                        'first', 'last']:
+                result = aggregate_chunks(self.chunks(), by, how)
+                if how == 'count':
+                    # the counts of the float columns are integers
+                    expected = grouped.agg(lambda x: x.count())
+                    expected = expected.astype(np.int64)
+                else:
+                    expected = getattr(grouped, how)()
+                assert_frame_equal(result, expected)
+
+            result = aggregate_chunks(self.chunks(), by, ['sum', 'std'])
+            assert_frame_equal(result, grouped.agg(['sum', 'std']))
+
+            func = {'C': ['mean', 'max'], 'D': ['last']}
+            result = aggregate_chunks(self.chunks(4), by, func)
+            assert_frame_equal(result, grouped.agg(func))
+
+    def test_integer_and_object_columns(self):
+        result = aggregate_chunks(self.chunks(), 'B', {'A': 'min', 'D': 'max'})
+        expected = self.data.groupby('B').agg({'A': 'min', 'D': 'max'})
+        assert_frame_equal(result, expected[['A', 'D']])
+        self.assertEqual(result['D'].dtype, np.int64)
+
+        result = aggregate_chunks(self.chunks(), 'B', {'A': 'count'})
+        self.assertEqual(list(result['A']), [5, 5])
+
+        self.assertRaises(TypeError, aggregate_chunks, self.chunks(), 'B',
+                          {'A': 'sum'})
+
+    def test_bool_columns(self):
+        self.data['E'] = self.data['D'] % 3 == 0
+        func = {'E': ['min', 'max', 'first', 'last']}
+        result = aggregate_chunks(self.chunks(), 'A', func)
+        assert_frame_equal(result, self.data.groupby('A').agg(func))
+        for col in result.columns:
+            self.assertEqual(result[col].dtype, np.bool_)
+
+    def test_large_mean_variance(self):
+        # the variance of values far from 0 does not lose the precision
+        # that summing their squares would
+        self.data['C'] = 1e9 + np.arange(10.) / 10.
+        result = aggregate_chunks(self.chunks(), 'A', {'C': ['var', 'std']})
+        grouped = self.data.groupby('A')['C']
+        expected = grouped.agg(lambda x: np.var(x.values, ddof=1))
+        tm.assert_almost_equal(result['C', 'var'].values, expected.values)
+        tm.assert_almost_equal(result['C', 'std'].values,
+                               np.sqrt(expected.values))
+
+    def test_sort(self):
+        result = aggregate_chunks(self.chunks(), 'A', 'sum', sort=False)
+        self.assertEqual(list(result.index), ['foo', 'bar', 'baz', 'qux'])
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, aggregate_chunks, self.chunks(), 'A',
+                          'median')
+        self.assertRaises(KeyError, aggregate_chunks, self.chunks(), 'A',
+                          {'E': 'sum'})
+        self.assertRaises(ValueError, aggregate_chunks, [], 'A', 'sum')
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -52,14 +52,16 @@ class TestResample(tm.TestCase):
         g = s.groupby(b)
 
         # check all cython functions work
-        funcs = ['add', 'mean', 'prod', 'ohlc', 'min', 'max', 'var']
+        funcs = ['add', 'mean', 'prod', 'ohlc', 'min', 'max', 'var',
+                 'median', 'count', 'quantile']
         for f in funcs:
             g._cython_agg_general(f)
 
         b = TimeGrouper(Minute(5), closed='right', label='right')
         g = s.groupby(b)
         # check all cython functions work
-        funcs = ['add', 'mean', 'prod', 'ohlc', 'min', 'max', 'var']
+        funcs = ['add', 'mean', 'prod', 'ohlc', 'min', 'max', 'var',
+                 'median', 'count', 'quantile']
         for f in funcs:
             g._cython_agg_general(f)
 
@@ -104,6 +106,54 @@ class TestResample(tm.TestCase):
         expect = s.groupby(grouper).agg(lambda x: x[-1])
         assert_series_equal(result, expect)
 
+    def test_resample_bin_aggregations(self):
+        rng = date_range('1/1/2000', periods=20, freq='min')
+        s = Series(np.random.randn(20), index=rng)
+        s[[2, 3, 16]] = np.nan
+        s = s.drop(rng[10:15])
+
+        labels = date_range('1/1/2000', periods=4, freq='5min')
+        pieces = [s[t:t + Minute(4)] for t in labels]
+
+        # the empty bin included
+        for how in ['median', 'count', 'std', 'var']:
+            result = s.resample('5min', how=how)
+            expected = Series([getattr(p, how)() for p in pieces],
+                              index=labels)
+            assert_series_equal(result, expected)
+        self.assertEqual(s.resample('5min', how='count').dtype, np.int64)
+
+        grouped = s.groupby(TimeGrouper(Minute(5)))
+        for ddof in [0, 2]:
+            expected = Series([p.std(ddof=ddof) for p in pieces], index=labels)
+            assert_series_equal(grouped.std(ddof=ddof), expected)
+        for q in [0, .3, 1]:
+            expected = Series([p.quantile(q) for p in pieces], index=labels)
+            assert_series_equal(grouped.quantile(q), expected)
+
+        df = DataFrame({'A': s, 'B': s * 2})
+        result = df.resample('5min', how='median')
+        expected = DataFrame({'A': [p.median() for p in pieces],
+                              'B': [p.median() * 2 for p in pieces]},
+                             index=labels)
+        assert_frame_equal(result, expected)
+
+        # the count of a frame is a Series indexed by the bins and the
+        # columns, whatever their dtypes
+        dates = Series(rng, index=rng)
+        dates[4:6] = np.nan
+        df['C'] = 'foo'
+        df['D'] = dates
+        df.loc[rng[:3], 'C'] = np.nan
+        result = df.resample('5min', how='count')
+        expected = DataFrame({'A': [p.count() for p in pieces],
+                              'B': [p.count() for p in pieces],
+                              'C': [2, 5, 0, 5], 'D': [4, 4, 0, 5]},
+                             index=labels, columns=['A', 'B', 'C', 'D'])
+        assert_series_equal(result, expected.stack())
+        assert_series_equal(df['C'].resample('5min', how='count'),
+                            expected['C'])
+
     def test_resample_basic_from_daily(self):
         # from daily
         dti = DatetimeIndex(